@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""End-to-end interaction latency benchmark for the viewer.
+
+Drives ``ImageViewer`` headlessly through Textual's pilot with scripted key
+sequences on synthetic volumes of increasing size, and reports
+keypress-to-frame-ready latency percentiles per scenario.
+
+Usage:
+    python benchmark_latency.py                    # compare with the baseline
+    python benchmark_latency.py --save-baseline    # record a new baseline
+    python benchmark_latency.py --sizes 256 512 1024
+
+A keypress is timed from sending the key until the viewer has rendered
+the new frame and handed it to the image widget; the pilot's own settling
+time is not counted. With a stored baseline, the script exits with status
+1 if any scenario's p95 exceeds the baseline p95 by more than the
+tolerance. Baselines are machine-specific; record one on the machine that
+runs the comparison.
+
+The hit rate of each render pipeline stage over a scenario's timed keys
+is printed after the latency table, showing which stages the scenario
+actually reruns.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import SimpleITK as sitk
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+
+from pydcmview.viewer import ImageViewer  # noqa: E402
+
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "benchmark_baseline.json"
+
+# In-plane sizes of the synthetic volumes
+DEFAULT_SIZES = (128, 256, 512)
+
+# Slices per volume; enough for the 200-slice scroll
+DEPTH = 201
+
+# Allowed p95 increase over the baseline before failing
+DEFAULT_TOLERANCE = 0.25
+
+# Terminal size the viewer runs in
+TERMINAL_SIZE = (160, 50)
+
+# Scenario name -> (keys pressed first without timing, timed keys, keys after)
+SCENARIOS = {
+    "scroll": ((), ["down"] * 200, ()),
+    "window_level": (
+        ("W",),
+        ["right"] * 25 + ["left"] * 25 + ["K"] * 10 + ["J"] * 10,
+        ("escape",),
+    ),
+    "zoom": ((), ["right_square_bracket"] * 13 + ["left_square_bracket"] * 13, ()),
+    "crosshair": ((), ["h", "escape"] * 20, ()),
+}
+
+
+def make_volume(size: int, directory: Path) -> Path:
+    """Write a synthetic int16 CT-like volume of ``DEPTH`` x size x size."""
+    rng = np.random.default_rng(size)
+    y, x = np.mgrid[:size, :size]
+    radius = np.hypot(y - size / 2, x - size / 2)
+    body = np.where(radius < size * 0.4, 40, -1000).astype(np.int16)
+    volume = np.empty((DEPTH, size, size), dtype=np.int16)
+    for z in range(DEPTH):
+        volume[z] = body + rng.integers(-20, 20, size=(size, size), dtype=np.int16)
+
+    path = directory / f"synthetic_{size}.nrrd"
+    image = sitk.GetImageFromArray(volume)
+    image.SetSpacing((0.8, 0.8, 2.0))
+    sitk.WriteImage(image, str(path))
+    return path
+
+
+def show_axial(app: ImageViewer):
+    """Show (y, x) planes and scroll along z.
+
+    The viewer's default view shows the two largest axes, which for the
+    smaller volumes (DEPTH > size) is a plane through z, leaving fewer
+    positions than the scroll scenario steps through.
+    """
+    app.display_x, app.display_y = 1, 2
+    app._assign_slice_axes()
+    app.current_slice = 0
+    app.crosshair_x = app.shape[app.display_x] // 2
+    app.crosshair_y = app.shape[app.display_y] // 2
+    app._update_display()
+
+
+async def run_scenario(path: Path, scenario: str) -> tuple:
+    """Press a scenario's keys.
+
+    Returns:
+        (per-key latencies in milliseconds, render stage hit rates)
+    """
+    setup, keys, teardown = SCENARIOS[scenario]
+    app = ImageViewer([path])
+    latencies = []
+
+    # Time at which the latest frame was ready
+    frame_ready = [0.0]
+    update_display = app._update_display
+
+    def timed_update_display(*args, **kwargs):
+        update_display(*args, **kwargs)
+        frame_ready[0] = time.perf_counter()
+
+    app._update_display = timed_update_display
+
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await pilot.pause()
+        show_axial(app)
+        await pilot.pause()
+        for key in setup:
+            await pilot.press(key)
+        await pilot.pause()
+        app.pipeline.reset_stats()
+
+        for key in keys:
+            start = time.perf_counter()
+            await pilot.press(key)
+            await pilot.pause()
+            if frame_ready[0] >= start:
+                latencies.append((frame_ready[0] - start) * 1000.0)
+
+        stages = app.pipeline.summary()
+
+        for key in teardown:
+            await pilot.press(key)
+    return latencies, stages
+
+
+def summarize(latencies: list) -> dict:
+    values = np.asarray(latencies)
+    return {
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "max": float(values.max()),
+        "count": int(values.size),
+    }
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    """Scenarios whose p95 exceeds the baseline p95 by more than ``tolerance``."""
+    return [
+        name
+        for name, stats in results.items()
+        if baseline.get(name, {}).get("p95") is not None
+        and stats["p95"] > baseline[name]["p95"] * (1.0 + tolerance)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless viewer latency benchmark")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+        help="In-plane sizes of the synthetic volumes",
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS),
+        help="Scenarios to run",
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=DEFAULT_BASELINE,
+        help="Baseline JSON file (default: benchmark_baseline.json)",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="Store these results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help="Allowed relative p95 regression (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    stage_hit_rates = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = make_volume(size, Path(tmp))
+            for scenario in args.scenarios:
+                name = f"{scenario}@{size}"
+                latencies, stage_hit_rates[name] = asyncio.run(run_scenario(path, scenario))
+                results[name] = summarize(latencies)
+
+    baseline = {}
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text())
+
+    print(f"{'scenario':<20} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'base p95':>9}")
+    for name, stats in results.items():
+        reference = baseline.get(name, {}).get("p95")
+        column = f"{reference:9.1f}" if reference is not None else f"{'-':>9}"
+        print(f"{name:<20} {stats['p50']:8.1f} {stats['p95']:8.1f} {stats['max']:8.1f} {column}")
+    failures = regressions(results, baseline, args.tolerance)
+
+    print()
+    print(f"{'scenario':<20} stage hit rates")
+    for name, stages in stage_hit_rates.items():
+        print(f"{name:<20} {stages}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    elif not baseline:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+
+    if failures:
+        print(f"p95 regressed beyond {args.tolerance:.0%}: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""On-disk cache location and key helpers."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Union
+
+
+def get_cache_dir() -> Path:
+    """Return the PyDCMView cache directory, creating it if needed.
+
+    Honors ``PYDCMVIEW_CACHE_DIR`` first, then ``XDG_CACHE_HOME``, and falls
+    back to ``~/.cache/pydcmview``.
+    """
+    override = os.environ.get("PYDCMVIEW_CACHE_DIR")
+    if override:
+        cache_dir = Path(override)
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(base) / "pydcmview"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def file_cache_key(file_path: Union[str, Path]) -> str:
+    """Build a cache key that changes whenever the file is rewritten.
+
+    Args:
+        file_path: Path to the source file
+
+    Returns:
+        Hex digest of the resolved path, size and modification time
+    """
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    token = f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(token.encode("utf-8")).hexdigest()
+
+
+def cache_path_for(file_path: Union[str, Path], suffix: str) -> Path:
+    """Return the cache file path for ``file_path`` with the given suffix."""
+    return get_cache_dir() / f"{file_cache_key(file_path)}{suffix}"
@@ -0,0 +1,397 @@
+"""Lazy reader for chunked array stores (Zarr v2 directories, OME-Zarr pyramids)."""
+
+import bz2
+import gzip
+import itertools
+import json
+import lzma
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .lazy_array import LazyArray
+
+try:
+    import numcodecs
+except ImportError:  # pragma: no cover - optional dependency
+    numcodecs = None
+
+
+# Bound on decompressed chunks kept in memory per store
+DEFAULT_CHUNK_CACHE_BYTES = 512 * 1024**2
+
+# Threads reading and decompressing chunks of one store; reads are mostly
+# I/O and zlib releases the GIL, so more threads than cores pay off
+DEFAULT_FETCH_WORKERS = min(16, (os.cpu_count() or 1) + 4)
+
+_ARRAY_MANIFEST = ".zarray"
+_GROUP_ATTRIBUTES = ".zattrs"
+
+# Compressors decoded without numcodecs
+_BUILTIN_CODECS: Dict[str, Callable[[bytes], bytes]] = {
+    "zlib": zlib.decompress,
+    "gzip": gzip.decompress,
+    "bz2": bz2.decompress,
+    "lzma": lzma.decompress,
+}
+
+ChunkIndex = Tuple[int, ...]
+
+
+def is_chunked_store(path: Union[str, Path]) -> bool:
+    """Check whether a directory is a Zarr array or multiscale group."""
+    path = Path(path)
+    return path.is_dir() and (
+        (path / _ARRAY_MANIFEST).is_file() or bool(_multiscale_datasets(path))
+    )
+
+
+def _decoder(config: Optional[dict]) -> Callable[[bytes], bytes]:
+    """Decode function of a compressor or filter given its Zarr configuration."""
+    if config is None:
+        return lambda data: data
+    codec_id = config.get("id")
+    if codec_id in _BUILTIN_CODECS:
+        return _BUILTIN_CODECS[codec_id]
+    if numcodecs is None:
+        raise ValueError(f"Codec '{codec_id}' needs the numcodecs package")
+    codec = numcodecs.get_codec(dict(config))
+    return lambda data: _as_bytes(codec.decode(data))
+
+
+def _as_bytes(data) -> bytes:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return data
+    return np.ascontiguousarray(data).tobytes()
+
+
+def _fill_value(value, dtype: np.dtype):
+    """Zarr fill value, with JSON's spellings of non-finite floats."""
+    if value is None:
+        return 0
+    if isinstance(value, str) and np.issubdtype(dtype, np.floating):
+        return {"NaN": np.nan, "Infinity": np.inf, "-Infinity": -np.inf}.get(value, 0)
+    return value
+
+
+class ChunkFetcher:
+    """Reads chunks of a store's arrays on a thread pool, behind an LRU cache.
+
+    All levels of a multiscale store share one fetcher, so the cache bounds
+    the store's memory as a whole. Concurrent requests for the same chunk
+    wait on the same read.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_FETCH_WORKERS,
+        cache_bytes: int = DEFAULT_CHUNK_CACHE_BYTES,
+    ):
+        self.cache_bytes = cache_bytes
+        self.cached_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pydcmview-chunks")
+        self._cache: "OrderedDict[Tuple[int, ChunkIndex], Optional[np.ndarray]]" = OrderedDict()
+        self._pending: Dict[Tuple[int, ChunkIndex], Future] = {}
+        self._lock = threading.Lock()
+
+    def _read_and_cache(self, array: "ChunkedArray", index: ChunkIndex) -> Optional[np.ndarray]:
+        key = (id(array), index)
+        chunk, done = None, False
+        try:
+            chunk = array.read_chunk(index)
+            done = True
+            return chunk
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+                if done and key not in self._cache:
+                    # Missing chunks are cached too, as None (all fill value)
+                    self._cache[key] = chunk
+                    self.cached_bytes += chunk.nbytes if chunk is not None else 0
+                    while self.cached_bytes > self.cache_bytes and len(self._cache) > 1:
+                        _, evicted = self._cache.popitem(last=False)
+                        self.cached_bytes -= evicted.nbytes if evicted is not None else 0
+
+    def request(
+        self, array: "ChunkedArray", index: ChunkIndex
+    ) -> Union[np.ndarray, None, Future]:
+        """Return a cached chunk (None if absent from the store), or the future reading it."""
+        key = (id(array), index)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            future = self._pending.get(key)
+            if future is None:
+                self.misses += 1
+                future = self._pool.submit(self._read_and_cache, array, index)
+                self._pending[key] = future
+            return future
+
+    def fetch(
+        self, array: "ChunkedArray", indices: Sequence[ChunkIndex]
+    ) -> List[Optional[np.ndarray]]:
+        """Read several chunks in parallel, in the order given."""
+        requests = [self.request(array, index) for index in indices]
+        return [r.result() if isinstance(r, Future) else r for r in requests]
+
+    def clear(self):
+        """Drop all cached chunks."""
+        with self._lock:
+            self._cache.clear()
+            self.cached_bytes = 0
+
+    def close(self):
+        # Drop queued prefetches (shutdown's cancel_futures needs Python 3.9)
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            future.cancel()
+        self._pool.shutdown(wait=True)
+
+
+class ChunkedArray(LazyArray):
+    """One Zarr v2 array, read chunk by chunk on demand.
+
+    Any basic index (integers and slices on any axis) reads and decompresses
+    only the chunks it intersects, so a sagittal or coronal slice costs no
+    more than an axial one of the same size. A slice through the array also
+    fetches the neighbouring layer of chunks in the direction it is likely
+    to move next.
+
+    Multiscale stores are opened as their full-resolution level, with every
+    level (this one first) in ``levels`` and each level's integer
+    downsampling per axis in ``downsampling``.
+    """
+
+    def __init__(self, path: Union[str, Path], fetcher: Optional[ChunkFetcher] = None):
+        self.path = Path(path)
+        manifest = json.loads((self.path / _ARRAY_MANIFEST).read_text())
+        if manifest.get("zarr_format", 2) != 2:
+            raise ValueError(f"Unsupported Zarr format {manifest.get('zarr_format')}")
+
+        self.stored_dtype = np.dtype(manifest["dtype"])
+        if self.stored_dtype.fields is not None:
+            raise ValueError("Structured Zarr dtypes are not supported")
+        super().__init__(manifest["shape"], self.stored_dtype.newbyteorder("="))
+        self.chunks = tuple(int(c) for c in manifest["chunks"])
+        self.order = manifest.get("order", "C")
+        self.separator = manifest.get("dimension_separator", ".")
+        self.fill_value = _fill_value(manifest.get("fill_value"), self.dtype)
+        self._decompress = _decoder(manifest.get("compressor"))
+        self._filters = [_decoder(f) for f in reversed(manifest.get("filters") or [])]
+
+        self.fetcher = fetcher if fetcher is not None else ChunkFetcher()
+        self.levels: List["ChunkedArray"] = [self]
+        self.downsampling: Tuple[int, ...] = (1,) * self.ndim
+        # Physical voxel size and position of the first voxel, numpy axis order
+        self.scale: Optional[Tuple[float, ...]] = None
+        self.translation: Optional[Tuple[float, ...]] = None
+
+    @property
+    def resident_bytes(self) -> int:
+        return super().resident_bytes + self.fetcher.cached_bytes
+
+    def _chunk_path(self, index: ChunkIndex) -> Path:
+        return self.path / self.separator.join(str(i) for i in index)
+
+    def read_chunk(self, index: ChunkIndex) -> Optional[np.ndarray]:
+        """Read and decompress one chunk, or None if the store omits it."""
+        try:
+            raw = self._chunk_path(index).read_bytes()
+        except FileNotFoundError:
+            return None
+        data = self._decompress(raw)
+        for decode in self._filters:
+            data = decode(data)
+        chunk = np.frombuffer(data, dtype=self.stored_dtype)
+        chunk = chunk.reshape(self.chunks, order="F" if self.order == "F" else "C")
+        return chunk.astype(self.dtype, copy=False)
+
+    def _chunk_range(self, axis: int, start: int, stop: int) -> range:
+        return range(start // self.chunks[axis], (stop - 1) // self.chunks[axis] + 1)
+
+    def read_region(self, starts: Sequence[int], stops: Sequence[int]) -> np.ndarray:
+        """Read the box ``[starts, stops)`` from the chunks it intersects."""
+        shape = tuple(stop - start for start, stop in zip(starts, stops))
+        region = np.full(shape, self.fill_value, dtype=self.dtype)
+        if 0 in shape:
+            return region
+
+        indices = list(
+            itertools.product(
+                *(self._chunk_range(axis, start, stop) for axis, (start, stop) in enumerate(zip(starts, stops)))
+            )
+        )
+        for index, chunk in zip(indices, self.fetcher.fetch(self, indices)):
+            if chunk is None:
+                continue
+            source, target = [], []
+            for axis, i in enumerate(index):
+                origin = i * self.chunks[axis]
+                low = max(starts[axis], origin)
+                high = min(stops[axis], origin + self.chunks[axis])
+                source.append(slice(low - origin, high - origin))
+                target.append(slice(low - starts[axis], high - starts[axis]))
+            region[tuple(target)] = chunk[tuple(source)]
+        return region
+
+    def prefetch_region(self, starts: Sequence[int], stops: Sequence[int]):
+        """Read the chunks of a box in the background."""
+        ranges = [
+            self._chunk_range(axis, max(0, start), min(size, stop))
+            for axis, (start, stop, size) in enumerate(zip(starts, stops, self.shape))
+        ]
+        if all(ranges):
+            for index in itertools.product(*ranges):
+                self.fetcher.request(self, index)
+
+    def _read_leading(self, start: int, stop: int) -> np.ndarray:
+        return self.read_region((start,) + (0,) * (self.ndim - 1), (stop,) + self.shape[1:])
+
+    def _basic_index(self, key):
+        """Bounding box, per-axis steps and dropped axes of a basic index, or None."""
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > self.ndim:
+            return None
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        starts, stops, steps, dropped = [], [], [], []
+        for axis, item in enumerate(key):
+            size = self.shape[axis]
+            if isinstance(item, (int, np.integer)):
+                index = int(item) + size if item < 0 else int(item)
+                if not 0 <= index < size:
+                    raise IndexError(f"index {item} out of range for axis {axis}")
+                starts.append(index)
+                stops.append(index + 1)
+                steps.append(1)
+                dropped.append(axis)
+            elif isinstance(item, slice):
+                start, stop, step = item.indices(size)
+                if step < 1:
+                    return None
+                stop = max(start, stop)
+                starts.append(start)
+                stops.append(stop)
+                steps.append(step)
+            else:
+                return None
+        return starts, stops, steps, dropped
+
+    def __getitem__(self, key):
+        if self._full is not None:
+            return self._full[key]
+
+        basic = self._basic_index(key)
+        if basic is None:
+            return self.materialize()[key]
+        starts, stops, steps, dropped = basic
+
+        region = self.read_region(starts, stops)
+        if any(step > 1 for step in steps):
+            region = region[tuple(slice(None, None, step) for step in steps)]
+
+        # Moving through a plane: fetch the next layer of chunks ahead
+        if len(dropped) == 1:
+            axis = dropped[0]
+            chunk = self.chunks[axis]
+            offset = starts[axis] % chunk
+            layer = starts[axis] - offset + (chunk if offset >= chunk // 2 else -chunk)
+            ahead_starts, ahead_stops = list(starts), list(stops)
+            ahead_starts[axis], ahead_stops[axis] = layer, layer + 1
+            self.prefetch_region(ahead_starts, ahead_stops)
+
+        return region.reshape(
+            tuple(n for axis, n in enumerate(region.shape) if axis not in dropped)
+        )
+
+    def preview(self) -> np.ndarray:
+        """Middle leading-axis slice of the coarsest level."""
+        coarsest = self.levels[-1]
+        return coarsest[coarsest.shape[0] // 2]
+
+    def release(self):
+        super().release()
+        self.fetcher.clear()
+
+    def close(self):
+        """Stop fetching chunks."""
+        self.fetcher.close()
+
+
+def _multiscale_datasets(path: Path) -> List[dict]:
+    """Datasets of the first OME-Zarr multiscale image of a group, finest first."""
+    try:
+        attributes = json.loads((path / _GROUP_ATTRIBUTES).read_text())
+        datasets = attributes["multiscales"][0]["datasets"]
+    except (OSError, ValueError, KeyError, IndexError, TypeError):
+        return []
+    return [d for d in datasets if isinstance(d, dict) and "path" in d]
+
+
+def _transform(dataset: dict, kind: str) -> Optional[Tuple[float, ...]]:
+    for transform in dataset.get("coordinateTransformations") or []:
+        if transform.get("type") == kind and kind in transform:
+            return tuple(float(v) for v in transform[kind])
+    return None
+
+
+def open_chunked_store(path: Union[str, Path]) -> Optional[ChunkedArray]:
+    """Open a Zarr v2 array, or the levels of an OME-Zarr multiscale group.
+
+    Returns:
+        The full-resolution level with all levels attached, or None if the
+        directory holds no array this reader handles (the caller should
+        report it as unsupported).
+    """
+    path = Path(path)
+    fetcher = ChunkFetcher()
+    try:
+        if (path / _ARRAY_MANIFEST).is_file():
+            return ChunkedArray(path, fetcher)
+
+        datasets = _multiscale_datasets(path)
+        if not datasets:
+            fetcher.close()
+            return None
+        levels = [ChunkedArray(path / d["path"], fetcher) for d in datasets]
+    except (OSError, ValueError, KeyError, TypeError):
+        fetcher.close()
+        return None
+
+    base = levels[0]
+    if any(level.ndim != base.ndim for level in levels):
+        fetcher.close()
+        return None
+
+    scales = [_transform(d, "scale") for d in datasets]
+    for level, dataset, scale in zip(levels, datasets, scales):
+        level.scale = scale
+        level.translation = _transform(dataset, "translation")
+        if scale is not None and scales[0] is not None:
+            ratios = [s / s0 if s0 else 1.0 for s, s0 in zip(scale, scales[0])]
+        else:
+            ratios = [b / max(1, n) for b, n in zip(base.shape, level.shape)]
+        level.downsampling = tuple(max(1, int(round(r))) for r in ratios)
+    # Skip levels that are not coarser than the previous one along every axis
+    kept = [base]
+    for level in levels[1:]:
+        previous = kept[-1].downsampling
+        if level.downsampling != previous and all(
+            d >= p for d, p in zip(level.downsampling, previous)
+        ):
+            kept.append(level)
+    for level in kept:
+        level.levels = kept
+    return base
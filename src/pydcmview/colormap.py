@@ -1,10 +1,24 @@
 """Colormap utilities for medical image display."""
 
+import json
+import os
+import threading
 import numpy as np
-from typing import Dict, List, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from PIL import Image as PILImage
 
 
+# Gray levels produced by standard 8-bit windowing
+DEFAULT_LEVELS = 256
+
+# Gray levels used for 12/16-bit and floating point data
+HIGH_PRECISION_LEVELS = 4096
+
+# File extensions recognized as user colormap definitions
+USER_COLORMAP_EXTENSIONS = {".json", ".txt", ".csv"}
+
+
 class ColorMap:
     """Individual colormap definition."""
     
@@ -15,52 +29,69 @@ class ColorMap:
             name: Human-readable name of the colormap
             colors: List of (R, G, B) tuples defining the colormap
         """
+        if len(colors) < 2:
+            raise ValueError("Colormap must have at least 2 colors")
         self.name = name
         self.colors = colors
-        self._lut = self._create_lookup_table()
+        self._luts: Dict[int, np.ndarray] = {}
+        self._lock = threading.Lock()
     
-    def _create_lookup_table(self) -> np.ndarray:
-        """Create 256-entry RGB lookup table from color points."""
-        if len(self.colors) < 2:
-            raise ValueError("Colormap must have at least 2 colors")
-        
-        # Create lookup table with 256 entries
-        lut = np.zeros((256, 3), dtype=np.uint8)
+    @property
+    def _lut(self) -> np.ndarray:
+        """Standard 256-entry lookup table."""
+        return self.get_lut(DEFAULT_LEVELS)
+    
+    def get_lut(self, size: int = DEFAULT_LEVELS) -> np.ndarray:
+        """Get the RGB lookup table with ``size`` entries, building it once.
         
-        # Interpolate between color points
-        n_colors = len(self.colors)
-        for i in range(256):
-            # Map intensity to position in colormap
-            pos = (i / 255.0) * (n_colors - 1)
-            idx = int(pos)
-            frac = pos - idx
+        Args:
+            size: Number of table entries (e.g. 256, or 4096 for 12/16-bit data)
             
-            if idx >= n_colors - 1:
-                # Last color
-                lut[i] = self.colors[-1]
-            else:
-                # Interpolate between two colors
-                c1 = np.array(self.colors[idx])
-                c2 = np.array(self.colors[idx + 1])
-                lut[i] = (c1 * (1 - frac) + c2 * frac).astype(np.uint8)
+        Returns:
+            Read-only uint8 array with shape (size, 3)
+        """
+        lut = self._luts.get(size)
+        if lut is None:
+            with self._lock:
+                lut = self._luts.get(size)
+                if lut is None:
+                    lut = self._create_lookup_table(size)
+                    self._luts[size] = lut
+        return lut
+    
+    def _create_lookup_table(self, size: int = DEFAULT_LEVELS) -> np.ndarray:
+        """Create an RGB lookup table by interpolating between color points."""
+        points = np.asarray(self.colors, dtype=np.float64)
+        stops = np.arange(len(points))
+        positions = np.linspace(0, len(points) - 1, size)
         
+        lut = np.empty((size, 3), dtype=np.uint8)
+        for channel in range(3):
+            lut[:, channel] = np.interp(positions, stops, points[:, channel])
+        lut.setflags(write=False)
         return lut
     
-    def apply(self, grayscale_array: np.ndarray) -> np.ndarray:
+    def apply(self, grayscale_array: np.ndarray, levels: int = DEFAULT_LEVELS) -> np.ndarray:
         """Apply colormap to grayscale array.
         
         Args:
-            grayscale_array: 2D array with values 0-255
+            grayscale_array: 2D array with values 0 to ``levels - 1``
+            levels: Number of gray levels encoded in the input
             
         Returns:
             RGB array with shape (H, W, 3)
         """
-        # Ensure input is uint8 and in range 0-255
-        gray = np.clip(grayscale_array, 0, 255).astype(np.uint8)
+        lut = self.get_lut(levels)
+        
+        # Windowed data is already in range, only clip foreign input
+        if grayscale_array.dtype == np.uint8 and levels == DEFAULT_LEVELS:
+            indices = grayscale_array
+        elif grayscale_array.dtype == np.uint16 and levels == HIGH_PRECISION_LEVELS:
+            indices = np.minimum(grayscale_array, levels - 1)
+        else:
+            indices = np.clip(grayscale_array, 0, levels - 1).astype(np.intp)
         
-        # Apply lookup table
-        rgb = self._lut[gray]
-        return rgb
+        return np.take(lut, indices, axis=0)
     
     def get_preview_bar(self, width: int = 64, height: int = 16) -> PILImage.Image:
         """Create a horizontal color bar preview of the colormap.
@@ -84,11 +115,30 @@ class ColorMap:
 
 
 class ColorMapManager:
-    """Manager for built-in colormaps."""
+    """Registry of built-in and user-defined colormaps.
     
-    def __init__(self):
+    User colormaps are discovered by file name in the user colormap
+    directory and parsed only when first requested. Use
+    ``get_colormap_manager()`` to share one registry, and therefore one set
+    of lookup tables, across the whole process.
+    """
+    
+    def __init__(self, user_dir: Optional[Path] = None):
         self.colormaps = self._create_builtin_colormaps()
         self.names = list(self.colormaps.keys())
+        self._lock = threading.Lock()
+        self._user_files: Dict[str, Path] = {}
+        self.user_dir = user_dir if user_dir is not None else get_user_colormap_dir()
+        self._discover_user_colormaps()
+    
+    def _discover_user_colormaps(self):
+        """Register user colormap files by name without reading them."""
+        if self.user_dir is None or not self.user_dir.is_dir():
+            return
+        for path in sorted(self.user_dir.iterdir()):
+            if path.suffix.lower() in USER_COLORMAP_EXTENSIONS and path.stem not in self.colormaps:
+                self._user_files[path.stem] = path
+                self.names.append(path.stem)
     
     def _create_builtin_colormaps(self) -> Dict[str, ColorMap]:
         """Create built-in colormaps for medical imaging."""
@@ -170,15 +220,86 @@ class ColorMapManager:
     
     def get_colormap(self, name: str) -> ColorMap:
         """Get colormap by name."""
-        if name not in self.colormaps:
+        colormap = self.colormaps.get(name)
+        if colormap is not None:
+            return colormap
+        if name not in self._user_files:
             raise ValueError(f"Unknown colormap: {name}")
-        return self.colormaps[name]
+        with self._lock:
+            if name not in self.colormaps:
+                self.colormaps[name] = load_colormap_file(self._user_files[name], name)
+            return self.colormaps[name]
     
     def get_names(self) -> List[str]:
         """Get list of available colormap names."""
         return self.names.copy()
     
-    def apply_colormap(self, grayscale_array: np.ndarray, colormap_name: str) -> np.ndarray:
+    def apply_colormap(
+        self, grayscale_array: np.ndarray, colormap_name: str, levels: int = DEFAULT_LEVELS
+    ) -> np.ndarray:
         """Apply named colormap to grayscale array."""
         colormap = self.get_colormap(colormap_name)
-        return colormap.apply(grayscale_array)
\ No newline at end of file
+        return colormap.apply(grayscale_array, levels)
+
+
+def get_user_colormap_dir() -> Optional[Path]:
+    """Return the directory searched for user colormap files."""
+    override = os.environ.get("PYDCMVIEW_COLORMAP_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(base) / "pydcmview" / "colormaps"
+
+
+def load_colormap_file(path: Path, name: Optional[str] = None) -> ColorMap:
+    """Load a colormap from a JSON or plain-text file.
+    
+    JSON files contain either a list of [R, G, B] entries or an object with a
+    ``colors`` list. Text and CSV files contain one R G B triple per line,
+    separated by whitespace or commas; ``#`` starts a comment. Values in the
+    0-1 range are scaled to 0-255.
+    
+    Args:
+        path: Path to the colormap file
+        name: Name to register the colormap under (defaults to the file stem)
+        
+    Returns:
+        Parsed colormap
+    """
+    name = name or path.stem
+    try:
+        if path.suffix.lower() == ".json":
+            data = json.loads(path.read_text())
+            if isinstance(data, dict):
+                data = data["colors"]
+            colors = np.asarray(data, dtype=np.float64)
+        else:
+            rows = []
+            for line in path.read_text().splitlines():
+                line = line.split("#", 1)[0].replace(",", " ").strip()
+                if line:
+                    rows.append([float(v) for v in line.split()])
+            colors = np.asarray(rows, dtype=np.float64)
+    except (OSError, ValueError, KeyError) as e:
+        raise ValueError(f"Invalid colormap file {path}: {e}")
+    
+    if colors.ndim != 2 or colors.shape[1] != 3:
+        raise ValueError(f"Invalid colormap file {path}: expected rows of R, G, B")
+    if colors.max() <= 1.0:
+        colors = colors * 255
+    colors = np.clip(np.round(colors), 0, 255).astype(int)
+    return ColorMap(name, [tuple(c) for c in colors.tolist()])
+
+
+_shared_manager: Optional[ColorMapManager] = None
+_shared_manager_lock = threading.Lock()
+
+
+def get_colormap_manager() -> ColorMapManager:
+    """Get the process-wide colormap registry."""
+    global _shared_manager
+    if _shared_manager is None:
+        with _shared_manager_lock:
+            if _shared_manager is None:
+                _shared_manager = ColorMapManager()
+    return _shared_manager
\ No newline at end of file
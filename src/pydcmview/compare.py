@@ -0,0 +1,66 @@
+"""Side-by-side comparison of two volumes with linked navigation."""
+
+from typing import Sequence, Tuple
+
+from PIL import Image as PILImage
+
+from .pipeline import RenderPipeline
+from .session import VolumeEntry
+
+
+# Pixels between the two panes of the composed frame
+PANE_GAP = 8
+
+
+class Comparison:
+    """Second session volume shown beside the current one.
+
+    The compared pane takes slice, extra-axis indices, display axes, flips,
+    zoom and scroll from the viewer, so the two panes always show the same
+    region. Window/level follows the current volume while ``link_window`` is
+    set and is otherwise the compared volume's own.
+    """
+
+    def __init__(self, index: int, entry: VolumeEntry):
+        self.index = index
+        self.entry = entry
+        self.link_window = True
+        self.window_center = entry.loader.window_center
+        self.window_width = entry.loader.window_width
+        # Memoized render stages of the compared pane
+        self.pipeline = RenderPipeline()
+
+    @property
+    def loader(self):
+        # Read through the entry, so reloads in watch mode are picked up
+        return self.entry.loader
+
+    @property
+    def array(self):
+        return self.entry.loader.array
+
+    @property
+    def label(self) -> str:
+        return self.entry.label
+
+    def matches(self, shape: Sequence[int]) -> bool:
+        """Whether the volume has the grid of the current one (same voxel shape)."""
+        return self.array is not None and tuple(self.array.shape) == tuple(shape)
+
+    def window(self, center: float, width: float) -> Tuple[float, float]:
+        """Window/level of the compared pane, given the current volume's."""
+        if self.link_window:
+            return center, width
+        return self.window_center, self.window_width
+
+
+def compose_panes(panes: Sequence[PILImage.Image], gap: int = PANE_GAP) -> PILImage.Image:
+    """Place rendered panes side by side, vertically centered, on black."""
+    width = sum(pane.width for pane in panes) + gap * (len(panes) - 1)
+    height = max(pane.height for pane in panes)
+    canvas = PILImage.new("RGB", (width, height))
+    left = 0
+    for pane in panes:
+        canvas.paste(pane.convert("RGB"), (left, (height - pane.height) // 2))
+        left += pane.width + gap
+    return canvas
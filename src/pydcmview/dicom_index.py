@@ -0,0 +1,362 @@
+"""Persistent, incremental index of DICOM series in directory trees."""
+
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pydicom
+from pydicom.fileset import FileSet
+
+from .cache import get_cache_dir
+
+
+# Default number of threads reading DICOM headers
+DEFAULT_SCAN_WORKERS = 8
+
+# Extensions treated as DICOM even without the "DICM" preamble
+DICOM_EXTENSIONS = {".dcm", ".dicom"}
+
+# File names of a DICOMDIR media directory
+DICOMDIR_NAMES = ("DICOMDIR", "dicomdir")
+
+# Header elements needed to build the series index
+_INDEX_TAGS = [
+    "PatientID",
+    "PatientName",
+    "StudyInstanceUID",
+    "StudyDate",
+    "StudyDescription",
+    "SeriesInstanceUID",
+    "SeriesNumber",
+    "SeriesDescription",
+    "Modality",
+    "InstanceNumber",
+    "ImagePositionPatient",
+    "ImageOrientationPatient",
+    "Rows",
+    "Columns",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS instances (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    is_dicom INTEGER NOT NULL,
+    patient_id TEXT,
+    patient_name TEXT,
+    study_uid TEXT,
+    study_date TEXT,
+    study_description TEXT,
+    series_uid TEXT,
+    series_number INTEGER,
+    series_description TEXT,
+    modality TEXT,
+    instance_number INTEGER,
+    slice_position REAL,
+    rows INTEGER,
+    columns INTEGER
+);
+CREATE INDEX IF NOT EXISTS instances_series ON instances (series_uid);
+"""
+
+_COLUMNS = (
+    "path, mtime_ns, size, is_dicom, patient_id, patient_name, study_uid, "
+    "study_date, study_description, series_uid, series_number, "
+    "series_description, modality, instance_number, slice_position, rows, columns"
+)
+
+
+def is_dicom_file(path: Union[str, Path]) -> bool:
+    """Check for the "DICM" magic after the 128-byte preamble."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(132)
+    except OSError:
+        return False
+    return len(header) == 132 and header[128:132] == b"DICM"
+
+
+def slice_position(ds) -> Optional[float]:
+    """Position of an instance along its slice normal, if known."""
+    try:
+        orientation = np.asarray(ds.ImageOrientationPatient, dtype=float)
+        position = np.asarray(ds.ImagePositionPatient, dtype=float)
+    except (AttributeError, TypeError, ValueError):
+        return None
+    if orientation.shape != (6,) or position.shape != (3,):
+        return None
+    normal = np.cross(orientation[:3], orientation[3:])
+    return float(np.dot(position, normal))
+
+
+def _int_or_none(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class DicomSeries:
+    """A DICOM series with its instance files in slice order."""
+
+    def __init__(
+        self,
+        series_uid: str,
+        files: Sequence[Path],
+        patient_name: str = "",
+        study_date: str = "",
+        study_description: str = "",
+        series_number: Optional[int] = None,
+        series_description: str = "",
+        modality: str = "",
+        rows: Optional[int] = None,
+        columns: Optional[int] = None,
+    ):
+        self.series_uid = series_uid
+        self.files = [Path(f) for f in files]
+        self.patient_name = patient_name
+        self.study_date = study_date
+        self.study_description = study_description
+        self.series_number = series_number
+        self.series_description = series_description
+        self.modality = modality
+        self.rows = rows
+        self.columns = columns
+
+    @property
+    def label(self) -> str:
+        """Short human-readable description of the series."""
+        number = f"#{self.series_number} " if self.series_number is not None else ""
+        description = self.series_description or self.series_uid[-12:]
+        return f"{self.modality} {number}{description}".strip()
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+
+def _instance_sort_key(position: Optional[float], number: Optional[int], path: str):
+    """Order instances by slice position, then instance number."""
+    return (
+        position if position is not None else float("inf"),
+        number if number is not None else 0,
+        path,
+    )
+
+
+def _sorted_series(series: List[DicomSeries]) -> List[DicomSeries]:
+    """Order series by patient, study date and series number."""
+    return sorted(
+        series,
+        key=lambda s: (
+            s.patient_name,
+            s.study_date,
+            s.series_number if s.series_number is not None else 0,
+            s.series_uid,
+        ),
+    )
+
+
+def find_dicomdir(root: Union[str, Path]) -> Optional[Path]:
+    """Return the DICOMDIR file at the top of ``root``, if there is one."""
+    for name in DICOMDIR_NAMES:
+        candidate = Path(root) / name
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def read_dicomdir(path: Union[str, Path]) -> List[DicomSeries]:
+    """Enumerate the image series listed in a DICOMDIR.
+
+    Patients, studies, series and instance files come from the directory
+    records alone, so no instance file is opened. Instances whose file is
+    missing from the media are skipped.
+    """
+    file_set = FileSet(pydicom.dcmread(str(path)))
+
+    grouped: Dict[str, List[Tuple]] = {}
+    for instance in file_set:
+        if instance.node.record_type != "IMAGE":
+            continue
+        series_uid = str(getattr(instance, "SeriesInstanceUID", "") or "")
+        file_path = instance.path
+        if not series_uid or not os.path.isfile(file_path):
+            continue
+        grouped.setdefault(series_uid, []).append(
+            (
+                _instance_sort_key(
+                    slice_position(instance),
+                    _int_or_none(getattr(instance, "InstanceNumber", None)),
+                    file_path,
+                ),
+                instance,
+            )
+        )
+
+    series = []
+    for series_uid, instances in grouped.items():
+        instances.sort(key=lambda item: item[0])
+        first = instances[0][1]
+        series.append(
+            DicomSeries(
+                series_uid,
+                [key[2] for key, _ in instances],
+                patient_name=str(getattr(first, "PatientName", "") or ""),
+                study_date=str(getattr(first, "StudyDate", "") or ""),
+                study_description=str(getattr(first, "StudyDescription", "") or ""),
+                series_number=_int_or_none(getattr(first, "SeriesNumber", None)),
+                series_description=str(getattr(first, "SeriesDescription", "") or ""),
+                modality=str(getattr(first, "Modality", "") or ""),
+                rows=_int_or_none(getattr(first, "Rows", None)),
+                columns=_int_or_none(getattr(first, "Columns", None)),
+            )
+        )
+    return _sorted_series(series)
+
+
+def _read_instance(path: str, stat: os.stat_result) -> Tuple:
+    """Read the index row of one file, sniffing whether it is DICOM."""
+    row_head = (path, stat.st_mtime_ns, stat.st_size)
+    not_dicom = row_head + (0,) + (None,) * 13
+
+    if not is_dicom_file(path) and Path(path).suffix.lower() not in DICOM_EXTENSIONS:
+        return not_dicom
+    try:
+        ds = pydicom.dcmread(
+            path, stop_before_pixels=True, specific_tags=_INDEX_TAGS, force=True
+        )
+    except Exception:
+        return not_dicom
+
+    series_uid = str(getattr(ds, "SeriesInstanceUID", "") or "")
+    if not series_uid:
+        return not_dicom
+
+    return row_head + (
+        1,
+        str(getattr(ds, "PatientID", "") or ""),
+        str(getattr(ds, "PatientName", "") or ""),
+        str(getattr(ds, "StudyInstanceUID", "") or ""),
+        str(getattr(ds, "StudyDate", "") or ""),
+        str(getattr(ds, "StudyDescription", "") or ""),
+        series_uid,
+        _int_or_none(getattr(ds, "SeriesNumber", None)),
+        str(getattr(ds, "SeriesDescription", "") or ""),
+        str(getattr(ds, "Modality", "") or ""),
+        _int_or_none(getattr(ds, "InstanceNumber", None)),
+        slice_position(ds),
+        _int_or_none(getattr(ds, "Rows", None)),
+        _int_or_none(getattr(ds, "Columns", None)),
+    )
+
+
+class DicomIndex:
+    """SQLite index of DICOM instances keyed by path, mtime and size.
+
+    Rescanning a tree only reads headers of files that are new or changed
+    since the last scan, and drops rows of files that disappeared.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        self.db_path = Path(db_path) if db_path else get_cache_dir() / "dicom_index.sqlite"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    @staticmethod
+    def _prefix_range(root: Path) -> Tuple[str, str]:
+        prefix = str(root).rstrip(os.sep) + os.sep
+        return prefix, prefix + "\U0010ffff"
+
+    def scan(
+        self, root: Union[str, Path], workers: int = DEFAULT_SCAN_WORKERS
+    ) -> List[DicomSeries]:
+        """Recursively index ``root`` and return the series found in it."""
+        root = Path(root).resolve()
+        low, high = self._prefix_range(root)
+
+        with self._lock:
+            known: Dict[str, Tuple[int, int]] = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self._conn.execute(
+                    "SELECT path, mtime_ns, size FROM instances WHERE path >= ? AND path < ?",
+                    (low, high),
+                )
+            }
+
+        seen = set()
+        todo = []
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+                if known.get(path) != (stat.st_mtime_ns, stat.st_size):
+                    todo.append((path, stat))
+
+        rows = []
+        if todo:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                rows = list(pool.map(lambda item: _read_instance(*item), todo))
+
+        removed = [(path,) for path in known.keys() - seen]
+        with self._lock, self._conn:
+            if removed:
+                self._conn.executemany("DELETE FROM instances WHERE path = ?", removed)
+            if rows:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO instances ({_COLUMNS}) "
+                    f"VALUES ({', '.join('?' * 17)})",
+                    rows,
+                )
+
+        return self.get_series(root)
+
+    def get_series(self, root: Union[str, Path]) -> List[DicomSeries]:
+        """Return the indexed image series under ``root``."""
+        low, high = self._prefix_range(Path(root).resolve())
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, patient_name, study_date, study_description, series_uid, "
+                "series_number, series_description, modality, instance_number, "
+                "slice_position, rows, columns FROM instances "
+                "WHERE is_dicom = 1 AND rows IS NOT NULL AND path >= ? AND path < ?",
+                (low, high),
+            ).fetchall()
+
+        grouped: Dict[str, List[tuple]] = {}
+        for row in rows:
+            grouped.setdefault(row[4], []).append(row)
+
+        series = []
+        for series_uid, instances in grouped.items():
+            instances.sort(key=lambda r: _instance_sort_key(r[9], r[8], r[0]))
+            first = instances[0]
+            series.append(
+                DicomSeries(
+                    series_uid,
+                    [r[0] for r in instances],
+                    patient_name=first[1],
+                    study_date=first[2],
+                    study_description=first[3],
+                    series_number=first[5],
+                    series_description=first[6],
+                    modality=first[7],
+                    rows=first[10],
+                    columns=first[11],
+                )
+            )
+
+        return _sorted_series(series)
@@ -0,0 +1,198 @@
+"""Cache of terminal graphics protocol encodings for rendered frames.
+
+Revisiting a slice produces the same RGB frame, so its PNG/base64 (Kitty)
+or Sixel encoding can be reused instead of being recomputed. For Kitty,
+images already transmitted to the terminal are kept resident and simply
+placed again by ID, so revisited frames cost almost no bandwidth.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from PIL import Image as PILImage
+from textual.app import ComposeResult
+from textual_image.renderable import Image as AutoRenderable
+from textual_image.renderable.sixel import Image as SixelRenderable
+from textual_image.renderable.tgp import Image as TGPRenderable
+from textual_image.widget import Image, SixelImage, TGPImage
+
+# textual-image has no public hooks for its encoders; without these
+# internals the plain (uncached) widget is used
+try:
+    from textual_image.renderable.tgp import _send_tgp_message
+    from textual_image.widget.sixel import _ImageSixelImpl, _NoopRenderable
+except ImportError:  # pragma: no cover - other textual-image versions
+    _send_tgp_message = _ImageSixelImpl = _NoopRenderable = None
+
+
+# Total size of cached encoded payloads
+DEFAULT_CACHE_BYTES = 128 * 1024 * 1024
+
+# Number of Kitty images kept in terminal memory for re-placement
+MAX_RESIDENT_IMAGES = 64
+
+# Size of a Kitty transmission chunk
+_TGP_CHUNK = 4096
+
+
+def frame_digest(image: PILImage.Image) -> bytes:
+    """Content hash of a PIL image, including its mode and size."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.mode}:{image.size}".encode("ascii"))
+    digest.update(image.tobytes())
+    return digest.digest()
+
+
+class EncodedFrameCache:
+    """Thread-safe LRU cache of encoded payloads bounded by total size."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Return the cached payload for ``key`` or None."""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, key: Hashable, payload: str):
+        """Store a payload, evicting least recently used entries if needed."""
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(previous)
+            self._entries[key] = payload
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+
+    def clear(self):
+        """Drop all cached payloads."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+_encoded_frames = EncodedFrameCache()
+
+
+def get_encoded_frame_cache() -> EncodedFrameCache:
+    """Get the process-wide encoded frame cache."""
+    return _encoded_frames
+
+
+class CachedTGPRenderable(TGPRenderable):
+    """Kitty graphics renderable that re-places images the terminal still holds."""
+
+    # (frame digest, pixel width, pixel height) -> terminal image ID
+    _resident: "OrderedDict[Tuple[bytes, int, int], int]" = OrderedDict()
+    _resident_lock = threading.Lock()
+
+    def __init__(self, image, width=None, height=None):
+        super().__init__(image, width, height)
+        self._digest = frame_digest(self._image_data.pil_image)
+
+    def cleanup(self):
+        """Keep the image in the terminal so it can be placed again.
+
+        Resident images are freed by ``free_resident`` instead, when the
+        widget showing them goes away.
+        """
+        self.terminal_image_id = None
+
+    @classmethod
+    def free_resident(cls):
+        """Delete every image kept in the terminal for re-placement."""
+        with cls._resident_lock:
+            image_ids = list(cls._resident.values())
+            cls._resident.clear()
+        for image_id in image_ids:
+            _send_tgp_message(a="d", d="I", i=image_id, q=2)
+
+    def _send_image_to_terminal(self, width: int, height: int):
+        key = (self._digest, width, height)
+        with self._resident_lock:
+            image_id = self._resident.get(key)
+            if image_id is not None:
+                self._resident.move_to_end(key)
+                self.terminal_image_id = image_id
+                return
+
+        self.terminal_image_id = next(TGPRenderable._image_id_counter)
+        cache = get_encoded_frame_cache()
+        image_data = cache.get(key)
+        if image_data is None:
+            image_data = self._image_data.scaled(width, height).to_base64()
+            cache.put(key, image_data)
+
+        for start in range(0, len(image_data), _TGP_CHUNK):
+            more = start + _TGP_CHUNK < len(image_data)
+            _send_tgp_message(
+                i=self.terminal_image_id,
+                m=1 if more else 0,
+                f=100,
+                payload=image_data[start : start + _TGP_CHUNK],
+                q=2,
+            )
+
+        with self._resident_lock:
+            self._resident[key] = self.terminal_image_id
+            while len(self._resident) > MAX_RESIDENT_IMAGES:
+                _, evicted_id = self._resident.popitem(last=False)
+                _send_tgp_message(a="d", d="I", i=evicted_id, q=2)
+
+
+class CachedTGPImage(TGPImage, Renderable=CachedTGPRenderable):
+    """Kitty graphics image widget backed by the encoded frame cache."""
+
+    def on_unmount(self):
+        # Do not leave the re-placeable frames in terminal memory after exit
+        CachedTGPRenderable.free_resident()
+
+
+if _ImageSixelImpl is not None:
+
+    class _CachedSixelImpl(_ImageSixelImpl):
+        """Sixel encoder that reuses encodings of identical frames."""
+
+        def _image_to_sixels(self, image, sixel_options=None, background=None) -> str:
+            key = ("sixel", frame_digest(image), repr(sixel_options), background)
+            cache = get_encoded_frame_cache()
+            sixel_data = cache.get(key)
+            if sixel_data is None:
+                sixel_data = super()._image_to_sixels(image, sixel_options, background)
+                cache.put(key, sixel_data)
+            return sixel_data
+
+    class CachedSixelImage(SixelImage, Renderable=_NoopRenderable):
+        """Sixel image widget backed by the encoded frame cache."""
+
+        def compose(self) -> ComposeResult:
+            yield _CachedSixelImpl(self.image, self._sixel_options)
+
+
+# Pick the cached widget matching the protocol textual-image detected
+if _ImageSixelImpl is None:
+    CachedImage = Image
+elif AutoRenderable is TGPRenderable:
+    CachedImage = CachedTGPImage
+elif AutoRenderable is SixelRenderable:
+    CachedImage = CachedSixelImage
+else:
+    CachedImage = Image
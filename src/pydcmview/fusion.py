@@ -0,0 +1,198 @@
+"""Fusion of a second volume onto the displayed one, resampled per slice."""
+
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+import numpy as np
+
+from .colormap import DEFAULT_LEVELS, get_colormap_manager
+from .image_loader import ImageLoader
+
+
+# Colormap of the fused volume unless chosen otherwise
+DEFAULT_FUSION_COLORMAP = "Hot"
+
+# Number of resampled slices kept
+DEFAULT_CACHED_SLICES = 32
+
+
+class SliceLayout:
+    """How a displayed 2D slice maps onto the axes of a volume.
+
+    Displayed row ``r`` and column ``c`` of the slice at ``index`` along
+    ``slice_axis`` are the voxel with ``row_axis = r`` (or ``n - 1 - r``
+    when ``flip_rows``) and likewise for columns.
+    """
+
+    def __init__(
+        self,
+        slice_axis: int,
+        index: int,
+        row_axis: int,
+        col_axis: int,
+        flip_rows: bool = False,
+        flip_cols: bool = False,
+    ):
+        self.slice_axis = slice_axis
+        self.index = index
+        self.row_axis = row_axis
+        self.col_axis = col_axis
+        self.flip_rows = flip_rows
+        self.flip_cols = flip_cols
+
+    def index_grid(self, shape: Tuple[int, ...], step: int = 1) -> np.ndarray:
+        """Array indices of every ``step``-th displayed pixel, shape (ndim, rows, cols)."""
+        rows = np.arange(0, shape[self.row_axis], step)
+        cols = np.arange(0, shape[self.col_axis], step)
+        if self.flip_rows:
+            rows = shape[self.row_axis] - 1 - rows
+        if self.flip_cols:
+            cols = shape[self.col_axis] - 1 - cols
+
+        grid = np.empty((len(shape), rows.size, cols.size), dtype=np.float64)
+        grid[self.slice_axis] = self.index
+        grid[self.row_axis] = rows[:, None]
+        grid[self.col_axis] = cols[None, :]
+        return grid
+
+
+def _sample_linear(array, coords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Trilinear interpolation of a 3D array at continuous indices.
+
+    Only the leading-axis block spanned by ``coords`` is read, so lazy
+    volumes load just the slices a resampled plane passes through.
+
+    Returns:
+        Interpolated values (float32) and a mask of points inside the volume
+    """
+    shape = np.asarray(array.shape, dtype=np.float64)
+    inside = np.all((coords >= -0.5) & (coords <= shape[:, None, None] - 0.5), axis=0)
+    values = np.zeros(coords.shape[1:], dtype=np.float32)
+    if not inside.any():
+        return values, inside
+
+    points = np.clip(coords[:, inside], 0, (shape - 1)[:, None])
+    first = int(np.floor(points[0].min()))
+    last = int(np.ceil(points[0].max()))
+    block = np.asarray(array[first : last + 1])
+    points[0] -= first
+
+    base = np.floor(points).astype(np.intp)
+    upper = np.minimum(base + 1, np.asarray(block.shape)[:, None] - 1)
+    weight = (points - base).astype(np.float32)
+
+    result = np.zeros(points.shape[1], dtype=np.float32)
+    for dz in (0, 1):
+        z = upper[0] if dz else base[0]
+        wz = weight[0] if dz else 1 - weight[0]
+        for dy in (0, 1):
+            y = upper[1] if dy else base[1]
+            wy = weight[1] if dy else 1 - weight[1]
+            for dx in (0, 1):
+                x = upper[2] if dx else base[2]
+                wx = weight[2] if dx else 1 - weight[2]
+                result += block[z, y, x].astype(np.float32) * (wz * wy * wx)
+
+    values[inside] = result
+    return values, inside
+
+
+class FusionLayer:
+    """Second volume drawn over the primary one with its own window and colormap.
+
+    The moving volume is resampled into the displayed slice of the primary
+    volume using both volumes' spacing, origin and direction. Only the
+    pixels actually shown are resampled (at the render's reduction factor)
+    and each resampled slice is cached, so the moving volume is never
+    resampled as a whole.
+    """
+
+    def __init__(
+        self,
+        loader: ImageLoader,
+        colormap: str = DEFAULT_FUSION_COLORMAP,
+        opacity: float = 0.5,
+        max_slices: int = DEFAULT_CACHED_SLICES,
+    ):
+        self.loader = loader
+        self.colormap = colormap
+        self.opacity = opacity
+        self.visible = True
+        self.window_center = loader.window_center
+        self.window_width = loader.window_width
+        self.max_slices = max_slices
+        self._slices: "OrderedDict[Hashable, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+
+    @classmethod
+    def load(cls, path, colormap: str = DEFAULT_FUSION_COLORMAP) -> "FusionLayer":
+        loader = ImageLoader(path)
+        loader.load()
+        if loader.array.ndim != 3:
+            raise ValueError("Fusion needs a 3D volume")
+        return cls(loader, colormap)
+
+    def compatible_with(self, fixed: ImageLoader) -> bool:
+        return fixed.array is not None and fixed.array.ndim == 3 and fixed.spacing is not None
+
+    def resample(
+        self, fixed: ImageLoader, layout: SliceLayout, step: int, key: Hashable
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Moving-volume values on the displayed slice of ``fixed``, cached by ``key``.
+
+        Returns:
+            Stored moving values and the mask of pixels inside the moving volume
+        """
+        cached = self._slices.get(key)
+        if cached is not None:
+            self._slices.move_to_end(key)
+            return cached
+
+        fixed_matrix, fixed_origin = fixed.index_to_physical()
+        moving_matrix, moving_origin = self.loader.index_to_physical()
+        # Fixed array index -> moving array index in one affine step
+        matrix = np.linalg.solve(moving_matrix, fixed_matrix)
+        offset = np.linalg.solve(moving_matrix, fixed_origin - moving_origin)
+
+        grid = layout.index_grid(fixed.array.shape, step)
+        coords = np.tensordot(matrix, grid, axes=1) + offset[:, None, None]
+        resampled = _sample_linear(self.loader.array, coords)
+
+        self._slices[key] = resampled
+        while len(self._slices) > self.max_slices:
+            self._slices.popitem(last=False)
+        return resampled
+
+    def clear_cache(self):
+        self._slices.clear()
+
+    def blend(
+        self,
+        rgb: np.ndarray,
+        resampled: Tuple[np.ndarray, np.ndarray],
+        top: int,
+        left: int,
+        levels: int = DEFAULT_LEVELS,
+    ) -> np.ndarray:
+        """Alpha-blend the colormapped moving slice onto ``rgb`` in place.
+
+        Args:
+            rgb: Rendered region of the primary slice
+            resampled: Values and mask from ``resample`` (same reduction)
+            top, left: Position of the region in the resampled slice
+        """
+        values, inside = resampled
+        height = min(rgb.shape[0], max(0, values.shape[0] - top))
+        width = min(rgb.shape[1], max(0, values.shape[1] - left))
+        if height == 0 or width == 0:
+            return rgb
+
+        window = (slice(top, top + height), slice(left, left + width))
+        select = inside[window]
+        gray = self.loader.apply_window_level(
+            values[window][select], self.window_center, self.window_width, levels
+        )
+        colors = get_colormap_manager().apply_colormap(gray, self.colormap, levels)
+        target = rgb[:height, :width]
+        blended = target[select] * (1.0 - self.opacity) + colors * self.opacity
+        target[select] = blended.astype(np.uint8)
+        return rgb
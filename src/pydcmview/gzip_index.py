@@ -0,0 +1,150 @@
+"""Random-access reading of gzip streams through a seek-point index."""
+
+import threading
+import zlib
+from pathlib import Path
+from typing import List, Tuple, Union
+
+from .cache import cache_path_for
+
+try:
+    import indexed_gzip as igzip
+except ImportError:  # pragma: no cover - optional dependency
+    igzip = None
+
+
+# Uncompressed distance between seek points
+DEFAULT_SPACING = 4 * 1024 * 1024
+
+_READ_CHUNK = 256 * 1024
+_OUTPUT_CHUNK = 4 * 1024 * 1024
+
+
+class IndexedGzipReader:
+    """Read arbitrary byte ranges of a gzip file without inflating all of it.
+
+    When the optional ``indexed_gzip`` package is installed, the full
+    seek-point index is built on first open and persisted in the cache
+    directory, so later opens seek straight to the requested span. Without
+    it, seek points are recorded in memory as the stream is inflated, which
+    makes revisiting earlier data cheap for the lifetime of the reader.
+    """
+
+    def __init__(self, file_path: Union[str, Path], spacing: int = DEFAULT_SPACING):
+        self.file_path = Path(file_path)
+        self.spacing = spacing
+        self._lock = threading.Lock()
+
+        if igzip is not None:
+            self._backend = _PersistentIndex(self.file_path, spacing)
+        else:
+            self._backend = _CheckpointIndex(self.file_path, spacing)
+
+    @property
+    def persistent(self) -> bool:
+        """Whether the seek-point index is stored on disk between runs."""
+        return isinstance(self._backend, _PersistentIndex)
+
+    def read(self, offset: int, size: int) -> bytes:
+        """Read ``size`` uncompressed bytes starting at ``offset``."""
+        with self._lock:
+            return self._backend.read(offset, size)
+
+    def close(self):
+        """Release the underlying file handle."""
+        with self._lock:
+            self._backend.close()
+
+
+class _PersistentIndex:
+    """Seek-point index backed by ``indexed_gzip`` and stored next to the cache."""
+
+    def __init__(self, file_path: Path, spacing: int):
+        self.index_path = cache_path_for(file_path, ".gzidx")
+        self._file = igzip.IndexedGzipFile(str(file_path), spacing=spacing)
+
+        loaded = False
+        if self.index_path.exists():
+            try:
+                self._file.import_index(str(self.index_path))
+                loaded = True
+            except Exception:
+                # Stale or corrupt index, rebuild it below
+                self.index_path.unlink(missing_ok=True)
+
+        if not loaded:
+            self._file.build_full_index()
+            try:
+                self._file.export_index(str(self.index_path))
+            except OSError:
+                # Read-only cache is not fatal, the index just isn't reused
+                pass
+
+    def read(self, offset: int, size: int) -> bytes:
+        self._file.seek(offset)
+        return self._file.read(size)
+
+    def close(self):
+        self._file.close()
+
+
+class _CheckpointIndex:
+    """In-memory seek points captured from ``zlib`` decompressor snapshots."""
+
+    def __init__(self, file_path: Path, spacing: int):
+        self.spacing = spacing
+        self._file = open(file_path, "rb")
+        # (uncompressed offset, compressed offset, decompressor state)
+        self._points: List[Tuple[int, int, "zlib._Decompress"]] = [
+            (0, 0, zlib.decompressobj(zlib.MAX_WBITS | 16))
+        ]
+
+    def _nearest_point(self, offset: int) -> Tuple[int, int, "zlib._Decompress"]:
+        best = self._points[0]
+        for point in self._points:
+            if point[0] > offset:
+                break
+            best = point
+        return best
+
+    def read(self, offset: int, size: int) -> bytes:
+        end = offset + size
+        out_pos, in_pos, state = self._nearest_point(offset)
+        decompressor = state.copy()
+        pending = b""
+        result = bytearray()
+
+        while out_pos < end:
+            if not pending:
+                if decompressor.eof:
+                    break
+                self._file.seek(in_pos)
+                pending = self._file.read(_READ_CHUNK)
+                in_pos += len(pending)
+                if not pending:
+                    break
+
+            output = decompressor.decompress(pending, _OUTPUT_CHUNK)
+            pending = decompressor.unconsumed_tail
+
+            if decompressor.eof and decompressor.unused_data:
+                # Concatenated gzip members continue after the trailer
+                pending = decompressor.unused_data
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+            # Keep the overlap between this output chunk and the request
+            lo = max(offset, out_pos) - out_pos
+            hi = min(end, out_pos + len(output)) - out_pos
+            if lo < hi:
+                result += output[lo:hi]
+            out_pos += len(output)
+
+            if out_pos >= self._points[-1][0] + self.spacing:
+                self._points.append(
+                    (out_pos, in_pos - len(pending), decompressor.copy())
+                )
+
+        return bytes(result)
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,109 @@
+"""Volume intensity histogram for equalized and percentile-based display."""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+from .chunked import ChunkedArray
+from .lazy_array import LazyArray
+
+
+# Number of histogram bins, also the resolution of the equalization table
+DEFAULT_BINS = 4096
+
+# Upper bound on voxels sampled to build the histogram
+DEFAULT_MAX_SAMPLES = 2_000_000
+
+# Leading-axis blocks sampled from a lazy volume
+_LAZY_SAMPLE_BLOCKS = 8
+
+
+def strided_sample(array, max_samples: int = DEFAULT_MAX_SAMPLES) -> np.ndarray:
+    """Take an evenly strided 1D sample of at most ``max_samples`` voxels.
+
+    Lazy volumes are sampled from a few evenly spaced leading-axis blocks so
+    that the whole volume is never loaded, multiscale stores from their
+    coarsest level.
+    """
+    if isinstance(array, ChunkedArray):
+        array = array.levels[-1]
+    if isinstance(array, LazyArray):
+        count = min(array.shape[0], _LAZY_SAMPLE_BLOCKS)
+        indices = np.linspace(0, array.shape[0] - 1, count).astype(int)
+        per_block = max(1, max_samples // count)
+        return np.concatenate(
+            [strided_sample(array[int(i)], per_block) for i in indices]
+        )
+
+    flat = np.asarray(array).reshape(-1)
+    step = max(1, flat.size // max_samples)
+    return flat[::step]
+
+
+class VolumeHistogram:
+    """Cumulative intensity distribution of a volume, computed once.
+
+    Display modes derived from it are table lookups: equalization maps each
+    voxel to its histogram bin and reads the level from a precomputed table,
+    and percentile windows are read straight from the CDF. Intensities are
+    in real-world units; ``slope`` and ``intercept`` map stored values to
+    them and are folded into the bin lookup.
+    """
+
+    def __init__(
+        self,
+        array,
+        bins: int = DEFAULT_BINS,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        slope: float = 1.0,
+        intercept: float = 0.0,
+    ):
+        sample = strided_sample(array, max_samples)
+        if np.issubdtype(sample.dtype, np.floating):
+            sample = sample[np.isfinite(sample)]
+        if sample.size == 0:
+            sample = np.zeros(1, dtype=np.float32)
+        if (slope, intercept) != (1.0, 0.0):
+            sample = sample * slope + intercept
+
+        self.bins = bins
+        self.min = float(sample.min())
+        self.max = float(sample.max())
+        if self.max <= self.min:
+            self.max = self.min + 1.0
+
+        counts, self.edges = np.histogram(sample, bins=bins, range=(self.min, self.max))
+        cdf = np.cumsum(counts, dtype=np.float64)
+        self.cdf = cdf / cdf[-1]
+        # Affine map from stored values straight to bin indices
+        self._scale = slope * bins / (self.max - self.min)
+        self._offset = (intercept - self.min) * bins / (self.max - self.min)
+        self._luts: Dict[int, np.ndarray] = {}
+
+    def percentile(self, q: float) -> float:
+        """Intensity below which ``q`` percent of the sampled voxels fall."""
+        return float(np.interp(q / 100.0, self.cdf, self.edges[1:]))
+
+    def percentile_window(self, low: float = 1.0, high: float = 99.0) -> Tuple[float, float]:
+        """Window center and width spanning the ``low``-``high`` percentiles."""
+        lo = self.percentile(low)
+        hi = self.percentile(high)
+        if hi <= lo:
+            hi = lo + 1.0
+        return (lo + hi) / 2, hi - lo
+
+    def equalization_lut(self, levels: int = 256) -> np.ndarray:
+        """Table mapping histogram bins to equalized gray levels."""
+        lut = self._luts.get(levels)
+        if lut is None:
+            out_dtype = np.uint8 if levels <= 256 else np.uint16
+            lut = np.rint(self.cdf * (levels - 1)).astype(out_dtype)
+            self._luts[levels] = lut
+        return lut
+
+    def apply_equalization(self, array: np.ndarray, levels: int = 256) -> np.ndarray:
+        """Map stored values to histogram-equalized gray levels ``0..levels-1``."""
+        lut = self.equalization_lut(levels)
+        indices = np.asarray(array, dtype=np.float32) * self._scale + self._offset
+        np.clip(indices, 0, self.bins - 1, out=indices)
+        return lut[indices.astype(np.intp)]
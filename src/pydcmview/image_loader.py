@@ -4,20 +4,64 @@ import SimpleITK as sitk
 import numpy as np
 import pydicom
 from pathlib import Path
-from typing import Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from .chunked import is_chunked_store, open_chunked_store
+from .dicom_index import is_dicom_file
+from .histogram import VolumeHistogram
+from .lazy_array import LazyArray
+from .multiframe import MultiFrameDicomVolume, open_multiframe_dicom
+from .nifti import NiftiHeader, open_nifti, open_nifti_gz
+from .shared_store import SharedVolume, encode_metadata, volume_key
+
+
+# Integer dtypes tried, smallest first, when compacting pixel data
+COMPACT_DTYPES = (np.uint8, np.int8, np.uint16, np.int16, np.uint32, np.int32)
+# Bytes of float pixel data checked and converted at a time when compacting
+COMPACT_SLAB_BYTES = 32 * 1024 * 1024
+
+# Loader attributes stored with a volume in shared memory
+SHARED_ATTRS = (
+    "window_center",
+    "window_width",
+    "rescale_slope",
+    "rescale_intercept",
+    "spacing",
+    "origin",
+    "direction",
+)
 
 
 class ImageLoader:
     """Handles loading and processing of medical images."""
 
-    SUPPORTED_EXTENSIONS = {".dcm", ".dicom", ".nrrd", ".nii", ".nii.gz"}
+    SUPPORTED_EXTENSIONS = {".dcm", ".dicom", ".nrrd", ".nii", ".nii.gz", ".zarr"}
 
-    def __init__(self, file_path: Union[str, Path]):
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        series_files: Optional[Sequence[Union[str, Path]]] = None,
+        share: bool = False,
+    ):
         self.file_path = Path(file_path)
+        # Publish/attach the pixel data in shared memory for other viewers
+        self.share = share
+        self._shared: Optional[SharedVolume] = None
+        # Ordered instance files when loading a multi-file DICOM series
+        self.series_files = [Path(f) for f in series_files] if series_files else None
         self.image = None
         self.array = None
         self.window_center = None
         self.window_width = None
+        # Mapping from stored pixel values to real-world values
+        self.rescale_slope = 1.0
+        self.rescale_intercept = 0.0
+        # Physical geometry in SimpleITK (x, y, z) order: voxel size,
+        # position of the first voxel and direction cosines
+        self.spacing: Optional[Tuple[float, ...]] = None
+        self.origin: Optional[Tuple[float, ...]] = None
+        self.direction: Optional[np.ndarray] = None
+        self._histogram = None
         self._validate_file()
 
     def _validate_file(self):
@@ -25,6 +69,14 @@ class ImageLoader:
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
+        # Series instances were already identified as DICOM by the scanner
+        if self.series_files or is_dicom_file(self.file_path):
+            return
+
+        # Chunked stores are directories, whatever their name
+        if is_chunked_store(self.file_path):
+            return
+
         if self.file_path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
             # Check for .nii.gz
             if not (
@@ -35,31 +87,342 @@ class ImageLoader:
                     f"Unsupported file format. Supported formats: {self.SUPPORTED_EXTENSIONS}"
                 )
 
+    def _is_dicom(self) -> bool:
+        """Check whether the image is DICOM, by extension or preamble."""
+        return (
+            self.series_files is not None
+            or self.file_path.suffix.lower() in {".dcm", ".dicom"}
+            or is_dicom_file(self.file_path)
+        )
+
+    def _is_nifti_gz(self) -> bool:
+        """Check whether the file is a gzip-compressed NIfTI volume."""
+        return self.file_path.name.lower().endswith(".nii.gz")
+
     def load(self) -> Tuple[np.ndarray, Tuple[int, ...]]:
         """Load the image and return array and shape."""
         try:
+            # Another viewer process may already hold this volume
+            if self.share and self._attach_shared():
+                return self.array, self.array.shape
+
+            # Chunked stores are read chunk by chunk, never as a whole
+            if is_chunked_store(self.file_path):
+                lazy = open_chunked_store(self.file_path)
+                if lazy is None:
+                    raise ValueError("Unsupported chunked store")
+                self.array = lazy
+                self._calculate_min_max_window()
+                self._read_store_geometry()
+                return self.array, self.array.shape
+
+            # Compressed NIfTI is read lazily through a gzip seek-point index,
+            # and 4D+ NIfTI one timepoint at a time
+            if self._is_nifti_gz() or self.file_path.suffix.lower() == ".nii":
+                if self._is_nifti_gz():
+                    lazy = open_nifti_gz(self.file_path)
+                else:
+                    lazy = open_nifti(self.file_path)
+                if lazy is not None:
+                    self.array = lazy
+                    header = lazy.header
+                    if header.has_scaling:
+                        self.rescale_slope = float(header.scl_slope)
+                        self.rescale_intercept = float(header.scl_inter)
+                    if header.cal_max > header.cal_min:
+                        self.window_center = (header.cal_max + header.cal_min) / 2
+                        self.window_width = header.cal_max - header.cal_min
+                    else:
+                        self._calculate_min_max_window()
+                    self._read_geometry()
+                    return self.array, self.array.shape
+
+            # Multi-frame DICOM is decoded frame by frame on demand
+            dataset = None
+            if self._is_dicom() and not self.series_files:
+                try:
+                    dataset = pydicom.dcmread(str(self.file_path), defer_size=1024)
+                except Exception:
+                    dataset = None
+                lazy = open_multiframe_dicom(self.file_path, dataset) if dataset else None
+                if lazy is not None:
+                    self.array = lazy
+                    rescale = self._read_dicom_header(dataset)
+                    if rescale is not None:
+                        self.rescale_slope, self.rescale_intercept = rescale
+                    if self.window_center is None or self.window_width is None:
+                        self._calculate_min_max_window()
+                    self._read_geometry()
+                    return self.array, self.array.shape
+
             # Load using SimpleITK
-            self.image = sitk.ReadImage(str(self.file_path))
+            if self.series_files:
+                reader = sitk.ImageSeriesReader()
+                reader.SetFileNames([str(f) for f in self.series_files])
+                self.image = reader.Execute()
+            else:
+                self.image = sitk.ReadImage(str(self.file_path))
             self.array = sitk.GetArrayFromImage(self.image)
+            self._read_geometry()
+            # The array is a copy: free the image before compacting it
+            self.image = None
+
+            # For DICOM files, try to extract window/level and rescale information
+            rescale = None
+            if self._is_dicom():
+                rescale = self._read_dicom_header(dataset)
+            elif self.file_path.suffix.lower() == ".nii":
+                rescale = self._read_nifti_rescale()
 
-            # For DICOM files, try to extract window/level information
-            if self.file_path.suffix.lower() in {".dcm", ".dicom"}:
-                self._extract_dicom_window_level()
+            # Keep pixel data as compact stored integers when that is lossless
+            self._compact_array(rescale)
 
             # If no window/level found, use min/max
             if self.window_center is None or self.window_width is None:
                 self._calculate_min_max_window()
 
+            if self.share:
+                self._publish_shared()
+
             return self.array, self.array.shape
 
         except Exception as e:
             raise RuntimeError(f"Failed to load image {self.file_path}: {e}")
 
-    def _extract_dicom_window_level(self):
-        """Extract window center and width from DICOM metadata."""
+    def read_instances(self, positions: Sequence[int]) -> Optional[Dict[int, np.ndarray]]:
+        """Re-read changed instances of a loaded series, without touching the volume.
+
+        Each changed instance is decoded on its own and converted to the
+        stored dtype with the volume's rescale. The volume is left as it is,
+        so this can run in a worker while the slices are being displayed;
+        ``write_instances`` applies the result.
+
+        Args:
+            positions: Indices of the changed files in ``series_files``
+
+        Returns:
+            The stored slices by position, or None when a full reload is
+            needed instead: lazy or shared pixel data, or an instance whose
+            size or values no longer fit
+        """
+        array = self.array
+        if (
+            not self.series_files
+            or not isinstance(array, np.ndarray)
+            or self._shared is not None
+            or not array.flags.writeable
+            or array.ndim != 3
+            or array.shape[0] != len(self.series_files)
+        ):
+            return None
+
+        slices = {}
+        for position in positions:
+            try:
+                values = sitk.GetArrayFromImage(sitk.ReadImage(str(self.series_files[position])))
+            except Exception:
+                return None
+            if values.shape != (1,) + array.shape[1:]:
+                return None
+            if np.issubdtype(array.dtype, np.integer):
+                stored = _exact_stored(values[0], self.rescale_slope, self.rescale_intercept)
+                if stored is None:
+                    return None
+                info = np.iinfo(array.dtype)
+                if stored.min() < info.min or stored.max() > info.max:
+                    return None
+            else:
+                stored = values[0]
+                if (self.rescale_slope, self.rescale_intercept) != (1.0, 0.0):
+                    stored = (stored - self.rescale_intercept) / self.rescale_slope
+            slices[position] = stored.astype(array.dtype)
+
+        return slices
+
+    def write_instances(self, slices: Dict[int, np.ndarray]):
+        """Write slices from ``read_instances`` over the volume's own."""
+        array = self.array
+        if not isinstance(array, np.ndarray) or not array.flags.writeable:
+            # Unloaded since the slices were read
+            return
+        for position, stored in slices.items():
+            array[position] = stored
+        self._histogram = None
+
+    def _shared_name(self) -> str:
+        return volume_key(self.series_files or [self.file_path])
+
+    def _attach_shared(self) -> bool:
+        """Use pixel data another process published, if any."""
+        shared = SharedVolume.attach(self._shared_name())
+        if shared is None:
+            return False
+        for name in SHARED_ATTRS:
+            setattr(self, name, shared.metadata.get(name))
+        self.spacing = tuple(self.spacing)
+        self.origin = tuple(self.origin)
+        self.direction = np.asarray(self.direction, dtype=float)
+        self._shared = shared
+        self.array = shared.array
+        return True
+
+    def _publish_shared(self):
+        """Move the loaded pixel data into shared memory for later viewers.
+
+        The private copy (and the SimpleITK image) is dropped, so the
+        publishing process does not hold the volume twice.
+        """
+        metadata = {name: encode_metadata(getattr(self, name)) for name in SHARED_ATTRS}
+        shared = SharedVolume.publish(self._shared_name(), self.array, metadata)
+        if shared is not None:
+            self._shared = shared
+            self.array = shared.array
+            self.image = None
+
+    def _read_geometry(self):
+        """Read spacing, origin and direction, from the header alone if lazy."""
+        image = self.image
+        if image is None:
+            try:
+                image = sitk.ImageFileReader()
+                image.SetFileName(str(self.file_path))
+                image.ReadImageInformation()
+            except Exception:
+                image = None
+
+        ndim = self.array.ndim
+        if image is not None and image.GetDimension() == ndim:
+            self.spacing = tuple(image.GetSpacing())
+            self.origin = tuple(image.GetOrigin())
+            self.direction = np.asarray(image.GetDirection(), dtype=float).reshape(ndim, ndim)
+        else:
+            self.spacing = (1.0,) * ndim
+            self.origin = (0.0,) * ndim
+            self.direction = np.eye(ndim)
+
+    def _read_store_geometry(self):
+        """Take spacing and origin from a multiscale store's transformations."""
+        ndim = self.array.ndim
+        scale = self.array.scale or (1.0,) * ndim
+        translation = self.array.translation or (0.0,) * ndim
+        # Stores list axes in numpy order, the reverse of SimpleITK's
+        self.spacing = tuple(float(s) for s in reversed(scale))
+        self.origin = tuple(float(t) for t in reversed(translation))
+        self.direction = np.eye(ndim)
+
+    def index_to_physical(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Affine map from array indices to physical coordinates.
+
+        Returns:
+            (matrix, offset) such that ``matrix @ index + offset`` is the
+            physical (x, y, z, ...) position of the voxel at ``index``, with
+            ``index`` in numpy axis order
+        """
+        if self.spacing is None:
+            raise RuntimeError("Image not loaded")
+        matrix = self.direction @ np.diag(self.spacing)
+        # numpy axes run in the reverse of SimpleITK's index order
+        return matrix[:, ::-1], np.asarray(self.origin, dtype=float)
+
+    def array_spacing(self) -> Tuple[float, ...]:
+        """Voxel spacing along each numpy axis."""
+        if self.spacing is None:
+            raise RuntimeError("Image not loaded")
+        return tuple(reversed(self.spacing))
+
+    def _read_dicom_header(self, ds=None) -> Optional[Tuple[float, float]]:
+        """Extract window/level and rescale slope/intercept from DICOM metadata.
+
+        Args:
+            ds: The already read dataset, if any; otherwise the header is read
+
+        Returns:
+            (slope, intercept) if the header defines a rescale, otherwise None
+        """
+        if ds is None:
+            try:
+                ds = pydicom.dcmread(str(self.file_path), stop_before_pixels=True)
+            except Exception:
+                # If DICOM reading fails, fall back to min/max
+                return None
+
+        # Enhanced objects keep these in (shared or per-frame) functional groups
+        self._extract_dicom_window_level(
+            _functional_group_item(ds, "FrameVOILUTSequence", "WindowCenter")
+        )
+
+        source = _functional_group_item(ds, "PixelValueTransformationSequence", "RescaleSlope")
+        slope = float(getattr(source, "RescaleSlope", 1.0) or 1.0)
+        intercept = float(getattr(source, "RescaleIntercept", 0.0) or 0.0)
+        return slope, intercept
+
+    def _read_nifti_rescale(self) -> Optional[Tuple[float, float]]:
+        """Read scl_slope/scl_inter from an uncompressed NIfTI header."""
         try:
-            ds = pydicom.dcmread(str(self.file_path))
+            with open(self.file_path, "rb") as f:
+                header = NiftiHeader(f.read(540))
+        except (OSError, ValueError):
+            return None
+        if not header.has_scaling:
+            return None
+        return float(header.scl_slope), float(header.scl_inter)
+
+    def _compact_array(self, rescale: Optional[Tuple[float, float]] = None):
+        """Store pixel data as the smallest lossless integer dtype.
+
+        SimpleITK applies rescale slope/intercept and returns float arrays,
+        which can be 2-4x larger than the stored integers. The stored values
+        are recovered and kept instead, and the rescale is applied only in
+        window/level and intensity readout. Integer arrays are widened by
+        the rescale too (int16 CT with an intercept comes back as int32), so
+        they are narrowed to the smallest dtype holding their range.
+
+        Args:
+            rescale: (slope, intercept) from the file header, if any
+        """
+        array = self.array
+        if array.size == 0:
+            return
+
+        if np.issubdtype(array.dtype, np.integer):
+            # The rescale was already applied, so the values are kept as they are
+            dtype = _smallest_int_dtype(int(array.min()), int(array.max()))
+            if dtype is not None and np.dtype(dtype).itemsize < array.dtype.itemsize:
+                self.array = array.astype(dtype)
+            return
+
+        if not np.issubdtype(array.dtype, np.floating):
+            return
+
+        candidates: List[Tuple[float, float]] = []
+        if rescale is not None and rescale != (1.0, 0.0) and rescale[0] != 0:
+            candidates.append(rescale)
+        candidates.append((1.0, 0.0))
+
+        low, high = float(array.min()), float(array.max())
+        for slope, intercept in candidates:
+            # The rescale is monotonic, so the extremes give the stored range
+            ends = np.rint((np.array([low, high]) - intercept) / slope)
+            dtype = _smallest_int_dtype(float(ends.min()), float(ends.max()))
+            if dtype is None or np.dtype(dtype).itemsize >= array.dtype.itemsize:
+                continue
+
+            compact = _compact_slabs(array, slope, intercept, dtype)
+            if compact is None:
+                continue
 
+            self.array = compact
+            self.rescale_slope = slope
+            self.rescale_intercept = intercept
+            return
+
+    def to_real(self, value):
+        """Convert stored pixel values to real-world values."""
+        return value * self.rescale_slope + self.rescale_intercept
+
+    def _extract_dicom_window_level(self, ds):
+        """Extract window center and width from DICOM metadata."""
+        try:
             # Check for WindowCenter (0028,1050) and WindowWidth (0028,1051)
             if hasattr(ds, "WindowCenter") and hasattr(ds, "WindowWidth"):
                 # Handle multiple values (take first)
@@ -80,11 +443,54 @@ class ImageLoader:
     def _calculate_min_max_window(self):
         """Calculate window/level from image min/max values."""
         if self.array is not None:
-            min_val = float(np.min(self.array))
-            max_val = float(np.max(self.array))
+            # Avoid inflating a whole lazy volume just to pick a window
+            data = (
+                self.array.preview()
+                if isinstance(self.array, LazyArray)
+                else self.array
+            )
+            min_val, max_val = sorted(
+                (float(self.to_real(np.min(data))), float(self.to_real(np.max(data))))
+            )
             self.window_center = (min_val + max_val) / 2
             self.window_width = max_val - min_val
 
+    @property
+    def resident_bytes(self) -> int:
+        """Bytes of pixel data currently held in memory."""
+        if isinstance(self.array, LazyArray):
+            return self.array.resident_bytes
+        return self.array.nbytes if self.array is not None else 0
+
+    def unload(self):
+        """Drop pixel data, keeping header information and statistics.
+
+        Window/level and the histogram survive, so ``load()`` can be called
+        again later to bring the pixels back.
+        """
+        if isinstance(self.array, MultiFrameDicomVolume):
+            # Stop its decoding threads and close the file; load() reopens it
+            self.array.close()
+            self.array = None
+        elif isinstance(self.array, LazyArray):
+            self.array.release()
+        else:
+            self.array = None
+        self.image = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def get_histogram(self) -> VolumeHistogram:
+        """Get the volume histogram, computing it on first use."""
+        if self.array is None:
+            raise RuntimeError("Image not loaded")
+        if self._histogram is None:
+            self._histogram = VolumeHistogram(
+                self.array, slope=self.rescale_slope, intercept=self.rescale_intercept
+            )
+        return self._histogram
+
     def get_default_display_axes(self) -> Tuple[int, int]:
         """Determine the two largest dimensions for default 2D display."""
         if self.array is None:
@@ -99,19 +505,109 @@ class ImageLoader:
         return sorted_dims[0][0], sorted_dims[1][0]
 
     def apply_window_level(
-        self, array: np.ndarray, center: float, width: float
+        self, array: np.ndarray, center: float, width: float, levels: int = 256
     ) -> np.ndarray:
-        """Apply window/level to image array for display."""
+        """Apply window/level to image array for display.
+
+        ``array`` holds stored pixel values while ``center`` and ``width`` are
+        in real-world units; the rescale slope/intercept is folded into the
+        window so the volume is never converted to floating point.
+
+        Returns gray levels in ``0..levels-1``: uint8 for up to 256 levels,
+        uint16 for higher-precision colormap tables.
+        """
+        out_dtype = np.uint8 if levels <= 256 else np.uint16
+        if width <= 0:
+            return np.zeros_like(array, dtype=out_dtype)
+
         min_val = center - width / 2
         max_val = center + width / 2
+        slope = self.rescale_slope
+        intercept = self.rescale_intercept
+
+        # Window bounds expressed in stored units
+        low, high = sorted(((min_val - intercept) / slope, (max_val - intercept) / slope))
 
         # Clip values to window range
-        windowed = np.clip(array, min_val, max_val)
+        windowed = np.clip(array, low, high)
+
+        # Normalize to 0..levels-1 for display in one affine step
+        scale = slope / width * (levels - 1)
+        offset = (intercept - min_val) / width * (levels - 1)
+        windowed = windowed * scale + offset
+        return np.clip(windowed, 0, levels - 1, out=windowed).astype(out_dtype)
+
+
+def _functional_group_item(ds, sequence: str, keyword: str):
+    """Dataset holding ``keyword``: the top level or a functional group.
+
+    Looks at the top level first, then the shared functional groups, then
+    the first frame's functional groups; falls back to ``ds`` itself.
+    """
+    if keyword in ds:
+        return ds
+    for groups in ("SharedFunctionalGroupsSequence", "PerFrameFunctionalGroupsSequence"):
+        try:
+            item = getattr(ds, groups)[0]
+            candidate = getattr(item, sequence)[0]
+        except (AttributeError, IndexError):
+            continue
+        if keyword in candidate:
+            return candidate
+    return ds
+
+
+def _exact_stored(real: np.ndarray, slope: float, intercept: float) -> Optional[np.ndarray]:
+    """Integer stored values that ``slope``/``intercept`` map back to ``real`` exactly.
+
+    Returns:
+        The stored values (integral, though possibly of float dtype), or None
+        if no integer array reproduces every value of ``real`` bit for bit
+    """
+    if (slope, intercept) == (1.0, 0.0):
+        if np.issubdtype(real.dtype, np.integer):
+            return real
+        stored = np.rint(real)
+        return stored if np.array_equal(stored, real) else None
+
+    # In double precision, as the rescale was applied
+    stored = real.astype(np.float64)
+    stored -= intercept
+    stored /= slope
+    np.rint(stored, out=stored)
+    restored = stored * slope
+    restored += intercept
+    if np.issubdtype(real.dtype, np.floating):
+        restored = restored.astype(real.dtype)
+    return stored if np.array_equal(restored, real) else None
+
+
+def _compact_slabs(
+    real: np.ndarray, slope: float, intercept: float, dtype
+) -> Optional[np.ndarray]:
+    """``real`` as exact stored integers of ``dtype``, converted slab by slab.
+
+    Working along axis 0 keeps the float64 temporaries of the exactness
+    check to one slab rather than several copies of the whole volume.
+
+    Returns:
+        The stored array, or None at the first slab that is not exact
+    """
+    compact = np.empty(real.shape, dtype=dtype)
+    slab_bytes = max(real[:1].nbytes, 1)
+    step = max(1, COMPACT_SLAB_BYTES // slab_bytes)
+    for start in range(0, real.shape[0], step):
+        stored = _exact_stored(real[start : start + step], slope, intercept)
+        if stored is None:
+            return None
+        compact[start : start + step] = stored
+    return compact
 
-        # Normalize to 0-255 for display
-        if width > 0:
-            windowed = ((windowed - min_val) / width * 255).astype(np.uint8)
-        else:
-            windowed = np.zeros_like(array, dtype=np.uint8)
 
-        return windowed
+def _smallest_int_dtype(min_val: float, max_val: float):
+    """Smallest integer dtype holding ``[min_val, max_val]``, or None."""
+    for dtype in COMPACT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= min_val and max_val <= info.max:
+            return dtype
+    return None
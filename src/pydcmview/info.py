@@ -0,0 +1,273 @@
+"""Header-only summaries of image files (``pydcmview info``)."""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pydicom
+import SimpleITK as sitk
+
+from .dicom_index import DEFAULT_SCAN_WORKERS, DICOM_EXTENSIONS, is_dicom_file
+from .image_loader import _functional_group_item
+
+
+# Extensions read through SimpleITK's header reader
+IMAGE_EXTENSIONS = {".nrrd", ".nhdr", ".nii", ".mha", ".mhd"}
+
+# Patient-coordinate (LPS) letters for the positive and negative x, y, z directions
+_POSITIVE_AXES = "LPS"
+_NEGATIVE_AXES = "RAI"
+
+_SITK_DTYPES = {
+    sitk.sitkUInt8: "uint8",
+    sitk.sitkInt8: "int8",
+    sitk.sitkUInt16: "uint16",
+    sitk.sitkInt16: "int16",
+    sitk.sitkUInt32: "uint32",
+    sitk.sitkInt32: "int32",
+    sitk.sitkUInt64: "uint64",
+    sitk.sitkInt64: "int64",
+    sitk.sitkFloat32: "float32",
+    sitk.sitkFloat64: "float64",
+    sitk.sitkVectorUInt8: "uint8",
+    sitk.sitkVectorInt8: "int8",
+    sitk.sitkVectorUInt16: "uint16",
+    sitk.sitkVectorInt16: "int16",
+    sitk.sitkVectorUInt32: "uint32",
+    sitk.sitkVectorInt32: "int32",
+    sitk.sitkVectorUInt64: "uint64",
+    sitk.sitkVectorInt64: "int64",
+    sitk.sitkVectorFloat32: "float32",
+    sitk.sitkVectorFloat64: "float64",
+}
+
+# Error recorded for files that hold no image, skipped in directory listings
+NOT_AN_IMAGE = "not an image"
+
+# Table columns: (header, record key, width)
+_TABLE_COLUMNS = (
+    ("FORMAT", "format", 6),
+    ("SHAPE", "shape", 16),
+    ("DTYPE", "dtype", 9),
+    ("SPACING", "spacing", 20),
+    ("ORIENT", "orientation", 6),
+    ("MOD", "modality", 4),
+    ("WINDOW", "windows", 14),
+)
+
+
+def orientation_code(direction: np.ndarray) -> str:
+    """Three-letter patient orientation (e.g. ``LPS``) of a direction matrix.
+
+    Each letter names the patient direction an image axis points to, from
+    the largest component of that axis's direction cosine.
+    """
+    code = ""
+    for axis in np.asarray(direction, dtype=float).T:
+        dominant = int(np.argmax(np.abs(axis)))
+        if dominant >= len(_POSITIVE_AXES):
+            return ""
+        letters = _POSITIVE_AXES if axis[dominant] > 0 else _NEGATIVE_AXES
+        code += letters[dominant]
+    return code
+
+
+def _is_image_file(path: Path) -> bool:
+    name = path.name.lower()
+    return path.suffix.lower() in IMAGE_EXTENSIONS or name.endswith(".nii.gz")
+
+
+def _is_dicom(path: Path) -> bool:
+    return path.suffix.lower() in DICOM_EXTENSIONS or is_dicom_file(path)
+
+
+def _floats(values) -> List[float]:
+    if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+        values = [values]
+    return [float(v) for v in values]
+
+
+def read_image_info(path: Path) -> Dict[str, Any]:
+    """Header of an NRRD, NIfTI or MetaImage file, without reading voxels."""
+    reader = sitk.ImageFileReader()
+    reader.SetFileName(str(path))
+    reader.ReadImageInformation()
+
+    dimension = reader.GetDimension()
+    pixel_id = reader.GetPixelID()
+    dtype = _SITK_DTYPES.get(pixel_id, sitk.GetPixelIDValueAsString(pixel_id))
+    components = reader.GetNumberOfComponents()
+    direction = np.asarray(reader.GetDirection()).reshape(dimension, dimension)
+    return {
+        "format": "nifti" if ".nii" in path.name.lower() else path.suffix.lower().lstrip("."),
+        "shape": list(reader.GetSize()),
+        "dtype": dtype if components == 1 else f"{dtype}x{components}",
+        "spacing": list(reader.GetSpacing()),
+        "orientation": orientation_code(direction) if dimension == 3 else "",
+        "modality": "",
+        "windows": [],
+    }
+
+
+def read_dicom_info(path: Path) -> Dict[str, Any]:
+    """Header of a DICOM file, read with ``stop_before_pixels``.
+
+    Multi-frame objects take pixel spacing, orientation and window presets
+    from their functional groups when absent at the top level.
+    """
+    ds = pydicom.dcmread(str(path), stop_before_pixels=True)
+    if "Rows" not in ds or "Columns" not in ds:
+        raise ValueError(NOT_AN_IMAGE)
+
+    rows, columns = int(ds.Rows), int(ds.Columns)
+    frames = int(ds.get("NumberOfFrames", 1) or 1)
+    shape = [columns, rows] + ([frames] if frames > 1 else [])
+
+    bits = int(ds.get("BitsAllocated", 16))
+    signed = int(ds.get("PixelRepresentation", 0)) == 1
+    dtype = f"{'int' if signed else 'uint'}{bits}" if bits in (8, 16, 32, 64) else f"{bits}-bit"
+    samples = int(ds.get("SamplesPerPixel", 1))
+    if samples > 1:
+        dtype += f"x{samples}"
+
+    spacing = []
+    measures = _functional_group_item(ds, "PixelMeasuresSequence", "PixelSpacing")
+    if "PixelSpacing" in measures:
+        row_spacing, column_spacing = _floats(measures.PixelSpacing)
+        spacing = [column_spacing, row_spacing]
+        thickness = ds.get("SpacingBetweenSlices") or measures.get("SliceThickness")
+        if frames > 1 and thickness:
+            spacing.append(float(thickness))
+
+    orientation = ""
+    plane = _functional_group_item(ds, "PlaneOrientationSequence", "ImageOrientationPatient")
+    if "ImageOrientationPatient" in plane:
+        cosines = np.asarray(_floats(plane.ImageOrientationPatient))
+        if cosines.shape == (6,):
+            normal = np.cross(cosines[:3], cosines[3:])
+            orientation = orientation_code(np.column_stack([cosines[:3], cosines[3:], normal]))
+
+    windows = []
+    voi = _functional_group_item(ds, "FrameVOILUTSequence", "WindowCenter")
+    if "WindowCenter" in voi and "WindowWidth" in voi:
+        windows = [
+            [center, width]
+            for center, width in zip(_floats(voi.WindowCenter), _floats(voi.WindowWidth))
+        ]
+
+    return {
+        "format": "dicom",
+        "shape": shape,
+        "dtype": dtype,
+        "spacing": spacing,
+        "orientation": orientation,
+        "modality": str(ds.get("Modality", "") or ""),
+        "windows": windows,
+    }
+
+
+def read_info(path: Path) -> Dict[str, Any]:
+    """Summary of one file's header; failures are reported in ``error``."""
+    record: Dict[str, Any] = {"path": str(path)}
+    try:
+        if _is_image_file(path):
+            record.update(read_image_info(path))
+        elif _is_dicom(path):
+            record.update(read_dicom_info(path))
+        else:
+            record["error"] = NOT_AN_IMAGE
+    except Exception as e:
+        record["error"] = str(e) or type(e).__name__
+    return record
+
+
+def iter_files(paths: Sequence[Path]) -> Iterator[Path]:
+    """Files named on the command line, and every file under directories."""
+    for path in paths:
+        if path.is_dir():
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    yield Path(root) / name
+        else:
+            yield path
+
+
+def _format_value(value) -> str:
+    if isinstance(value, list):
+        if value and isinstance(value[0], list):
+            return ";".join("/".join(_format_value(v) for v in pair) for pair in value)
+        return "x".join(_format_value(v) for v in value)
+    if isinstance(value, float):
+        return f"{value:g}"
+    return str(value)
+
+
+def format_row(record: Dict[str, Any]) -> str:
+    """One table line; the path comes last so long paths do not break alignment."""
+    if "error" in record:
+        cells = [f"{'-':<{width}}" for _, _, width in _TABLE_COLUMNS]
+        return " ".join(cells) + f" {record['path']}  ({record['error']})"
+    cells = [
+        f"{_format_value(record.get(key, '')) or '-':<{width}}"
+        for _, key, width in _TABLE_COLUMNS
+    ]
+    return " ".join(cells) + f" {record['path']}"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point of ``pydcmview info``."""
+    parser = argparse.ArgumentParser(
+        prog="pydcmview info",
+        description="Print shape, dtype, spacing, orientation, window presets and "
+                    "modality of image files from their headers, without reading pixel data",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        metavar="path",
+        help="Image files or directories (searched recursively)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print one JSON object per file instead of a table",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_SCAN_WORKERS,
+        help=f"Threads reading headers (default: {DEFAULT_SCAN_WORKERS})",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Also list files under directories that hold no recognized image",
+    )
+    args = parser.parse_args(argv)
+
+    missing = [p for p in args.paths if not p.exists()]
+    if missing:
+        print(f"Error: Path does not exist: {missing[0]}", file=sys.stderr)
+        return 1
+
+    if not args.json:
+        print(" ".join(f"{title:<{width}}" for title, _, width in _TABLE_COLUMNS) + " PATH")
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        # map() yields in input order while later headers are still being read
+        for record in pool.map(read_info, iter_files(args.paths)):
+            skipped = record.get("error") == NOT_AN_IMAGE
+            if skipped and not args.all and Path(record["path"]) not in args.paths:
+                continue
+            failed += "error" in record
+            print(json.dumps(record) if args.json else format_row(record))
+    sys.stdout.flush()
+    return 1 if failed else 0
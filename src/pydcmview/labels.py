@@ -0,0 +1,208 @@
+"""Label-map (segmentation) overlays with compact storage and cached slices."""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable, Optional, Tuple, Union
+
+import numpy as np
+import SimpleITK as sitk
+
+from .colormap import get_colormap_manager
+from .lazy_array import LazyArray
+
+
+# Overlay display modes, in the order the viewer cycles through them
+OVERLAY_MODES = ("fill", "outline")
+
+# Colormap the label colors are drawn from
+LABEL_COLORMAP = "Rainbow"
+
+# Stride through the colormap between consecutive labels, so that
+# neighbouring label values get clearly different colors
+_LABEL_COLOR_STEP = 79
+
+# Run-length storage is used when it is at least this many times smaller
+_RLE_MIN_SAVING = 4
+
+# Number of per-slice overlays kept
+DEFAULT_CACHED_OVERLAYS = 32
+
+
+def _label_dtype(max_label: int):
+    """Smallest unsigned dtype holding labels up to ``max_label``."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_label <= np.iinfo(dtype).max:
+            return dtype
+    raise ValueError(f"Label values up to {max_label} are not supported")
+
+
+class RunLengthLabels(LazyArray):
+    """Label volume stored as runs of non-zero labels.
+
+    Runs never cross leading-axis slices, so reading one slice decodes only
+    its runs. Mostly empty segmentations take a small fraction of their
+    dense size.
+    """
+
+    def __init__(self, array: np.ndarray):
+        super().__init__(array.shape, array.dtype)
+        flat = array.reshape(-1)
+        self._block_items = int(np.prod(self.shape[1:], dtype=np.int64))
+
+        # Run boundaries: value changes and the start of every slice
+        boundaries = np.union1d(
+            np.flatnonzero(np.diff(flat)) + 1,
+            np.arange(0, flat.size, self._block_items),
+        )
+        lengths = np.diff(np.append(boundaries, flat.size))
+        values = flat[boundaries]
+        keep = values != 0
+
+        self.starts = boundaries[keep].astype(np.int64)
+        self.lengths = lengths[keep].astype(np.int64)
+        self.values = values[keep]
+        # Index of the first run of every slice (plus the end)
+        self.slice_runs = np.searchsorted(
+            self.starts, np.arange(self.shape[0] + 1, dtype=np.int64) * self._block_items
+        )
+
+    @property
+    def encoded_bytes(self) -> int:
+        return self.starts.nbytes + self.lengths.nbytes + self.values.nbytes + self.slice_runs.nbytes
+
+    def _read_leading(self, start: int, stop: int) -> np.ndarray:
+        out = np.zeros((stop - start) * self._block_items, dtype=self.dtype)
+        first, last = self.slice_runs[start], self.slice_runs[stop]
+        lengths = self.lengths[first:last]
+        if lengths.size:
+            run_offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+            positions = np.repeat(self.starts[first:last] - start * self._block_items, lengths)
+            positions += np.arange(positions.size) - run_offsets
+            out[positions] = np.repeat(self.values[first:last], lengths)
+        return out.reshape((stop - start,) + self.shape[1:])
+
+
+def compact_labels(array: np.ndarray) -> Union[np.ndarray, RunLengthLabels]:
+    """Store labels in the smallest dtype, run-length encoded if much smaller."""
+    if array.size == 0:
+        return array.astype(np.uint8)
+    if np.issubdtype(array.dtype, np.floating):
+        if not np.array_equal(array, np.rint(array)):
+            raise ValueError("Label map must contain integer labels")
+    if array.min() < 0:
+        raise ValueError("Label map must not contain negative labels")
+
+    dense = array.astype(_label_dtype(int(array.max())), copy=False)
+    if dense.ndim >= 3:
+        encoded = RunLengthLabels(dense)
+        if encoded.encoded_bytes * _RLE_MIN_SAVING <= dense.nbytes:
+            return encoded
+    return np.ascontiguousarray(dense)
+
+
+class LabelMap:
+    """Segmentation volume shown as a colored overlay or as outlines."""
+
+    def __init__(self, labels: Union[np.ndarray, RunLengthLabels], path: Optional[Path] = None):
+        self.labels = labels
+        self.path = path
+        self.shape = tuple(labels.shape)
+        values = labels.values if isinstance(labels, RunLengthLabels) else labels
+        self.max_label = int(values.max()) if values.size else 0
+        present = np.bincount(np.asarray(values).reshape(-1), minlength=self.max_label + 1)
+        self.label_count = int(np.count_nonzero(present[1:]))
+
+        # Label 0 is background and never drawn
+        indices = (np.arange(self.max_label + 1) * _LABEL_COLOR_STEP) % 256
+        self.colors = get_colormap_manager().apply_colormap(
+            indices.astype(np.uint8), LABEL_COLORMAP
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "LabelMap":
+        """Load a label map from any format SimpleITK reads (NIfTI, NRRD, ...)."""
+        path = Path(path)
+        try:
+            array = sitk.GetArrayFromImage(sitk.ReadImage(str(path)))
+        except Exception as e:
+            raise RuntimeError(f"Failed to load label map {path}: {e}")
+        return cls(compact_labels(array), path)
+
+    @property
+    def storage(self) -> str:
+        """Short description of how the labels are stored."""
+        if isinstance(self.labels, RunLengthLabels):
+            return "RLE"
+        return np.dtype(self.labels.dtype).name
+
+    @property
+    def nbytes(self) -> int:
+        if isinstance(self.labels, RunLengthLabels):
+            return self.labels.encoded_bytes + self.labels.resident_bytes
+        return self.labels.nbytes
+
+    def slice_overlay(self, label_slice: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Colors, label mask and label outlines of a 2D label slice."""
+        label_slice = np.asarray(label_slice)
+        colors = self.colors[label_slice]
+        mask = label_slice != 0
+
+        # A labelled pixel is on an outline if a 4-neighbour has another label
+        contour = np.zeros_like(mask)
+        vertical = label_slice[1:, :] != label_slice[:-1, :]
+        horizontal = label_slice[:, 1:] != label_slice[:, :-1]
+        contour[1:, :] |= vertical
+        contour[:-1, :] |= vertical
+        contour[:, 1:] |= horizontal
+        contour[:, :-1] |= horizontal
+        contour &= mask
+        return colors, mask, contour
+
+
+class OverlayCache:
+    """LRU cache of per-slice overlays keyed by slice and reduction factor."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHED_OVERLAYS):
+        self.max_entries = max_entries
+        self._overlays: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable):
+        overlay = self._overlays.get(key)
+        if overlay is not None:
+            self._overlays.move_to_end(key)
+        return overlay
+
+    def put(self, key: Hashable, overlay: tuple):
+        self._overlays[key] = overlay
+        while len(self._overlays) > self.max_entries:
+            self._overlays.popitem(last=False)
+
+    def clear(self):
+        self._overlays.clear()
+
+
+def blend_overlay(
+    rgb: np.ndarray,
+    overlay: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    top: int,
+    left: int,
+    mode: str,
+    opacity: float,
+) -> np.ndarray:
+    """Draw an overlay onto ``rgb`` in place, starting at overlay pixel (top, left)."""
+    colors, mask, contour = overlay
+    height = min(rgb.shape[0], max(0, colors.shape[0] - top))
+    width = min(rgb.shape[1], max(0, colors.shape[1] - left))
+    if height == 0 or width == 0:
+        return rgb
+
+    window = (slice(top, top + height), slice(left, left + width))
+    select = (contour if mode == "outline" else mask)[window]
+    target = rgb[:height, :width]
+    colors = colors[window][select]
+    if mode == "outline" or opacity >= 1.0:
+        target[select] = colors
+    else:
+        blended = target[select] * (1.0 - opacity) + colors * opacity
+        target[select] = blended.astype(np.uint8)
+    return rgb
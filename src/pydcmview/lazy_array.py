@@ -0,0 +1,123 @@
+"""Array-like volumes whose voxels are read on demand."""
+
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class LazyArray:
+    """Read-only, numpy-like volume that loads data only when indexed.
+
+    Subclasses implement ``_read_leading(start, stop)`` returning the C-ordered
+    block ``array[start:stop]``. Indexing that fixes the leading axis only
+    touches that part of the volume; any other access materializes the full
+    array once and reuses it.
+
+    With ``block_cache_bytes``, blocks read for a single leading index (a
+    slice of 3D data, a timepoint of 4D data) are kept in an LRU cache of
+    that size, so moving through a timepoint reads it only once.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype, block_cache_bytes: int = 0):
+        self.shape = tuple(int(s) for s in shape)
+        self.dtype = np.dtype(dtype)
+        self._full: Optional[np.ndarray] = None
+        self._lock = threading.RLock()
+        self.block_cache_bytes = block_cache_bytes
+        self._blocks: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._block_bytes = 0
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+    @property
+    def resident_bytes(self) -> int:
+        """Bytes of voxel data currently held in memory."""
+        return (self._full.nbytes if self._full is not None else 0) + self._block_bytes
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def _read_leading(self, start: int, stop: int) -> np.ndarray:
+        """Read ``array[start:stop]`` along the leading axis."""
+        raise NotImplementedError
+
+    def __getitem__(self, key):
+        if self._full is not None:
+            return self._full[key]
+
+        if not isinstance(key, tuple):
+            key = (key,)
+
+        lead = key[0] if key else slice(None)
+        rest = key[1:]
+
+        if isinstance(lead, (int, np.integer)):
+            index = int(lead)
+            if index < 0:
+                index += self.shape[0]
+            if not 0 <= index < self.shape[0]:
+                raise IndexError(f"index {lead} out of range for axis 0")
+            block = self._leading_block(index)
+            return block[rest] if rest else block
+
+        if isinstance(lead, slice) and lead.step in (None, 1):
+            start, stop, _ = lead.indices(self.shape[0])
+            block = self._read_leading(start, max(start, stop))
+            return block[(slice(None),) + rest] if rest else block
+
+        return self.materialize()[key]
+
+    def _leading_block(self, index: int) -> np.ndarray:
+        """``array[index]``, from the block cache when enabled."""
+        if self.block_cache_bytes <= 0:
+            return self._read_leading(index, index + 1)[0]
+        with self._lock:
+            block = self._blocks.get(index)
+            if block is not None:
+                self._blocks.move_to_end(index)
+                return block
+
+        block = self._read_leading(index, index + 1)[0]
+        block.flags.writeable = False
+        with self._lock:
+            if index not in self._blocks and block.nbytes <= self.block_cache_bytes:
+                self._blocks[index] = block
+                self._block_bytes += block.nbytes
+                while self._block_bytes > self.block_cache_bytes:
+                    _, evicted = self._blocks.popitem(last=False)
+                    self._block_bytes -= evicted.nbytes
+        return block
+
+    def materialize(self) -> np.ndarray:
+        """Load and cache the entire volume."""
+        with self._lock:
+            if self._full is None:
+                self._full = self._read_leading(0, self.shape[0])
+            return self._full
+
+    def release(self):
+        """Drop the materialized copy and cached blocks, if any."""
+        with self._lock:
+            self._full = None
+            self._blocks.clear()
+            self._block_bytes = 0
+
+    def preview(self) -> np.ndarray:
+        """Return a representative block (the middle leading index)."""
+        return self[self.shape[0] // 2]
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.materialize()
+        return array.astype(dtype) if dtype is not None else array
@@ -5,44 +5,146 @@ import sys
 import argparse
 from pathlib import Path
 from .viewer import ImageViewer
+from .fusion import DEFAULT_FUSION_COLORMAP
+from .chunked import is_chunked_store
+from .dicom_index import DEFAULT_SCAN_WORKERS, DicomIndex, find_dicomdir, read_dicomdir
+from .session import DEFAULT_MEMORY_BUDGET, parse_size
+
+
+def _load_directory_series(path: Path, index: DicomIndex, workers: int) -> list:
+    """Find the DICOM series under a directory."""
+    # A DICOMDIR lists every series of the media, so no file needs opening
+    dicomdir = find_dicomdir(path)
+    if dicomdir is not None:
+        try:
+            series = read_dicomdir(dicomdir)
+        except Exception as e:
+            print(f"Warning: Could not read {dicomdir} ({e}), scanning instead", file=sys.stderr)
+            series = []
+        if series:
+            return series
+
+    print(f"Scanning {path} for DICOM series...", file=sys.stderr)
+    series = index.scan(path, workers=workers)
+    if not series:
+        print(f"Error: No DICOM files found in directory: {path}", file=sys.stderr)
+        sys.exit(1)
+    return series
+
+
+def _resolve_sources(paths, workers: int) -> list:
+    """Resolve command-line paths to image files and DICOM series to open."""
+    sources = []
+    index = None
+    for path in paths:
+        if not path.exists():
+            print(f"Error: Path does not exist: {path}", file=sys.stderr)
+            sys.exit(1)
+        
+        # Chunked stores are directories opened as one volume
+        if is_chunked_store(path):
+            sources.append(path)
+        # If it's a directory, recursively index the DICOM series in it
+        elif path.is_dir():
+            if index is None:
+                index = DicomIndex()
+            sources.extend(_load_directory_series(path, index, workers))
+        else:
+            sources.append(path)
+    
+    if index is not None:
+        index.close()
+    return sources
 
 
 def main():
     """Main entry point for the application."""
+    argv = sys.argv[1:]
+    # "pydcmview info ..." prints file headers instead of opening the viewer
+    if argv and argv[0] == "info" and not Path("info").exists():
+        from .info import main as info_main
+
+        sys.exit(info_main(argv[1:]))
+
     parser = argparse.ArgumentParser(
-        description="Terminal-based medical image viewer for DICOM, NRRD, and Nifti formats"
+        description="Terminal-based medical image viewer for DICOM, NRRD, and Nifti formats",
+        epilog="Run 'pydcmview info <paths...>' to print image headers without opening the viewer.",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        metavar="path",
+        help="Path to image file or DICOM directory (several can be given; switch with n/N)"
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=parse_size,
+        default=DEFAULT_MEMORY_BUDGET,
+        help="Memory for pixel data of open volumes, e.g. 512M or 8G (default: 4G). "
+             "Least recently viewed volumes are unloaded beyond this."
+    )
+    parser.add_argument(
+        "--scan-workers",
+        type=int,
+        default=DEFAULT_SCAN_WORKERS,
+        help=f"Threads reading DICOM headers when indexing directories (default: {DEFAULT_SCAN_WORKERS})"
+    )
+    parser.add_argument(
+        "--shared-memory",
+        action="store_true",
+        help="Share loaded volumes with other pydcmview processes on this machine: "
+             "the first viewer publishes a volume, later ones attach to it read-only. "
+             "Lazily read volumes (.nii.gz, 4D .nii, multi-frame DICOM, Zarr) are not shared"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Reload files rewritten while open (changed DICOM instances only), "
+             "keeping the slice, window/level and zoom"
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Show the first two volumes side by side with linked slice, zoom, scroll "
+             "and window/level"
+    )
+    parser.add_argument(
+        "--labels",
+        type=Path,
+        help="Label map (segmentation) to overlay on volumes of the same shape"
+    )
+    parser.add_argument(
+        "--fuse",
+        type=Path,
+        help="Second volume (e.g. PET) to blend over the displayed one, aligned by physical coordinates"
     )
     parser.add_argument(
-        "path",
-        help="Path to image file or DICOM directory"
+        "--fuse-colormap",
+        default=DEFAULT_FUSION_COLORMAP,
+        help=f"Colormap of the fused volume (default: {DEFAULT_FUSION_COLORMAP})"
     )
     
     args = parser.parse_args()
     
-    # Check if path exists
-    path = Path(args.path)
-    if not path.exists():
-        print(f"Error: Path does not exist: {path}", file=sys.stderr)
-        sys.exit(1)
-    
-    # If it's a directory, look for DICOM files
-    if path.is_dir():
-        # Look for common DICOM extensions
-        dicom_files = []
-        for ext in ['*.dcm', '*.dicom', '*.DCM', '*.DICOM']:
-            dicom_files.extend(path.glob(ext))
-        
-        if not dicom_files:
-            print(f"Error: No DICOM files found in directory: {path}", file=sys.stderr)
-            sys.exit(1)
-        
-        # Use the first DICOM file found
-        image_path = dicom_files[0]
-    else:
-        image_path = path
+    paths = [Path(p) for p in args.paths]
+    sources = _resolve_sources(paths, args.scan_workers)
     
     try:
-        viewer = ImageViewer(image_path)
+        # Offer the series browser when a directory held several series
+        show_browser = (
+            any(p.is_dir() and not is_chunked_store(p) for p in paths) and len(sources) > 1
+        )
+        viewer = ImageViewer(
+            sources,
+            memory_budget=args.memory_budget,
+            show_browser=show_browser,
+            share_memory=args.shared_memory,
+            label_path=args.labels,
+            fusion_path=args.fuse,
+            fusion_colormap=args.fuse_colormap,
+            watch=args.watch,
+            compare=args.compare,
+        )
         viewer.run()
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -50,4 +152,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
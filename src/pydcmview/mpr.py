@@ -0,0 +1,123 @@
+"""Three-plane (MPR) layout of a 3D volume, linked by one crosshair point."""
+
+from functools import partial
+from typing import Callable, Dict, Hashable, Sequence, Set, Tuple
+
+from PIL import Image as PILImage, ImageDraw
+
+from .render import render_views
+
+
+# Pixels between neighbouring planes of the composed frame
+PLANE_GAP = 8
+
+# Outline of the plane that navigation keys act on
+ACTIVE_OUTLINE = (255, 255, 0)
+
+# Renders the slice at ``index`` across ``axis`` to fit ``box`` (width, height)
+PlaneRenderer = Callable[[int, int, Tuple[int, int]], PILImage.Image]
+
+
+def plane_axes(axis: int) -> Tuple[int, int]:
+    """Row and column axes of the plane cut across ``axis``."""
+    rows, cols = (a for a in range(3) if a != axis)
+    return rows, cols
+
+
+class MPRLayout:
+    """Crosshair point and per-plane render cache of the three-plane layout.
+
+    Plane ``a`` shows the slice through ``point`` across axis ``a``, so
+    every plane is cut at the point and the other two planes show where.
+    Rendered planes are cached by their own slice index and the display
+    state: moving the point re-renders only the planes whose slice index
+    changed, while the rest just get new crosshair lines. Planes that do
+    need rendering are rendered concurrently.
+    """
+
+    def __init__(self, shape: Sequence[int], point: Sequence[int]):
+        self.shape = tuple(int(n) for n in shape)
+        self.point = [min(max(0, int(p)), n - 1) for p, n in zip(point, self.shape)]
+        # Plane whose slice the navigation keys move
+        self.active = 0
+        # Planes rendered for the last frame
+        self.rendered = 0
+        self._planes: Dict[int, Tuple[Hashable, PILImage.Image]] = {}
+
+    def move(self, axis: int, delta: int):
+        """Move the point along one volume axis."""
+        self.point[axis] = min(max(0, self.point[axis] + delta), self.shape[axis] - 1)
+
+    def move_in_plane(self, row_delta: int, col_delta: int):
+        """Move the point within the active plane."""
+        rows, cols = plane_axes(self.active)
+        self.move(rows, row_delta)
+        self.move(cols, col_delta)
+
+    def cycle_active(self, step: int = 1):
+        self.active = (self.active + step) % 3
+
+    def frame(
+        self,
+        render_plane: PlaneRenderer,
+        key: Hashable,
+        box: Tuple[int, int],
+        flipped: Set[int],
+        opacity: float,
+    ) -> PILImage.Image:
+        """Compose the three planes side by side with the linked crosshair.
+
+        Args:
+            render_plane: Renders one plane, called only for stale planes
+            key: Display state the rendered pixels depend on
+            box: Size (width, height) available to each plane
+            flipped: Axes shown reversed
+            opacity: Crosshair line opacity
+        """
+        plane_keys = {axis: (key, axis, self.point[axis], box) for axis in range(3)}
+        stale = [
+            axis for axis in range(3) if self._planes.get(axis, (None,))[0] != plane_keys[axis]
+        ]
+        images = render_views(
+            [partial(render_plane, axis, self.point[axis], box) for axis in stale]
+        )
+        for axis, image in zip(stale, images):
+            self._planes[axis] = (plane_keys[axis], image)
+        self.rendered = len(stale)
+
+        planes = [self._planes[axis][1] for axis in range(3)]
+        width = sum(plane.width for plane in planes) + PLANE_GAP * 2
+        height = max(plane.height for plane in planes)
+        canvas = PILImage.new("RGBA", (width, height), (0, 0, 0, 255))
+        overlay = PILImage.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+        line = (255, 0, 0, int(opacity * 255))
+
+        left = 0
+        for axis, plane in enumerate(planes):
+            top = (height - plane.height) // 2
+            canvas.paste(plane, (left, top))
+
+            rows, cols = plane_axes(axis)
+            row, col = self.point[rows], self.point[cols]
+            if rows in flipped:
+                row = self.shape[rows] - 1 - row
+            if cols in flipped:
+                col = self.shape[cols] - 1 - col
+            y = top + int((row + 0.5) * plane.height / self.shape[rows])
+            x = left + int((col + 0.5) * plane.width / self.shape[cols])
+            draw.line([(left, y), (left + plane.width - 1, y)], fill=line, width=1)
+            draw.line([(x, top), (x, top + plane.height - 1)], fill=line, width=1)
+
+            if axis == self.active:
+                draw.rectangle(
+                    [left, top, left + plane.width - 1, top + plane.height - 1],
+                    outline=ACTIVE_OUTLINE + (255,),
+                    width=1,
+                )
+            left += plane.width + PLANE_GAP
+
+        return PILImage.alpha_composite(canvas, overlay).convert("RGB")
+
+    def clear_cache(self):
+        self._planes.clear()
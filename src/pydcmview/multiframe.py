@@ -0,0 +1,316 @@
+"""Lazy, parallel frame decoding for multi-frame DICOM objects."""
+
+import os
+import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pydicom
+from pydicom.encaps import encapsulate
+
+try:
+    from pydicom.pixels import get_decoder
+except ImportError:  # pydicom < 3: compressed frames are left to SimpleITK
+    get_decoder = None
+
+from .lazy_array import LazyArray
+
+
+# Bound on decoded frames kept in memory per volume
+DEFAULT_FRAME_CACHE_BYTES = 256 * 1024**2
+
+# Threads decoding frames of one volume
+DEFAULT_DECODE_WORKERS = min(8, os.cpu_count() or 1)
+
+# Frames decoded in the background on each side of a requested frame
+PREFETCH_FRAMES = 4
+
+_ITEM_TAG = 0xE000FFFE
+_SEQUENCE_DELIMITER_TAG = 0xE0DDFFFE
+
+# Byte pairs that start a new frame in fragmented JPEG-family data
+_FRAME_START_MARKERS = (b"\xff\xd8", b"\xff\x4f")
+
+# Span of a fragment in the file: (offset of its data, length)
+Span = Tuple[int, int]
+
+
+def _read_fragments(f, offset: int) -> Tuple[bytes, List[Tuple[int, Span]]]:
+    """Walk the items of encapsulated pixel data without reading fragments.
+
+    Returns:
+        The Basic Offset Table and, for each fragment, its item offset
+        relative to the first fragment item and its data span in the file
+    """
+    f.seek(offset)
+    tag, length = struct.unpack("<2I", f.read(8))
+    if tag != _ITEM_TAG:
+        raise ValueError("Encapsulated pixel data does not start with an item")
+    basic_offsets = f.read(length)
+
+    first_item = offset + 8 + length
+    fragments = []
+    position = first_item
+    while True:
+        f.seek(position)
+        header = f.read(8)
+        if len(header) < 8:
+            break
+        tag, length = struct.unpack("<2I", header)
+        if tag == _SEQUENCE_DELIMITER_TAG:
+            break
+        if tag != _ITEM_TAG:
+            raise ValueError("Unexpected element in encapsulated pixel data")
+        fragments.append((position - first_item, (position + 8, length)))
+        position += 8 + length
+    return basic_offsets, fragments
+
+
+def _group_by_offsets(
+    fragments: List[Tuple[int, Span]], offsets: List[int]
+) -> List[List[Span]]:
+    """Assign fragments to frames given each frame's first item offset."""
+    frames: List[List[Span]] = [[] for _ in offsets]
+    frame = 0
+    for item_offset, span in fragments:
+        while frame + 1 < len(offsets) and item_offset >= offsets[frame + 1]:
+            frame += 1
+        frames[frame].append(span)
+    return frames
+
+
+def _frame_spans(f, ds, offset: int, frames: int) -> Optional[List[List[Span]]]:
+    """Locate the fragments of every frame of encapsulated pixel data.
+
+    The Extended Offset Table or the Basic Offset Table is used when
+    present; otherwise frames are matched one fragment each, or split at
+    JPEG start-of-image markers.
+    """
+    basic_offsets, fragments = _read_fragments(f, offset)
+    if not fragments:
+        return None
+
+    if "ExtendedOffsetTable" in ds:
+        offsets = np.frombuffer(ds.ExtendedOffsetTable, dtype="<u8").tolist()
+    elif basic_offsets:
+        offsets = list(struct.unpack(f"<{len(basic_offsets) // 4}I", basic_offsets))
+    elif len(fragments) == frames:
+        return [[span] for _, span in fragments]
+    elif frames == 1:
+        return [[span for _, span in fragments]]
+    else:
+        offsets = []
+        for item_offset, (data_offset, _) in fragments:
+            f.seek(data_offset)
+            if f.read(2) in _FRAME_START_MARKERS:
+                offsets.append(item_offset)
+        if not offsets or offsets[0] != 0:
+            return None
+
+    if len(offsets) != frames:
+        return None
+    return _group_by_offsets(fragments, offsets)
+
+
+class MultiFrameDicomVolume(LazyArray):
+    """Frames of a single multi-frame DICOM file, decoded on demand.
+
+    Frame locations come from the offset tables (or the fragment layout),
+    so showing one frame reads and decodes only that frame. Decoding runs
+    on a thread pool: ranges are decoded in parallel, frames next to a
+    requested one are prefetched in the background, and decoded frames
+    are kept in an LRU cache bounded by ``cache_bytes``.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        dataset,
+        pixel_offset: int,
+        spans: Optional[List[List[Span]]],
+        dtype,
+        workers: int = DEFAULT_DECODE_WORKERS,
+        cache_bytes: int = DEFAULT_FRAME_CACHE_BYTES,
+    ):
+        self.path = Path(path)
+        self.dataset = dataset
+        self.frames = int(dataset.NumberOfFrames)
+        self.rows = int(dataset.Rows)
+        self.columns = int(dataset.Columns)
+        super().__init__((self.frames, self.rows, self.columns), np.dtype(dtype).newbyteorder("="))
+        self.stored_dtype = np.dtype(dtype)
+        self.pixel_offset = pixel_offset
+        self.spans = spans
+        self.transfer_syntax = dataset.file_meta.TransferSyntaxUID
+        self.cache_bytes = cache_bytes
+
+        self._file = open(self.path, "rb")
+        self._file_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._cache: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._cached_bytes = 0
+        self._pending: Dict[int, Future] = {}
+        self._cache_lock = threading.Lock()
+
+    @property
+    def resident_bytes(self) -> int:
+        return super().resident_bytes + self._cached_bytes
+
+    def _read_span(self, offset: int, length: int) -> bytes:
+        with self._file_lock:
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    def _decode_frame(self, index: int) -> np.ndarray:
+        """Read and decode one frame from the file."""
+        if self.spans is None:
+            size = self.rows * self.columns * self.stored_dtype.itemsize
+            raw = self._read_span(self.pixel_offset + index * size, size)
+            frame = np.frombuffer(raw, dtype=self.stored_dtype)
+            return frame.reshape(self.rows, self.columns).astype(self.dtype)
+
+        data = b"".join(self._read_span(*span) for span in self.spans[index])
+        ds = self.dataset
+        frame, _ = get_decoder(self.transfer_syntax).as_array(
+            encapsulate([data]),
+            rows=self.rows,
+            columns=self.columns,
+            number_of_frames=1,
+            samples_per_pixel=1,
+            bits_allocated=int(ds.BitsAllocated),
+            bits_stored=int(ds.BitsStored),
+            pixel_representation=int(ds.PixelRepresentation),
+            photometric_interpretation=str(ds.PhotometricInterpretation),
+            pixel_keyword="PixelData",
+        )
+        return frame.reshape(self.rows, self.columns).astype(self.dtype, copy=False)
+
+    def _decode_and_cache(self, index: int) -> np.ndarray:
+        frame = None
+        try:
+            frame = self._decode_frame(index)
+            return frame
+        finally:
+            with self._cache_lock:
+                self._pending.pop(index, None)
+                if frame is not None and index not in self._cache:
+                    self._cache[index] = frame
+                    self._cached_bytes += frame.nbytes
+                    while self._cached_bytes > self.cache_bytes and len(self._cache) > 1:
+                        _, evicted = self._cache.popitem(last=False)
+                        self._cached_bytes -= evicted.nbytes
+
+    def _request(self, index: int) -> Union[np.ndarray, Future]:
+        """Return a cached frame, or the future decoding it."""
+        with self._cache_lock:
+            frame = self._cache.get(index)
+            if frame is not None:
+                self._cache.move_to_end(index)
+                return frame
+            future = self._pending.get(index)
+            if future is None:
+                future = self._pool.submit(self._decode_and_cache, index)
+                self._pending[index] = future
+            return future
+
+    def prefetch(self, start: int, stop: int):
+        """Decode frames ``start:stop`` in the background."""
+        for index in range(max(0, start), min(self.frames, stop)):
+            self._request(index)
+
+    def _read_leading(self, start: int, stop: int) -> np.ndarray:
+        requests = [self._request(i) for i in range(start, stop)]
+        if stop - start == 1:
+            self.prefetch(start - PREFETCH_FRAMES, start)
+            self.prefetch(stop, stop + PREFETCH_FRAMES)
+
+        block = np.empty((stop - start, self.rows, self.columns), dtype=self.dtype)
+        for i, request in enumerate(requests):
+            block[i] = request.result() if isinstance(request, Future) else request
+        return block
+
+    def release(self):
+        super().release()
+        with self._cache_lock:
+            self._cache.clear()
+            self._cached_bytes = 0
+
+    def close(self):
+        """Stop decoding and close the file."""
+        # Drop queued prefetches (shutdown's cancel_futures needs Python 3.9)
+        with self._cache_lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            future.cancel()
+        self._pool.shutdown(wait=True)
+        self._file.close()
+
+
+def open_multiframe_dicom(
+    path: Union[str, Path], dataset=None
+) -> Optional[MultiFrameDicomVolume]:
+    """Open a multi-frame DICOM file for lazy frame access.
+
+    Args:
+        path: DICOM file
+        dataset: The file's dataset read with deferred pixel data, if
+            already available
+
+    Returns:
+        A lazy volume, or None for single-frame objects and pixel data
+        the lazy reader does not handle (color, bit-packed, or without an
+        available decoder); the caller should fall back to SimpleITK.
+    """
+    if dataset is None:
+        dataset = pydicom.dcmread(str(path), defer_size=1024)
+
+    try:
+        frames = int(dataset.get("NumberOfFrames", 1) or 1)
+        samples = int(dataset.get("SamplesPerPixel", 1))
+        bits = int(dataset.BitsAllocated)
+        signed = int(dataset.get("PixelRepresentation", 0)) == 1
+        transfer_syntax = dataset.file_meta.TransferSyntaxUID
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+    if frames <= 1 or samples != 1 or bits not in (8, 16, 32):
+        return None
+    if "PixelData" not in dataset:
+        return None
+
+    try:
+        element = dataset.get_item("PixelData", keep_deferred=True)
+    except TypeError:  # pydicom < 3 never converts in get_item
+        element = dataset.get_item("PixelData")
+    pixel_offset = getattr(element, "value_tell", None)
+    if pixel_offset is None:
+        return None
+
+    dtype = np.dtype(f"{'i' if signed else 'u'}{bits // 8}")
+    spans = None
+    if transfer_syntax.is_encapsulated:
+        if get_decoder is None or not get_decoder(transfer_syntax).is_available:
+            return None
+        try:
+            with open(path, "rb") as f:
+                spans = _frame_spans(f, dataset, pixel_offset, frames)
+        except (OSError, ValueError, struct.error):
+            return None
+        if spans is None:
+            return None
+    else:
+        if transfer_syntax == pydicom.uid.DeflatedExplicitVRLittleEndian:
+            return None
+        dtype = dtype.newbyteorder(">" if not transfer_syntax.is_little_endian else "<")
+
+    volume = MultiFrameDicomVolume(path, dataset, pixel_offset, spans, dtype)
+    try:
+        # Decode the first frame now so unsupported data falls back early
+        volume[0]
+    except Exception:
+        volume.close()
+        return None
+    return volume
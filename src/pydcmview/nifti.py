@@ -0,0 +1,171 @@
+"""Lazy readers for NIfTI volumes: gzip-compressed, and uncompressed 4D+."""
+
+import struct
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from .gzip_index import IndexedGzipReader
+from .lazy_array import LazyArray
+
+
+# NIfTI datatype codes supported by the lazy reader
+NIFTI_DTYPES = {
+    2: np.uint8,
+    4: np.int16,
+    8: np.int32,
+    16: np.float32,
+    64: np.float64,
+    256: np.int8,
+    512: np.uint16,
+    768: np.uint32,
+    1024: np.int64,
+    1280: np.uint64,
+}
+
+# Bytes of decoded leading-axis blocks (timepoints of 4D data) kept in memory
+DEFAULT_BLOCK_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class NiftiHeader:
+    """Subset of the NIfTI-1/NIfTI-2 header needed to locate voxel data."""
+
+    def __init__(self, raw: bytes):
+        if len(raw) < 348:
+            raise ValueError("Truncated NIfTI header")
+
+        for endian in ("<", ">"):
+            sizeof_hdr = struct.unpack(endian + "i", raw[:4])[0]
+            if sizeof_hdr in (348, 540):
+                break
+        else:
+            raise ValueError("Not a NIfTI file")
+
+        self.endian = endian
+        self.version = 1 if sizeof_hdr == 348 else 2
+
+        if self.version == 1:
+            dim = struct.unpack(endian + "8h", raw[40:56])
+            self.datatype = struct.unpack(endian + "h", raw[70:72])[0]
+            self.pixdim = struct.unpack(endian + "8f", raw[76:108])
+            self.vox_offset = int(struct.unpack(endian + "f", raw[108:112])[0])
+            self.scl_slope, self.scl_inter = struct.unpack(endian + "2f", raw[112:120])
+            self.cal_max, self.cal_min = struct.unpack(endian + "2f", raw[124:132])
+        else:
+            if len(raw) < 540:
+                raise ValueError("Truncated NIfTI-2 header")
+            self.datatype = struct.unpack(endian + "h", raw[12:14])[0]
+            dim = struct.unpack(endian + "8q", raw[16:80])
+            self.pixdim = struct.unpack(endian + "8d", raw[104:168])
+            self.vox_offset = struct.unpack(endian + "q", raw[168:176])[0]
+            self.scl_slope, self.scl_inter = struct.unpack(endian + "2d", raw[176:192])
+            self.cal_max, self.cal_min = struct.unpack(endian + "2d", raw[192:208])
+
+        ndim = max(1, min(int(dim[0]), 7))
+        dims = [int(d) for d in dim[1 : ndim + 1]]
+        # Match SimpleITK, which drops trailing singleton dimensions
+        while len(dims) > 2 and dims[-1] == 1:
+            dims.pop()
+        self.dims = tuple(dims)
+
+    @property
+    def dtype(self) -> Optional[np.dtype]:
+        """Stored voxel dtype, or None for unsupported datatypes."""
+        base = NIFTI_DTYPES.get(self.datatype)
+        if base is None:
+            return None
+        return np.dtype(base).newbyteorder(self.endian)
+
+    @property
+    def has_scaling(self) -> bool:
+        return self.scl_slope != 0.0 and (
+            self.scl_slope != 1.0 or self.scl_inter != 0.0
+        )
+
+
+class FileRangeReader:
+    """Positional reads from an uncompressed file, like ``IndexedGzipReader``."""
+
+    def __init__(self, file_path: Union[str, Path]):
+        self._file = open(file_path, "rb")
+        self._lock = threading.Lock()
+
+    def read(self, offset: int, size: int) -> bytes:
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(size)
+
+    def close(self):
+        self._file.close()
+
+
+class NiftiVolume(LazyArray):
+    """NIfTI volume read only over the span covering the requested slices.
+
+    The array follows SimpleITK's axis order, i.e. the reverse of the NIfTI
+    ``dim`` order, so indexing the leading axis selects a slice (3D) or a
+    timepoint (4D) that is contiguous in the file. Decoded timepoints are
+    kept in the block cache, so stepping through one reads it only once.
+    Values are returned as stored; ``scl_slope``/``scl_inter`` are left to
+    the caller.
+    """
+
+    def __init__(self, reader, header: NiftiHeader):
+        self.reader = reader
+        self.header = header
+        self.stored_dtype = header.dtype
+        super().__init__(
+            tuple(reversed(header.dims)),
+            self.stored_dtype.newbyteorder("="),
+            block_cache_bytes=DEFAULT_BLOCK_CACHE_BYTES if len(header.dims) > 3 else 0,
+        )
+        self._block_items = int(np.prod(self.shape[1:], dtype=np.int64))
+
+    def _read_leading(self, start: int, stop: int) -> np.ndarray:
+        count = (stop - start) * self._block_items
+        itemsize = self.stored_dtype.itemsize
+        offset = self.header.vox_offset + start * self._block_items * itemsize
+        raw = self.reader.read(offset, count * itemsize)
+        if len(raw) != count * itemsize:
+            raise RuntimeError("Unexpected end of NIfTI data")
+
+        block = np.frombuffer(raw, dtype=self.stored_dtype).reshape(
+            (stop - start,) + self.shape[1:]
+        )
+        return block.astype(self.dtype)
+
+
+def _open_volume(reader, min_dims: int) -> Optional[NiftiVolume]:
+    try:
+        header = NiftiHeader(reader.read(0, 540))
+    except ValueError:
+        reader.close()
+        return None
+
+    if header.dtype is None or len(header.dims) < min_dims:
+        reader.close()
+        return None
+
+    return NiftiVolume(reader, header)
+
+
+def open_nifti_gz(file_path: Union[str, Path]) -> Optional[NiftiVolume]:
+    """Open a ``.nii.gz`` file lazily.
+
+    Returns:
+        A lazy volume, or None if the header uses a datatype the lazy reader
+        does not handle (the caller should fall back to SimpleITK).
+    """
+    return _open_volume(IndexedGzipReader(file_path), min_dims=2)
+
+
+def open_nifti(file_path: Union[str, Path]) -> Optional[NiftiVolume]:
+    """Open an uncompressed ``.nii`` file with four or more dimensions lazily.
+
+    Returns:
+        A lazy volume, or None for 2D/3D files, which SimpleITK reads whole,
+        and for datatypes the lazy reader does not handle.
+    """
+    return _open_volume(FileRangeReader(file_path), min_dims=4)
@@ -0,0 +1,94 @@
+"""Render pipeline as a chain of memoized stages.
+
+A frame is produced by a fixed sequence of stages, each of which keeps its
+last output together with the key it was computed for. A stage's key
+contains the key of the stage before it plus its own parameters, so a
+change to any input reruns the stage that reads it and every stage after
+it, while the stages before it return their kept output.
+"""
+
+from typing import Callable, Dict, Hashable, Tuple, TypeVar
+
+
+# Stages of a single-pane frame, in order
+STAGES = (
+    "extract",  # 2D slice from the volume (or a multiscale level)
+    "orient",  # flips of the displayed axes
+    "window",  # window/level or equalization to gray levels, reduced
+    "colormap",  # gray levels to RGB
+    "blend",  # fused volume and label overlay
+    "zoom",  # zoom, pixel aspect and scroll crop
+    "overlay",  # crosshair and ROI outline
+    "encode",  # hand-off to the terminal graphics widget
+)
+
+T = TypeVar("T")
+
+_EMPTY = object()
+
+
+class Stage:
+    """One pipeline step that remembers its last input key and output."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._key: Hashable = _EMPTY
+        self._value = None
+
+    def run(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the kept output if ``key`` is unchanged, else compute it.
+
+        A key of None is never matched, for inputs that cannot be keyed.
+        """
+        if key is not None and key == self._key:
+            self.hits += 1
+            return self._value
+        self.misses += 1
+        value = compute()
+        self._key, self._value = key, value
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        runs = self.hits + self.misses
+        return self.hits / runs if runs else 0.0
+
+    def clear(self):
+        self._key, self._value = _EMPTY, None
+
+
+class RenderPipeline:
+    """The memoized stages of one pane.
+
+    Stages are not locked: a pipeline is driven by one thread at a time
+    (the compared pane has a pipeline of its own).
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Stage] = {name: Stage(name) for name in STAGES}
+
+    def run(self, stage: str, key: Hashable, compute: Callable[[], T]) -> T:
+        return self.stages[stage].run(key, compute)
+
+    def stats(self) -> Dict[str, Tuple[int, int]]:
+        """(hits, misses) of every stage, in pipeline order."""
+        return {name: (stage.hits, stage.misses) for name, stage in self.stages.items()}
+
+    def summary(self) -> str:
+        """One-line hit rates of the stages that have run, e.g. for profiling output."""
+        return " ".join(
+            f"{name} {stage.hit_rate:.0%}"
+            for name, stage in self.stages.items()
+            if stage.hits + stage.misses
+        )
+
+    def reset_stats(self):
+        for stage in self.stages.values():
+            stage.hits = stage.misses = 0
+
+    def clear(self):
+        """Drop every kept output, e.g. after the volume was reloaded."""
+        for stage in self.stages.values():
+            stage.clear()
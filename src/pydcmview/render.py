@@ -0,0 +1,201 @@
+"""Rendering helpers shared by the viewer's display pipeline."""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+import numpy as np
+
+
+# Threads rendering row bands of one slice
+RENDER_WORKERS = os.cpu_count() or 1
+
+# Slices with fewer pixels are rendered on the calling thread
+PARALLEL_MIN_PIXELS = 1024 * 1024
+
+# Threads rendering the independent views of one frame (MPR planes, compared panes)
+VIEW_WORKERS = 3
+
+# Smallest band worth handing to another thread
+MIN_BAND_ROWS = 64
+
+# Input idle time (seconds) after which a preview is refined to full quality
+REFINE_DELAY = 0.1
+
+# Period (seconds) over which the input rate is measured
+RATE_WINDOW = 0.5
+
+# Preview stride by input rate (events per second), fastest first
+PREVIEW_STEPS = ((20.0, 4), (8.0, 2))
+
+# Slices with fewer pixels are always rendered at full quality
+PREVIEW_MIN_PIXELS = 512 * 512
+
+_pool: Optional[ThreadPoolExecutor] = None
+_view_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+T = TypeVar("T")
+
+
+def block_mean(array: np.ndarray, factor: int) -> np.ndarray:
+    """Downsample a 2D array by averaging ``factor`` x ``factor`` blocks.
+
+    Edge blocks that do not fill a whole block are averaged over the pixels
+    they contain, so no source data is dropped.
+
+    Args:
+        array: 2D array to reduce
+        factor: Integer reduction factor along both axes
+
+    Returns:
+        Reduced array with the same dtype as the input
+    """
+    if factor <= 1:
+        return array
+
+    height, width = array.shape[:2]
+    out_h = -(-height // factor)
+    out_w = -(-width // factor)
+
+    # Sum full blocks along each axis, then divide by the real block extents
+    sums = np.add.reduceat(array, np.arange(0, height, factor), axis=0, dtype=np.float32)
+    sums = np.add.reduceat(sums, np.arange(0, width, factor), axis=1)
+
+    rows = np.full(out_h, factor, dtype=np.float32)
+    rows[-1] = height - factor * (out_h - 1)
+    cols = np.full(out_w, factor, dtype=np.float32)
+    cols[-1] = width - factor * (out_w - 1)
+    means = sums / np.outer(rows, cols)
+
+    if np.issubdtype(array.dtype, np.integer):
+        return np.rint(means).astype(array.dtype)
+    return means.astype(array.dtype, copy=False)
+
+
+def reduction_factor(scale: float) -> int:
+    """Integer block size for a source-to-screen scale below 1."""
+    if scale <= 0 or scale >= 1:
+        return 1
+    return max(1, int(1.0 / scale))
+
+
+def _render_pool() -> ThreadPoolExecutor:
+    """Thread pool shared by all renders, started on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=RENDER_WORKERS, thread_name_prefix="pydcmview-render"
+                )
+    return _pool
+
+
+def render_bands(
+    stage: Callable[[np.ndarray], np.ndarray],
+    array: np.ndarray,
+    factor: int = 1,
+    workers: int = RENDER_WORKERS,
+) -> np.ndarray:
+    """Render a 2D array in parallel row bands (e.g. to gray levels or RGB).
+
+    numpy releases the GIL in clipping, arithmetic and table lookups, so
+    large slices are split into bands processed on a persistent thread
+    pool, each writing its rows of one shared output buffer. Small slices
+    are rendered in a single call on the calling thread.
+
+    Args:
+        stage: Function of a band of rows returning its output rows,
+            reduced ``factor`` times along both axes (block averaging)
+        array: 2D input
+        factor: Block-mean reduction factor; bands are whole multiples of
+            it so reduction blocks never straddle two bands
+        workers: Upper bound on the number of bands
+
+    Returns:
+        Array with ceil(H / factor) rows and ceil(W / factor) columns; the
+        trailing dimensions and dtype are those the stage returns
+    """
+    height, width = array.shape[:2]
+    band_rows = max(MIN_BAND_ROWS, -(-height // max(1, workers)))
+    band_rows = -(-band_rows // factor) * factor
+    if workers <= 1 or array.size < PARALLEL_MIN_PIXELS or band_rows >= height:
+        return stage(array)
+
+    # The first band, rendered here, fixes the output's dtype and channels
+    first = stage(array[:band_rows])
+    out = np.empty(
+        (-(-height // factor), -(-width // factor)) + first.shape[2:], dtype=first.dtype
+    )
+    out[: band_rows // factor] = first
+
+    def render(start: int):
+        out[start // factor : (start + band_rows) // factor] = stage(
+            array[start : start + band_rows]
+        )
+
+    pool = _render_pool()
+    starts = range(band_rows, height, band_rows)
+    for future in [pool.submit(render, start) for start in starts]:
+        future.result()
+    return out
+
+
+def render_views(renders: Sequence[Callable[[], T]]) -> List[T]:
+    """Run independent view renders concurrently and return their results in order.
+
+    Views run on a pool of their own: each may split its slice into row
+    bands on the band pool and wait for them, which must not occupy the
+    threads those bands need. A single view is rendered on the calling
+    thread.
+    """
+    global _view_pool
+    if len(renders) <= 1:
+        return [render() for render in renders]
+    if _view_pool is None:
+        with _pool_lock:
+            if _view_pool is None:
+                _view_pool = ThreadPoolExecutor(
+                    max_workers=VIEW_WORKERS, thread_name_prefix="pydcmview-view"
+                )
+    return [future.result() for future in [_view_pool.submit(r) for r in renders]]
+
+
+class InteractionTracker:
+    """Rate of recent input events, used to pick the preview quality.
+
+    While events arrive quickly (a held key, rapid window/level changes)
+    frames are rendered from every 2nd or 4th pixel; a full-quality frame
+    follows once input has been idle for ``REFINE_DELAY``.
+    """
+
+    def __init__(self, window: float = RATE_WINDOW):
+        self.window = window
+        self._events: "deque[float]" = deque()
+
+    def note(self, now: Optional[float] = None):
+        """Record an input event."""
+        now = time.monotonic() if now is None else now
+        self._events.append(now)
+        while self._events and self._events[0] < now - self.window:
+            self._events.popleft()
+
+    def rate(self, now: Optional[float] = None) -> float:
+        """Events per second over the last ``window`` seconds."""
+        now = time.monotonic() if now is None else now
+        recent = sum(1 for t in self._events if t >= now - self.window)
+        return recent / self.window
+
+    def preview_step(self, pixels: int, now: Optional[float] = None) -> int:
+        """Pixel stride for the next frame: 1 for full quality."""
+        if pixels < PREVIEW_MIN_PIXELS:
+            return 1
+        rate = self.rate(now)
+        for threshold, step in PREVIEW_STEPS:
+            if rate >= threshold:
+                return step
+        return 1
@@ -0,0 +1,230 @@
+"""Region-of-interest statistics from per-slice summed-area tables."""
+
+from collections import OrderedDict
+from typing import Callable, Hashable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+# ROI shapes, in the order the ROI tool cycles through them
+ROI_SHAPES = ("rectangle", "ellipse")
+
+# Number of slices whose summed-area tables are kept
+DEFAULT_CACHED_SLICES = 16
+
+# Bound on the memory of the kept tables, which grow with the range tables
+DEFAULT_CACHE_BYTES = 256 * 1024**2
+
+
+class RoiStats(NamedTuple):
+    """Voxel count, mean, standard deviation and range inside an ROI."""
+
+    count: int
+    mean: float
+    std: float
+    min: float
+    max: float
+
+    def rescaled(self, slope: float, intercept: float) -> "RoiStats":
+        """Convert statistics of stored values to real-world units."""
+        low, high = sorted((self.min * slope + intercept, self.max * slope + intercept))
+        return RoiStats(
+            self.count, self.mean * slope + intercept, self.std * abs(slope), low, high
+        )
+
+
+def roi_spans(
+    shape: Tuple[int, int], kind: str, cx: int, cy: int, rx: int, ry: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Row spans covered by an ROI centered at ``(cx, cy)``, clipped to the slice.
+
+    Returns:
+        Arrays of row indices and, per row, the start and end (exclusive)
+        columns; empty rows are dropped
+    """
+    height, width = shape
+    rows = np.arange(max(0, cy - ry), min(height, cy + ry + 1))
+    if kind == "ellipse":
+        dy = (rows - cy) / (ry + 0.5)
+        half = np.floor((rx + 0.5) * np.sqrt(np.clip(1.0 - dy * dy, 0.0, None)))
+        half = half.astype(np.intp)
+    else:
+        half = np.full(rows.shape, rx, dtype=np.intp)
+    x0 = np.clip(cx - half, 0, width)
+    x1 = np.clip(cx + half + 1, 0, width)
+    keep = x1 > x0
+    return rows[keep], x0[keep], x1[keep]
+
+
+def _region(data: np.ndarray, rows: np.ndarray, x0: np.ndarray, x1: np.ndarray) -> np.ndarray:
+    """Voxels covered by the row spans, as a 1D array."""
+    top, bottom = int(rows[0]), int(rows[-1]) + 1
+    left, right = int(x0.min()), int(x1.max())
+    box = np.asarray(data[top:bottom, left:right])
+    if np.all(x0 == left) and np.all(x1 == right):
+        return box.reshape(-1)
+    columns = np.arange(left, right)
+    mask = (columns >= x0[:, None]) & (columns < x1[:, None])
+    return box[mask]
+
+
+def region_stats(
+    data: np.ndarray, kind: str, cx: int, cy: int, rx: int, ry: int
+) -> Optional[RoiStats]:
+    """Statistics of an ROI computed directly from the voxels."""
+    rows, x0, x1 = roi_spans(data.shape, kind, cx, cy, rx, ry)
+    if rows.size == 0:
+        return None
+    values = _region(data, rows, x0, x1).astype(np.float64)
+    return RoiStats(
+        int(values.size),
+        float(values.mean()),
+        float(values.std()),
+        float(values.min()),
+        float(values.max()),
+    )
+
+
+class SliceIntegrals:
+    """Summed-area tables of a slice's values and squared values.
+
+    Built once per slice; afterwards the sum and sum of squares over any
+    rectangle are four table lookups, so moving or resizing a rectangular
+    ROI costs the same regardless of its size. Ellipses sum one lookup per
+    row. Values are centered on the slice mean before squaring to keep the
+    variance accurate in float64.
+
+    Minimum and maximum come from per-row sparse tables: level ``k`` holds
+    the range of every run of ``2**k`` columns, so the range of a row span
+    is two overlapping lookups and an ROI costs two lookups per row, never
+    a scan of its voxels. The tables take ``log2(width)`` slices of memory.
+    """
+
+    def __init__(self, slice_2d: np.ndarray):
+        self.data = np.asarray(slice_2d)
+        values = self.data.astype(np.float64)
+        self.offset = float(values.mean()) if values.size else 0.0
+        values -= self.offset
+
+        height, width = values.shape
+        self.sums = np.zeros((height + 1, width + 1), dtype=np.float64)
+        self.squares = np.zeros((height + 1, width + 1), dtype=np.float64)
+        np.cumsum(np.cumsum(values, axis=0), axis=1, out=self.sums[1:, 1:])
+        np.cumsum(np.cumsum(values * values, axis=0), axis=1, out=self.squares[1:, 1:])
+
+        # Level 0 is the slice itself; level k has width - 2**k + 1 columns
+        self.mins: List[np.ndarray] = [self.data]
+        self.maxs: List[np.ndarray] = [self.data]
+        span = 1
+        while span * 2 <= width:
+            self.mins.append(np.minimum(self.mins[-1][:, :-span], self.mins[-1][:, span:]))
+            self.maxs.append(np.maximum(self.maxs[-1][:, :-span], self.maxs[-1][:, span:]))
+            span *= 2
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.data.shape
+
+    @property
+    def nbytes(self) -> int:
+        levels = sum(table.nbytes for table in self.mins[1:] + self.maxs[1:])
+        return self.sums.nbytes + self.squares.nbytes + levels
+
+    @staticmethod
+    def _box_sum(table: np.ndarray, top, bottom, left, right):
+        return table[bottom, right] - table[top, right] - table[bottom, left] + table[top, left]
+
+    def _range(self, rows: np.ndarray, x0: np.ndarray, x1: np.ndarray) -> Tuple[float, float]:
+        """Minimum and maximum over the row spans, from the sparse tables."""
+        # Largest power of two not longer than each span
+        levels = np.frexp((x1 - x0).astype(np.float64))[1] - 1
+        low, high = np.inf, -np.inf
+        for level in np.unique(levels):
+            selected = levels == level
+            r, left = rows[selected], x0[selected]
+            right = x1[selected] - (1 << int(level))
+            mins, maxs = self.mins[level], self.maxs[level]
+            low = min(low, float(mins[r, left].min()), float(mins[r, right].min()))
+            high = max(high, float(maxs[r, left].max()), float(maxs[r, right].max()))
+        return low, high
+
+    def stats(self, kind: str, cx: int, cy: int, rx: int, ry: int) -> Optional[RoiStats]:
+        """Statistics of the ROI centered at ``(cx, cy)`` with radii ``rx``, ``ry``."""
+        rows, x0, x1 = roi_spans(self.shape, kind, cx, cy, rx, ry)
+        if rows.size == 0:
+            return None
+
+        if kind == "ellipse":
+            total = self._box_sum(self.sums, rows, rows + 1, x0, x1).sum()
+            total_sq = self._box_sum(self.squares, rows, rows + 1, x0, x1).sum()
+            count = int((x1 - x0).sum())
+        else:
+            top, bottom = int(rows[0]), int(rows[-1]) + 1
+            left, right = int(x0[0]), int(x1[0])
+            total = self._box_sum(self.sums, top, bottom, left, right)
+            total_sq = self._box_sum(self.squares, top, bottom, left, right)
+            count = (bottom - top) * (right - left)
+
+        mean = total / count
+        variance = max(0.0, total_sq / count - mean * mean)
+        low, high = self._range(rows, x0, x1)
+        return RoiStats(
+            count,
+            float(mean + self.offset),
+            float(np.sqrt(variance)),
+            low,
+            high,
+        )
+
+
+class SliceIntegralCache:
+    """Small LRU cache of summed-area tables keyed by slice."""
+
+    def __init__(
+        self, max_slices: int = DEFAULT_CACHED_SLICES, max_bytes: int = DEFAULT_CACHE_BYTES
+    ):
+        self.max_slices = max_slices
+        self.max_bytes = max_bytes
+        self._tables: "OrderedDict[Hashable, SliceIntegrals]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: Hashable, slice_2d: Callable[[], np.ndarray]) -> SliceIntegrals:
+        """Get the tables for ``key``, building them from ``slice_2d()`` on a miss."""
+        tables = self._tables.get(key)
+        if tables is not None:
+            self._tables.move_to_end(key)
+            return tables
+
+        tables = SliceIntegrals(slice_2d())
+        self._tables[key] = tables
+        self._bytes += tables.nbytes
+        while len(self._tables) > 1 and (
+            len(self._tables) > self.max_slices or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._tables.popitem(last=False)
+            self._bytes -= evicted.nbytes
+        return tables
+
+    def clear(self):
+        self._tables.clear()
+        self._bytes = 0
+
+
+def combine_stats(parts) -> Optional[RoiStats]:
+    """Merge statistics of disjoint voxel sets into one."""
+    parts = [p for p in parts if p is not None and p.count > 0]
+    if not parts:
+        return None
+    counts = np.array([p.count for p in parts], dtype=np.float64)
+    means = np.array([p.mean for p in parts])
+    variances = np.array([p.std for p in parts]) ** 2
+    total = counts.sum()
+    mean = float((counts * means).sum() / total)
+    variance = float((counts * (variances + (means - mean) ** 2)).sum() / total)
+    return RoiStats(
+        int(total),
+        mean,
+        float(np.sqrt(variance)),
+        min(p.min for p in parts),
+        max(p.max for p in parts),
+    )
@@ -0,0 +1,205 @@
+"""Multi-volume session with memory-budgeted eviction."""
+
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .dicom_index import DicomSeries
+from .image_loader import ImageLoader
+from .watch import FileWatcher
+
+
+# Default resident memory budget for all open volumes
+DEFAULT_MEMORY_BUDGET = 4 * 1024**3
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(text: str) -> int:
+    """Parse a human-readable size such as ``512M`` or ``2.5G`` into bytes."""
+    match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([KMGT]?)i?B?\s*", text, re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid size: {text}")
+    value, unit = match.groups()
+    return int(float(value) * _SIZE_UNITS[unit.upper()])
+
+
+def format_size(nbytes: int) -> str:
+    """Format a byte count for display, e.g. ``1.5 GB``."""
+    size = float(nbytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class VolumeEntry:
+    """One volume of a session: its loader and the viewer state to restore."""
+
+    def __init__(self, source: Union[str, Path, DicomSeries]):
+        if isinstance(source, DicomSeries):
+            self.path = source.files[0]
+            self.series_files = source.files
+            self.label = f"{source.files[0].parent.name}: {source.label}"
+        else:
+            self.path = Path(source)
+            self.series_files = None
+            self.label = self.path.name
+        self.source = source
+        self.loader: Optional[ImageLoader] = None
+        self.shape = None
+        self.last_viewed = 0.0
+        self.view_state: Dict[str, Any] = {}
+        # Polls the files while the volume is loaded (watch mode)
+        self.watcher: Optional[FileWatcher] = None
+
+    @property
+    def files(self) -> List[Path]:
+        """Files the volume is read from."""
+        return list(self.series_files) if self.series_files else [self.path]
+
+    @property
+    def resident_bytes(self) -> int:
+        return self.loader.resident_bytes if self.loader is not None else 0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loader is not None and self.loader.array is not None
+
+
+class VolumeSession:
+    """Set of volumes browsed together, kept under a memory budget.
+
+    Activating a volume loads it if needed and then evicts the least
+    recently viewed other volumes until the resident total fits the budget.
+    Evicted volumes keep their header information and statistics and are
+    reloaded on the next activation.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[Union[str, Path, DicomSeries]],
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        share: bool = False,
+        watch: bool = False,
+    ):
+        if not sources:
+            raise ValueError("A session needs at least one volume")
+        self.entries: List[VolumeEntry] = [VolumeEntry(s) for s in sources]
+        self.memory_budget = memory_budget
+        # Share loaded volumes with other viewer processes
+        self.share = share
+        # Track file changes of loaded volumes
+        self.watch = watch
+        self.current_index = 0
+        # Volume shown beside the current one; never evicted
+        self.compared: Optional[VolumeEntry] = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def current(self) -> VolumeEntry:
+        return self.entries[self.current_index]
+
+    @property
+    def resident_bytes(self) -> int:
+        """Total bytes of pixel data currently held by all volumes."""
+        return sum(entry.resident_bytes for entry in self.entries)
+
+    def activate(self, index: int) -> VolumeEntry:
+        """Make ``index`` the current volume, loading and evicting as needed."""
+        index %= len(self.entries)
+        entry = self.load(index)
+        self.current_index = index
+        self._enforce_budget()
+        return entry
+
+    def load(self, index: int) -> VolumeEntry:
+        """Load volume ``index`` if needed, without making it current or evicting."""
+        entry = self.entries[index % len(self.entries)]
+        if entry.loader is None:
+            entry.loader = ImageLoader(
+                entry.path, series_files=entry.series_files, share=self.share
+            )
+        if entry.loader.array is None:
+            # Snapshot the files first, so changes made while loading are seen
+            if self.watch:
+                entry.watcher = FileWatcher(entry.files)
+            _, entry.shape = entry.loader.load()
+        entry.last_viewed = time.monotonic()
+        return entry
+
+    def compare(self, index: Optional[int]) -> Optional[VolumeEntry]:
+        """Load and keep volume ``index`` beside the current one; None stops comparing."""
+        if index is None:
+            self.compared = None
+            return None
+        self.compared = self.load(index)
+        self._enforce_budget()
+        return self.compared
+
+    def _enforce_budget(self):
+        """Evict least recently viewed volumes until within budget."""
+        candidates = sorted(
+            (
+                e
+                for e in self.entries
+                if e is not self.current and e is not self.compared and e.is_loaded
+            ),
+            key=lambda e: e.last_viewed,
+        )
+        for entry in candidates:
+            if self.resident_bytes <= self.memory_budget:
+                break
+            entry.loader.unload()
+
+    def changed_entries(self) -> List[Tuple[VolumeEntry, List[int]]]:
+        """Loaded volumes whose files were rewritten since the last check.
+
+        Returns:
+            (entry, positions of the changed files in ``entry.files``) pairs
+        """
+        changes = []
+        for entry in self.entries:
+            # Unloaded volumes are read afresh when next activated
+            if entry.watcher is None or not entry.is_loaded:
+                continue
+            changed = entry.watcher.poll()
+            if changed:
+                changes.append((entry, changed))
+        return changes
+
+    def reload(self, entry: VolumeEntry, changed: Sequence[int]) -> Union[ImageLoader, Dict]:
+        """Read a volume's rewritten files, without changing what is shown.
+
+        Changed instances of a series are read on their own, as a
+        ``{position: stored slice}`` dict. Otherwise a new loader is loaded
+        and returned. Either way the result is handed to ``apply_reload``;
+        the current volume keeps serving until then, so this can run in a
+        worker thread.
+        """
+        if entry.series_files:
+            slices = entry.loader.read_instances(changed)
+            if slices is not None:
+                return slices
+        loader = ImageLoader(entry.path, series_files=entry.series_files, share=self.share)
+        loader.load()
+        return loader
+
+    def apply_reload(self, entry: VolumeEntry, reloaded: Union[ImageLoader, Dict]):
+        """Bring a volume up to date with the result of ``reload``."""
+        if isinstance(reloaded, ImageLoader):
+            self.replace_loader(entry, reloaded)
+        elif entry.loader is not None:
+            entry.loader.write_instances(reloaded)
+
+    def replace_loader(self, entry: VolumeEntry, loader: ImageLoader):
+        """Swap in a reloaded volume and release the previous one."""
+        previous = entry.loader
+        entry.loader = loader
+        entry.shape = loader.array.shape
+        if previous is not None:
+            previous.unload()
+        self._enforce_budget()
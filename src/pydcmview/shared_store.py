@@ -0,0 +1,176 @@
+"""Volumes shared read-only between viewer processes via shared memory."""
+
+import atexit
+import hashlib
+import json
+import sys
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from .cache import file_cache_key
+
+
+# Bytes reserved at the start of each segment for the JSON header
+HEADER_BYTES = 4096
+
+_MAGIC = b"PDVSHM1\0"
+
+# Short prefix keeps names within macOS's 31-character limit
+_NAME_PREFIX = "pdv_"
+
+# Segments published by this process, removed at exit
+_published: "weakref.WeakSet[SharedVolume]" = weakref.WeakSet()
+
+
+def volume_key(files: Sequence[Union[str, Path]]) -> str:
+    """Shared-memory name for a volume, changing whenever a source file does."""
+    digest = hashlib.sha1()
+    for f in files:
+        digest.update(file_cache_key(f).encode("ascii"))
+    return _NAME_PREFIX + digest.hexdigest()[:24]
+
+
+def _untrack(segment: shared_memory.SharedMemory):
+    """Stop this process's resource tracker from unlinking an attached segment."""
+    if sys.version_info < (3, 13):
+        try:
+            resource_tracker.unregister(segment._name, "shared_memory")
+        except Exception:
+            pass
+
+
+def _open_existing(name: str) -> Optional[shared_memory.SharedMemory]:
+    try:
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+        segment = shared_memory.SharedMemory(name=name)
+    except (FileNotFoundError, OSError, ValueError):
+        return None
+    _untrack(segment)
+    return segment
+
+
+class SharedArray(np.ndarray):
+    """Array over a shared-memory segment that keeps the segment mapped.
+
+    numpy does not hold a buffer export on the mapping, so views carry a
+    reference to the segment instead; arrays owning their data (copies,
+    computation results) do not.
+    """
+
+    def __array_finalize__(self, obj):
+        # ufunc results arrive as views of a freshly allocated array, so
+        # follow the bases down to whoever owns the memory
+        base = self
+        while isinstance(base, np.ndarray):
+            if base.flags.owndata:
+                self._segment = None
+                return
+            base = base.base
+        self._segment = getattr(obj, "_segment", None)
+
+
+class SharedVolume:
+    """A volume published in, or attached from, a shared-memory segment.
+
+    The segment holds a fixed-size JSON header (dtype, shape and the
+    loader's metadata) followed by the voxels. The header's magic is
+    written last, so a segment is only attached once fully written.
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, owner: bool, header: Dict[str, Any]):
+        self.segment = segment
+        self.owner = owner
+        self.metadata = header.get("metadata", {})
+        array = SharedArray(
+            tuple(header["shape"]),
+            dtype=np.dtype(header["dtype"]),
+            buffer=segment.buf,
+            offset=HEADER_BYTES,
+        )
+        array._segment = segment
+        array.flags.writeable = False
+        self.array = array
+
+    @property
+    def name(self) -> str:
+        return self.segment.name
+
+    @classmethod
+    def attach(cls, name: str) -> Optional["SharedVolume"]:
+        """Attach to a published volume, or return None if there is none."""
+        segment = _open_existing(name)
+        if segment is None:
+            return None
+        raw = bytes(segment.buf[:HEADER_BYTES])
+        if not raw.startswith(_MAGIC):
+            segment.close()
+            return None
+        try:
+            header = json.loads(raw[len(_MAGIC) :].rstrip(b"\0"))
+            return cls(segment, False, header)
+        except (ValueError, KeyError, TypeError):
+            segment.close()
+            return None
+
+    @classmethod
+    def publish(
+        cls, name: str, array: np.ndarray, metadata: Dict[str, Any]
+    ) -> Optional["SharedVolume"]:
+        """Copy ``array`` into a new segment, or return None if it already exists."""
+        array = np.ascontiguousarray(array)
+        header = json.dumps(
+            {"dtype": array.dtype.str, "shape": list(array.shape), "metadata": metadata}
+        ).encode("utf-8")
+        if len(_MAGIC) + len(header) > HEADER_BYTES:
+            return None
+
+        try:
+            segment = shared_memory.SharedMemory(
+                name=name, create=True, size=HEADER_BYTES + max(1, array.nbytes)
+            )
+        except (FileExistsError, OSError):
+            return None
+
+        target = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf, offset=HEADER_BYTES)
+        target[...] = array
+        segment.buf[len(_MAGIC) : len(_MAGIC) + len(header)] = header
+        segment.buf[: len(_MAGIC)] = _MAGIC
+        volume = cls(segment, True, {"dtype": array.dtype.str, "shape": array.shape, "metadata": metadata})
+        _published.add(volume)
+        return volume
+
+    def close(self):
+        """Detach; the publisher also removes the segment for future viewers.
+
+        The mapping itself is released once no array refers to it any more,
+        and processes still attached keep theirs until they detach.
+        """
+        self.array = None
+        if self.owner:
+            self.owner = False
+            try:
+                self.segment.unlink()
+            except FileNotFoundError:
+                pass
+
+
+@atexit.register
+def _unlink_published():
+    for volume in list(_published):
+        volume.close()
+
+
+def encode_metadata(value) -> Any:
+    """Make loader metadata JSON-serializable (tuples and arrays to lists)."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (tuple, list)):
+        return [encode_metadata(v) for v in value]
+    if isinstance(value, (np.floating, np.integer)):
+        return value.item()
+    return value
@@ -1,20 +1,84 @@
 """Main image viewer application using Textual."""
 
 import numpy as np
+from functools import partial
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple, Union
 
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.widgets import Static
 from textual.binding import Binding
 from textual.screen import ModalScreen
-from textual_image.widget import Image, SixelImage
+from textual.worker import get_current_worker
+from textual_image.widget import SixelImage
 from rich.text import Text
 import os
 
-from .image_loader import ImageLoader
-from .colormap import ColorMapManager
+from .chunked import ChunkedArray
+from .compare import PANE_GAP, Comparison, compose_panes
+from .dicom_index import DicomSeries
+from .session import DEFAULT_MEMORY_BUDGET, VolumeSession, format_size
+from .frame_cache import CachedImage
+from .colormap import DEFAULT_LEVELS, HIGH_PRECISION_LEVELS, get_colormap_manager
+from .render import (
+    REFINE_DELAY,
+    InteractionTracker,
+    block_mean,
+    reduction_factor,
+    render_bands,
+    render_views,
+)
+from .fusion import DEFAULT_FUSION_COLORMAP, FusionLayer, SliceLayout
+from .mpr import PLANE_GAP, MPRLayout, plane_axes
+from .pipeline import RenderPipeline
+from .lazy_array import LazyArray
+from .labels import OVERLAY_MODES, LabelMap, OverlayCache, blend_overlay
+from .roi import ROI_SHAPES, SliceIntegralCache, combine_stats, region_stats
+from .watch import DEFAULT_WATCH_INTERVAL
+
+
+class SliceView(NamedTuple):
+    """How 2D slices are cut from a volume and oriented for display.
+
+    A snapshot of the viewer's axes and flips, so that background workers
+    keep slicing consistently while the view changes.
+    """
+
+    shape: Tuple[int, ...]
+    slice_axis: Optional[int]
+    extra_indices: Dict[int, int]
+    display_x: int
+    display_y: int
+    flipped: frozenset
+
+    def extract(self, index: int, array) -> np.ndarray:
+        """The 2D slice at ``index`` along the slice axis, rows following display_x, unflipped."""
+        if len(self.shape) == 2:
+            # 2D image
+            return np.asarray(array)
+        if self.slice_axis is None:
+            return array
+
+        # Multi-dimensional image - fix every axis but the displayed two
+        slice_indices = [slice(None)] * len(self.shape)
+        for axis, extra_index in self.extra_indices.items():
+            slice_indices[axis] = extra_index
+        slice_indices[self.slice_axis] = index
+        slice_2d = array[tuple(slice_indices)]
+
+        # Rows follow display_x; the kept axes come out in ascending order
+        if self.display_x > self.display_y:
+            slice_2d = np.transpose(slice_2d)
+        return slice_2d
+
+    def orient(self, slice_2d: np.ndarray) -> np.ndarray:
+        """Apply the flips of the displayed axes to an extracted slice."""
+        if self.display_x in self.flipped:
+            slice_2d = np.flip(slice_2d, axis=1)  # Flip along x-axis (columns)
+        if self.display_y in self.flipped:
+            slice_2d = np.flip(slice_2d, axis=0)  # Flip along y-axis (rows)
+        return slice_2d
 
 
 class DimensionSelectionScreen(ModalScreen[dict]):
@@ -184,7 +248,7 @@ class ColormapSelectionScreen(ModalScreen[str]):
 
     def __init__(self, current_colormap: str):
         super().__init__()
-        self.colormap_manager = ColorMapManager()
+        self.colormap_manager = get_colormap_manager()
         self.colormap_names = self.colormap_manager.get_names()
         self.selected = 0
         self.current_colormap = current_colormap
@@ -225,12 +289,14 @@ class ColormapSelectionScreen(ModalScreen[str]):
 
             # Add a colored preview using text characters
             if i < len(self.colormap_names):
-                colormap = self.colormap_manager.get_colormap(name)
+                try:
+                    colormap = self.colormap_manager.get_colormap(name)
+                except ValueError:
+                    text.append("  (invalid colormap file)\n", style="red")
+                    continue
                 # Create a colored gradient preview using block characters
                 preview_text = Text("  ")
-                for j in range(16):  # 16 character gradient
-                    intensity = int(j * 255 / 15)
-                    rgb = colormap._lut[intensity]
+                for rgb in colormap.get_lut(16):  # 16 character gradient
                     # Convert RGB values to hex color for Rich styling
                     hex_color = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
                     preview_text.append("█", style=hex_color)
@@ -258,6 +324,117 @@ class ColormapSelectionScreen(ModalScreen[str]):
         self.dismiss(None)
 
 
+class SeriesSelectionScreen(ModalScreen[int]):
+    """Modal screen for picking a volume or series of the session."""
+
+    CSS = """
+    SeriesSelectionScreen {
+        align: center middle;
+    }
+    
+    #series_dialog {
+        width: 100;
+        height: auto;
+        max-height: 90%;
+        background: $surface;
+        border: solid $primary;
+        padding: 1;
+    }
+    
+    #series_title {
+        text-align: center;
+        margin: 1;
+        color: $text;
+    }
+    
+    #series_list {
+        margin: 1;
+        min-height: 5;
+    }
+    
+    #series_help {
+        text-align: center;
+        margin: 1;
+        color: $text-muted;
+    }
+    """
+
+    BINDINGS = [
+        Binding("escape", "dismiss", "Cancel"),
+        Binding("up,k", "move_up", "Move up"),
+        Binding("down,j", "move_down", "Move down"),
+        Binding("enter", "confirm", "Confirm"),
+    ]
+
+    # Number of rows shown around the selection
+    PAGE_SIZE = 20
+
+    def __init__(self, session: VolumeSession):
+        super().__init__()
+        self.session = session
+        self.selected = session.current_index
+
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Static(f"Select Series ({len(self.session)} available)", id="series_title"),
+            Static("", id="series_list"),
+            Static(
+                "Use ↑↓/jk to navigate, Enter to open, Esc to cancel",
+                id="series_help",
+            ),
+            id="series_dialog",
+        )
+
+    def on_mount(self):
+        self._update_series_list()
+
+    def _describe(self, entry) -> str:
+        """One-line description of a session entry."""
+        source = entry.source
+        if isinstance(source, DicomSeries):
+            details = [source.patient_name, source.study_date]
+            if source.rows and source.columns:
+                details.append(f"{source.columns}x{source.rows}x{len(source)}")
+            else:
+                details.append(f"{len(source)} files")
+            return f"{entry.label}  ({', '.join(d for d in details if d)})"
+        return entry.label
+
+    def _update_series_list(self):
+        """Update the series list display."""
+        first = max(0, min(self.selected - self.PAGE_SIZE // 2, len(self.session) - self.PAGE_SIZE))
+        last = min(len(self.session), first + self.PAGE_SIZE)
+
+        text = Text()
+        for i in range(first, last):
+            entry = self.session.entries[i]
+            prefix = "→ " if i == self.selected else "  "
+            loaded_marker = " [LOADED]" if entry.is_loaded else ""
+            line = f"{prefix}{self._describe(entry)}{loaded_marker}\n"
+            if i == self.selected:
+                text.append(line, style="bold yellow")
+            else:
+                text.append(line)
+
+        self.query_one("#series_list", Static).update(text)
+
+    def action_move_up(self):
+        self.selected = max(0, self.selected - 1)
+        self._update_series_list()
+
+    def action_move_down(self):
+        self.selected = min(len(self.session) - 1, self.selected + 1)
+        self._update_series_list()
+
+    def action_confirm(self):
+        """Confirm selection and return the selected index."""
+        self.dismiss(self.selected)
+
+    def action_dismiss(self):
+        """Cancel without changes."""
+        self.dismiss(None)
+
+
 class ImageViewer(App):
     """Main image viewer application."""
 
@@ -289,13 +466,79 @@ class ImageViewer(App):
         Binding("c", "colormap_mode", "Colormap selection"),
         Binding("h", "crosshair_mode", "Crosshair mode"),
         Binding("W", "window_level_mode", "Window/Level mode"),
+        Binding("e", "toggle_equalization", "Histogram equalization"),
+        Binding("p", "auto_window", "Percentile auto window"),
         Binding("[", "zoom_out", "Zoom out"),
         Binding("]", "zoom_in", "Zoom in"),
+        Binding("n", "next_volume", "Next volume"),
+        Binding("N", "previous_volume", "Previous volume"),
+        Binding("b", "series_browser", "Series browser"),
+        Binding("o", "toggle_labels", "Label overlay"),
+        Binding("O", "label_opacity", "Label opacity"),
+        Binding("f", "toggle_fusion", "Fusion overlay"),
+        Binding("F", "fusion_opacity", "Fusion opacity"),
+        Binding("m", "toggle_mpr", "Three-plane layout"),
+        Binding("v", "toggle_compare", "Compare with the next volume"),
+        Binding("V", "toggle_window_link", "Link window/level of compared volumes"),
+        Binding("comma", "step_extra(0,-1)", "Previous index on the first extra axis"),
+        Binding("full_stop", "step_extra(0,1)", "Next index on the first extra axis"),
+        Binding("less_than_sign", "step_extra(1,-1)", "Previous index on the second extra axis"),
+        Binding("greater_than_sign", "step_extra(1,1)", "Next index on the second extra axis"),
     ]
 
-    def __init__(self, image_path: Path):
+    # View state kept when a watched volume is reloaded with new dimensions
+    RELOAD_KEPT_ATTRS = (
+        "window_center",
+        "window_width",
+        "zoom_level",
+        "display_mode",
+        "current_colormap",
+    )
+
+    # Overlay opacities cycled with O and F
+    OVERLAY_OPACITIES = (0.25, 0.5, 0.75, 1.0)
+
+    # Viewer state saved per volume and restored when switching back
+    VIEW_STATE_ATTRS = (
+        "current_slice",
+        "display_x",
+        "display_y",
+        "slice_axis",
+        "extra_indices",
+        "dim_flipped",
+        "window_center",
+        "window_width",
+        "crosshair_x",
+        "crosshair_y",
+        "zoom_level",
+        "scroll_x",
+        "scroll_y",
+        "display_levels",
+        "display_mode",
+        "mpr",
+    )
+
+    def __init__(
+        self,
+        image_paths: Union[Path, DicomSeries, Sequence[Union[Path, DicomSeries]]],
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        show_browser: bool = False,
+        share_memory: bool = False,
+        label_path: Union[str, Path, None] = None,
+        fusion_path: Union[str, Path, None] = None,
+        fusion_colormap: str = DEFAULT_FUSION_COLORMAP,
+        watch: bool = False,
+        compare: bool = False,
+    ):
         super().__init__()
-        self.image_path = image_path
+        if isinstance(image_paths, (str, Path, DicomSeries)):
+            image_paths = [image_paths]
+        self.session = VolumeSession(
+            image_paths, memory_budget, share=share_memory, watch=watch
+        )
+        self.image_path = self.session.current.path
+        # Let the user pick a series before anything is loaded
+        self.show_browser = show_browser and len(self.session) > 1
         self.loader = None
         self.array = None
         self.shape = None
@@ -303,12 +546,20 @@ class ImageViewer(App):
         self.display_x = 0
         self.display_y = 1
         self.slice_axis = None
+        # Index on each axis that is neither displayed nor the slice axis
+        # (time, echo, channel of 4D/5D data)
+        self.extra_indices: Dict[int, int] = {}
         self.window_center = None
         self.window_width = None
         self.mode = "normal"  # normal, crosshair, window_level, dimension_select
         self.crosshair_x = 0
         self.crosshair_y = 0
         self.crosshair_opacity = 0.5
+        # ROI tool (crosshair mode): shape, half-size, and all-slice result
+        self.roi_shape = None  # None, rectangle, ellipse
+        self.roi_radius = 10
+        self.roi_volume_stats = None  # (roi key, stats or None while running)
+        self._roi_integrals = SliceIntegralCache()
         self.zoom_level = 1.0
         # Scroll offsets for WASD navigation
         self.scroll_x = 0
@@ -319,39 +570,59 @@ class ImageViewer(App):
         self.dim_new_y = None
         self.dim_flipped = set()  # Set of flipped dimensions
         # Colormap state
-        self.colormap_manager = ColorMapManager()
+        self.colormap_manager = get_colormap_manager()
         self.current_colormap = "Grayscale"
+        self.display_levels = DEFAULT_LEVELS
+        self.display_mode = "linear"  # linear, equalized
+        # Segmentation overlay, drawn on volumes with the same shape
+        self.label_map = LabelMap.load(label_path) if label_path else None
+        self.label_mode = "fill" if self.label_map is not None else None  # None, fill, outline
+        self.label_opacity = 0.5
+        self._overlay_cache = OverlayCache()
+        # Second volume fused onto the displayed one (e.g. PET on CT)
+        self.fusion = (
+            FusionLayer.load(fusion_path, fusion_colormap) if fusion_path else None
+        )
+        # Which volume window/level mode adjusts: primary or fusion
+        self.window_target = "primary"
+        # Mapping from source pixels to the last rendered image
+        self._render_origin = (0.0, 0.0)
+        self._render_scale = (1.0, 1.0)
+        # Memoized render stages of the current volume's pane
+        self.pipeline = RenderPipeline()
+        # Three-plane layout of 3D volumes (None for the single-plane view)
+        self.mpr = None
+        # Second volume shown beside the current one (None for a single pane)
+        self.comparison = None
+        self._compare_on_start = compare and len(self.session) > 1
+        # Reload volumes whose files are rewritten while open
+        self.watch = watch
+        self._watch_running = False
+        self._reload_note = None
+        # Coarse frames while input arrives quickly, refined once idle
+        self._interaction = InteractionTracker()
+        self._refine_timer = None
 
     def compose(self) -> ComposeResult:
         """Create the main interface."""
-        # Use textual-image's auto-detection (Image class)
-        # Now that CSS dock issue is fixed, auto-detection should work
-        yield Container(Image("", id="image_display"), id="image_container")
+        # Use textual-image's auto-detection, wrapped with the encoded frame
+        # cache for the Kitty and Sixel protocols
+        yield Container(CachedImage("", id="image_display"), id="image_container")
         yield Container(Static("Loading...", id="status"), id="status_bar")
 
     def on_mount(self):
         """Initialize the application."""
-        try:
-            self.loader = ImageLoader(self.image_path)
-            self.array, self.shape = self.loader.load()
-
-            # Set default display axes (two largest dimensions)
-            self.display_x, self.display_y = self.loader.get_default_display_axes()
-
-            # Determine slice axis (the remaining axis for 3D data)
-            if len(self.shape) >= 3:
-                all_axes = set(range(len(self.shape)))
-                display_axes = {self.display_x, self.display_y}
-                remaining_axes = list(all_axes - display_axes)
-                self.slice_axis = remaining_axes[0] if remaining_axes else None
+        if self.watch:
+            self.set_interval(DEFAULT_WATCH_INTERVAL, self._poll_watched_files)
 
-            self.window_center = self.loader.window_center
-            self.window_width = self.loader.window_width
+        if self.show_browser:
+            self.push_screen(SeriesSelectionScreen(self.session), self._handle_initial_series)
+            return
 
-            # Initialize crosshair to center
-            if len(self.shape) >= 2:
-                self.crosshair_x = self.shape[self.display_x] // 2
-                self.crosshair_y = self.shape[self.display_y] // 2
+        try:
+            self._open_volume(0)
+            if self._compare_on_start:
+                self._compare_with(1)
 
             # Use call_after_refresh to ensure screen is fully active
             self.call_after_refresh(self._update_display)
@@ -359,49 +630,298 @@ class ImageViewer(App):
         except Exception as e:
             self.query_one("#status", Static).update(f"Error: {e}")
 
-    def _get_current_slice(self) -> np.ndarray:
-        """Get the current 2D slice for display."""
-        if len(self.shape) == 2:
-            # 2D image
-            slice_2d = self.array
-        elif len(self.shape) >= 3 and self.slice_axis is not None:
-            # Multi-dimensional image - extract 2D slice
-            slice_indices = [slice(None)] * len(self.shape)
-            slice_indices[self.slice_axis] = self.current_slice
-            slice_nd = self.array[tuple(slice_indices)]
-
-            # Transpose to get display axes in correct order
-            axes_order = list(range(len(self.shape)))
-            if self.slice_axis in axes_order:
-                axes_order.remove(self.slice_axis)
-
-            # Find positions of display axes in remaining dimensions
-            remaining_axes = [
-                ax if ax < self.slice_axis else ax - 1
-                for ax in [self.display_x, self.display_y]
-                if ax != self.slice_axis
-            ]
+    def _handle_initial_series(self, result: Optional[int]):
+        """Open the series picked at startup (the first one if cancelled)."""
+        try:
+            self._open_volume(result or 0)
+            self._update_display()
+        except Exception as e:
+            self.query_one("#status", Static).update(f"Error: {e}")
 
-            if len(remaining_axes) >= 2:
-                slice_2d = np.transpose(slice_nd, remaining_axes)
-            else:
-                slice_2d = slice_nd
+    def _open_volume(self, index: int):
+        """Activate a session volume and restore or initialize its view state."""
+        entry = self.session.activate(index)
+        self.workers.cancel_group(self, "roi")
+        self.loader = entry.loader
+        self.array = self.loader.array
+        self.shape = entry.shape
+        self.image_path = entry.path
+
+        if entry.view_state:
+            for name, value in entry.view_state.items():
+                setattr(self, name, value)
+            return
+
+        # Set default display axes (two largest dimensions)
+        self.display_x, self.display_y = self.loader.get_default_display_axes()
+        self.slice_axis = None
+        self.extra_indices = {}
+        self.current_slice = 0
+        self.dim_flipped = set()
+        self.zoom_level = 1.0
+        self.scroll_x = 0
+        self.scroll_y = 0
+        self.display_mode = "linear"
+        self.mpr = None
+
+        # Determine slice axis (the remaining axis for 3D data)
+        if len(self.shape) >= 3:
+            self._assign_slice_axes()
+
+        self.window_center = self.loader.window_center
+        self.window_width = self.loader.window_width
+
+        # Keep more than 256 gray levels for 12/16-bit and float data
+        if np.dtype(self.array.dtype).itemsize > 1:
+            self.display_levels = HIGH_PRECISION_LEVELS
         else:
-            slice_2d = self.array
+            self.display_levels = DEFAULT_LEVELS
+
+        # Initialize crosshair to center
+        if len(self.shape) >= 2:
+            self.crosshair_x = self.shape[self.display_x] // 2
+            self.crosshair_y = self.shape[self.display_y] // 2
+
+    def _assign_slice_axes(self):
+        """Split the axes that are not displayed into the slice axis and extra axes.
+
+        The last of them is the slice axis, so (t, z, y, x) data scrolls
+        through z; the ones before it (time, echo, channel) keep their own
+        index in ``extra_indices``, clamped to the current shape.
+        """
+        remaining_axes = sorted(set(range(len(self.shape))) - {self.display_x, self.display_y})
+        self.slice_axis = remaining_axes[-1] if remaining_axes else None
+        self.extra_indices = {
+            axis: min(self.extra_indices.get(axis, 0), self.shape[axis] - 1)
+            for axis in remaining_axes[:-1]
+        }
+
+    def _save_view_state(self):
+        """Remember the current volume's view state for when it is reopened."""
+        self.session.current.view_state = {
+            name: getattr(self, name) for name in self.VIEW_STATE_ATTRS
+        }
+
+    def _switch_volume(self, step: int):
+        """Switch to another volume of the session, or to another compared one."""
+        if self.comparison is not None:
+            self._step_compared(step)
+            return
+        self._go_to_volume(self.session.current_index + step)
+
+    def _compare_with(self, index: int):
+        """Show session volume ``index`` beside the current one."""
+        try:
+            entry = self.session.compare(index)
+        except Exception as e:
+            self.query_one("#status", Static).update(f"Error: {e}")
+            return
+        link_window = self.comparison.link_window if self.comparison is not None else True
+        self.comparison = Comparison(index % len(self.session), entry)
+        self.comparison.link_window = link_window
+
+    def _step_compared(self, step: int):
+        """Compare with the next/previous volume other than the current one."""
+        if self.mode != "normal" or len(self.session) < 2:
+            return
+        index = (self.comparison.index + step) % len(self.session)
+        if index == self.session.current_index:
+            index = (index + step) % len(self.session)
+        self._compare_with(index)
+        self._update_display()
+
+    def _comparing(self) -> bool:
+        """Whether the compared volume is drawn: outside MPR and on the same grid."""
+        return (
+            self.comparison is not None
+            and self.mpr is None
+            and self.comparison.matches(self.shape)
+        )
 
-        # Apply flipping if any dimensions are flipped
-        if self.display_x in self.dim_flipped:
-            slice_2d = np.flip(slice_2d, axis=1)  # Flip along x-axis (columns)
-        if self.display_y in self.dim_flipped:
-            slice_2d = np.flip(slice_2d, axis=0)  # Flip along y-axis (rows)
+    def _go_to_volume(self, index: int):
+        """Switch to the session volume at ``index``."""
+        if self.mode != "normal" or len(self.session) < 2:
+            return
+        previous_index = self.session.current_index
+        self._save_view_state()
+        try:
+            self._open_volume(index)
+        except Exception as e:
+            self._open_volume(previous_index)
+            self._update_display()
+            self.query_one("#status", Static).update(f"Error: {e}")
+            return
+        if self.comparison is not None and self.comparison.index == self.session.current_index:
+            # Opening the compared volume swaps the panes
+            self._compare_with(previous_index)
+        self._update_display()
+
+    def _poll_watched_files(self):
+        """Check the open volumes' files for changes in a background thread."""
+        if self._watch_running or self.loader is None:
+            return
+        self._watch_running = True
+        self.run_worker(self._reload_changed_files, group="watch", thread=True)
+
+    def _reload_changed_files(self):
+        """Reload volumes whose files changed (runs in a worker thread)."""
+        try:
+            for entry, changed in self.session.changed_entries():
+                try:
+                    reloaded = self.session.reload(entry, changed)
+                except Exception as e:
+                    self.call_from_thread(self._show_reload, entry, None, 0, e)
+                    continue
+                self.call_from_thread(self._show_reload, entry, reloaded, len(changed), None)
+        finally:
+            self._watch_running = False
+
+    def _show_reload(self, entry, reloaded, count: int, error):
+        """Apply a reloaded volume, keeping slice, window/level and zoom.
+
+        Runs on the main thread, so no render is reading the volume while
+        changed slices are written into it.
+        """
+        if error is not None:
+            self._reload_note = f"reload failed ({error})"
+            self._update_status()
+            return
+
+        self.session.apply_reload(entry, reloaded)
+        self._reload_note = f"reloaded {count} file{'s' if count != 1 else ''}"
+        self.workers.cancel_group(self, "roi")
+        self.roi_volume_stats = None
+        self._roi_integrals.clear()
+        self.pipeline.clear()
+        if self.comparison is not None:
+            self.comparison.pipeline.clear()
+        if self.fusion is not None:
+            self.fusion.clear_cache()
+        if entry is not self.session.current:
+            if self.comparison is not None and entry is self.comparison.entry:
+                self._update_display()
+            else:
+                self._update_status()
+            return
+
+        self.loader = entry.loader
+        self.array = self.loader.array
+        if self.mpr is not None:
+            self.mpr.clear_cache()
+        if entry.shape != self.shape:
+            if len(entry.shape) != len(self.shape):
+                # New dimensionality: start from the default axes
+                kept = {name: getattr(self, name) for name in self.RELOAD_KEPT_ATTRS}
+                entry.view_state = {}
+                self._open_volume(self.session.current_index)
+                for name, value in kept.items():
+                    setattr(self, name, value)
+            self.shape = entry.shape
+            self.mpr = None
+            if len(self.shape) >= 3:
+                self._assign_slice_axes()
+            if self.slice_axis is not None:
+                self.current_slice = min(self.current_slice, self.shape[self.slice_axis] - 1)
+            slice_shape = self._slice_shape()
+            self.crosshair_x = min(self.crosshair_x, slice_shape[1] - 1)
+            self.crosshair_y = min(self.crosshair_y, slice_shape[0] - 1)
+            self._constrain_scroll()
+        self._update_display()
 
-        return slice_2d
+    def action_next_volume(self):
+        """Show the next volume of the session."""
+        self._switch_volume(1)
+
+    def action_previous_volume(self):
+        """Show the previous volume of the session."""
+        self._switch_volume(-1)
+
+    def action_series_browser(self):
+        """Show the series browser to jump to any volume of the session."""
+        if self.mode == "normal" and len(self.session) > 1:
+
+            def handle_series_result(result: Optional[int]):
+                if result is not None and result != self.session.current_index:
+                    self._go_to_volume(result)
+
+            self.push_screen(SeriesSelectionScreen(self.session), handle_series_result)
+
+    def _get_current_slice(self) -> np.ndarray:
+        """Get the current 2D slice for display."""
+        return self._get_slice(self.current_slice)
+
+    def _slice_shape(self) -> Tuple[int, int]:
+        """Shape of the displayed slice, without reading it."""
+        if len(self.shape) == 2:
+            return tuple(self.shape)
+        return self.shape[self.display_x], self.shape[self.display_y]
+
+    def _slice_source(self, factor: int, array=None) -> Tuple[object, int, int]:
+        """Where to read the current slice from for reduction ``factor``.
+
+        Multiscale volumes are read from their coarsest level fine enough
+        for ``factor``. ``array`` defaults to the image; the compared volume
+        is sliced the same way.
+
+        Returns:
+            (array or level, slice index in it, the level's downsampling
+            along the displayed axes, 1 at full resolution)
+        """
+        if array is None:
+            array = self.array
+        if (
+            factor > 1
+            and isinstance(array, ChunkedArray)
+            and len(self.shape) == 3
+            and self.slice_axis is not None
+        ):
+            for level in reversed(array.levels[1:]):
+                down = level.downsampling
+                step = down[self.display_x]
+                if step == down[self.display_y] and factor % step == 0:
+                    index = min(
+                        self.current_slice // down[self.slice_axis],
+                        level.shape[self.slice_axis] - 1,
+                    )
+                    return level, index, step
+        return array, self.current_slice, 1
+
+    def _get_slice(self, index: int, array=None) -> np.ndarray:
+        """Get the 2D slice at ``index`` along the slice axis, as displayed.
+
+        ``array`` defaults to the image; any array of the same shape (such
+        as a label map) is sliced the same way.
+        """
+        if array is None:
+            array = self.array
+        return self._orient_slice(self._extract_slice(index, array))
+
+    def _extract_slice(self, index: int, array) -> np.ndarray:
+        """The 2D slice at ``index`` along the slice axis, rows following display_x, unflipped."""
+        return self._slice_view().extract(index, array)
+
+    def _orient_slice(self, slice_2d: np.ndarray) -> np.ndarray:
+        """Apply the flips of the displayed axes to an extracted slice."""
+        return self._slice_view().orient(slice_2d)
+
+    def _slice_view(self) -> "SliceView":
+        """Snapshot of the current slicing geometry."""
+        return SliceView(
+            tuple(self.shape),
+            self.slice_axis,
+            dict(self.extra_indices),
+            self.display_x,
+            self.display_y,
+            frozenset(self.dim_flipped),
+        )
 
     def _calculate_max_zoom(self):
         """Calculate maximum safe zoom level to prevent rendering errors."""
         try:
-            slice_2d = self._get_current_slice()
-            img_height, img_width = slice_2d.shape
+            slice_shape = self._slice_shape()
+            aspect_x, aspect_y = self._pixel_aspect()
+            img_height = slice_shape[0] * aspect_y
+            img_width = slice_shape[1] * aspect_x
 
             # Get terminal size from console
             size = self.app.console.size
@@ -433,15 +953,16 @@ class ImageViewer(App):
     def _constrain_scroll(self):
         """Constrain scroll offsets to stay within image bounds."""
         try:
-            slice_2d = self._get_current_slice()
+            slice_shape = self._slice_shape()
 
             # Calculate maximum scroll based on zoomed image size
-            zoomed_height = int(slice_2d.shape[0] * self.zoom_level)
-            zoomed_width = int(slice_2d.shape[1] * self.zoom_level)
+            scale_x, scale_y = self._display_scale()
+            zoomed_height = int(slice_shape[0] * scale_y)
+            zoomed_width = int(slice_shape[1] * scale_x)
 
             # Get current display size (we'll use original image size as reference)
-            max_scroll_x = max(0, zoomed_width - slice_2d.shape[1])
-            max_scroll_y = max(0, zoomed_height - slice_2d.shape[0])
+            max_scroll_x = max(0, zoomed_width - slice_shape[1])
+            max_scroll_y = max(0, zoomed_height - slice_shape[0])
 
             # Constrain scroll offsets
             self.scroll_x = max(0, min(self.scroll_x, max_scroll_x))
@@ -453,13 +974,98 @@ class ImageViewer(App):
             self.scroll_y = 0
 
     def _get_intensity_range(self):
-        """Get the intensity range of the current slice."""
+        """Get the real-world intensity range of the current slice."""
         try:
             slice_2d = self._get_current_slice()
-            return float(np.min(slice_2d)), float(np.max(slice_2d))
+            return tuple(
+                sorted(
+                    (
+                        float(self.loader.to_real(np.min(slice_2d))),
+                        float(self.loader.to_real(np.max(slice_2d))),
+                    )
+                )
+            )
         except Exception:
             return 0.0, 1.0
 
+    def _slice_key(self) -> tuple:
+        """Identify the displayed slice for per-slice caches."""
+        return (
+            self.session.current_index,
+            self.slice_axis,
+            tuple(sorted(self.extra_indices.items())),
+            self.current_slice,
+            self.display_x,
+            self.display_y,
+            frozenset(self.dim_flipped),
+        )
+
+    def _roi_key(self) -> tuple:
+        """Identify the ROI geometry independently of the slice."""
+        return (
+            self.session.current_index,
+            self.slice_axis,
+            tuple(sorted(self.extra_indices.items())),
+            self.display_x,
+            self.display_y,
+            frozenset(self.dim_flipped),
+            self.roi_shape,
+            self.crosshair_x,
+            self.crosshair_y,
+            self.roi_radius,
+        )
+
+    def _to_real_stats(self, stats):
+        return stats.rescaled(self.loader.rescale_slope, self.loader.rescale_intercept)
+
+    def _get_roi_stats(self):
+        """Real-world statistics of the ROI on the current slice."""
+        tables = self._roi_integrals.get(self._slice_key(), self._get_current_slice)
+        stats = tables.stats(
+            self.roi_shape,
+            self.crosshair_x,
+            self.crosshair_y,
+            self.roi_radius,
+            self.roi_radius,
+        )
+        return self._to_real_stats(stats) if stats is not None else None
+
+    def _start_volume_roi_stats(self):
+        """Compute the ROI statistics over all slices in a background worker."""
+        if self.roi_shape is None or self.slice_axis is None:
+            return
+
+        key = self._roi_key()
+        # The view may change while the worker runs: slice a snapshot
+        array, view = self.array, self._slice_view()
+        count = view.shape[view.slice_axis]
+        geometry = (
+            self.roi_shape,
+            self.crosshair_x,
+            self.crosshair_y,
+            self.roi_radius,
+            self.roi_radius,
+        )
+        self.roi_volume_stats = (key, None)
+
+        def compute():
+            worker = get_current_worker()
+            parts = []
+            for index in range(count):
+                if worker.is_cancelled:
+                    return
+                plane = view.orient(view.extract(index, array))
+                parts.append(region_stats(plane, *geometry))
+            self.call_from_thread(self._show_volume_roi_stats, key, combine_stats(parts))
+
+        self.run_worker(compute, group="roi", exclusive=True, thread=True)
+
+    def _show_volume_roi_stats(self, key: tuple, stats):
+        """Store the all-slice ROI result if the ROI has not changed since."""
+        if self.roi_volume_stats == (key, None) and key == self._roi_key():
+            self.roi_volume_stats = (key, stats)
+            self._update_status()
+
     def _add_crosshair_overlay(self, pil_image):
         """Add red crosshair overlay to the PIL image."""
         from PIL import Image as PILImage, ImageDraw
@@ -473,10 +1079,12 @@ class ImageViewer(App):
         draw = ImageDraw.Draw(overlay)
 
         # Calculate crosshair position (PIL uses (x, y) coordinates)
-        # Account for zoom level
+        # Account for zoom level, scroll offset and screen-resolution reduction
         width, height = pil_image.size
-        x = int(self.crosshair_x * self.zoom_level)
-        y = int(self.crosshair_y * self.zoom_level)
+        origin_x, origin_y = self._render_origin
+        scale_x, scale_y = self._render_scale
+        x = int((self.crosshair_x - origin_x) * scale_x)
+        y = int((self.crosshair_y - origin_y) * scale_y)
 
         # Ensure crosshair is within bounds
         if 0 <= x < width and 0 <= y < height:
@@ -489,102 +1097,564 @@ class ImageViewer(App):
             # Draw vertical line
             draw.line([(x, 0), (x, height - 1)], fill=(255, 0, 0, alpha), width=1)
 
+        # Outline the ROI around the crosshair
+        if self.roi_shape is not None:
+            radius = self.roi_radius
+            box = [
+                (self.crosshair_x - radius - origin_x) * scale_x,
+                (self.crosshair_y - radius - origin_y) * scale_y,
+                (self.crosshair_x + radius + 1 - origin_x) * scale_x - 1,
+                (self.crosshair_y + radius + 1 - origin_y) * scale_y - 1,
+            ]
+            outline = (255, 255, 0, int(self.crosshair_opacity * 255))
+            if self.roi_shape == "ellipse":
+                draw.ellipse(box, outline=outline, width=1)
+            else:
+                draw.rectangle(box, outline=outline, width=1)
+
         # Composite the overlay onto the original image
         result = PILImage.alpha_composite(pil_image, overlay)
         return result
 
-    def _update_display(self):
-        """Update the image display."""
+    def _get_viewport_pixels(self) -> Tuple[int, int]:
+        """Get the pixel size of the image area (cell size x cells)."""
         try:
-            slice_2d = self._get_current_slice()
+            from textual_image._terminal import get_cell_size
+
+            container = self.query_one("#image_container")
+            cell = get_cell_size()
+            width = container.content_size.width * cell.width
+            height = container.content_size.height * cell.height
+        except Exception:
+            return 0, 0
+        if self._comparing():
+            # Each pane of the comparison gets half of the width
+            width = max(0, (width - PANE_GAP) // 2)
+        return width, height
+
+    def _fill_cell(self, pil_image):
+        """Enlarge images smaller than one terminal cell, which cannot be drawn."""
+        from PIL import Image as PILImage
+
+        try:
+            from textual_image._terminal import get_cell_size
+
+            cell = get_cell_size()
+        except Exception:
+            return pil_image
+        repeat = max(
+            -(-cell.width // pil_image.width), -(-cell.height // pil_image.height), 1
+        )
+        if repeat == 1:
+            return pil_image
+        return pil_image.resize(
+            (pil_image.width * repeat, pil_image.height * repeat), PILImage.Resampling.NEAREST
+        )
+
+    def _get_scroll_origin(self, zoomed_width: int, zoomed_height: int) -> Tuple[int, int]:
+        """Get the top-left corner of the visible area in zoomed pixels."""
+        if self.scroll_x > 0 or self.scroll_y > 0:
+            return min(self.scroll_x, zoomed_width - 1), min(self.scroll_y, zoomed_height - 1)
+        return 0, 0
+
+    def _pixel_aspect(self, axes: Optional[Tuple[int, int]] = None) -> Tuple[float, float]:
+        """Physical width and height of a displayed pixel, the smaller being 1.
+
+        Stretching the coarser axis by this ratio shows sagittal and coronal
+        slices of anisotropic volumes with their true proportions, without
+        resampling the volume.
+
+        Args:
+            axes: Row and column axes of the slice; the displayed slice's
+                by default
+        """
+        try:
+            spacing = self.loader.array_spacing()
+        except RuntimeError:
+            return 1.0, 1.0
+        if axes is not None:
+            row_axis, col_axis = axes
+        elif len(self.shape) == 2:
+            row_axis, col_axis = 0, 1
+        else:
+            # Rows follow display_x and columns display_y, as in _get_slice
+            row_axis, col_axis = self.display_x, self.display_y
+        if len(spacing) != len(self.shape):
+            return 1.0, 1.0
+
+        width, height = abs(spacing[col_axis]), abs(spacing[row_axis])
+        if width <= 0 or height <= 0:
+            return 1.0, 1.0
+        finer = min(width, height)
+        return width / finer, height / finer
+
+    def _display_scale(self) -> Tuple[float, float]:
+        """Source-to-screen scale of columns and rows: zoom times pixel aspect."""
+        aspect_x, aspect_y = self._pixel_aspect()
+        return self.zoom_level * aspect_x, self.zoom_level * aspect_y
+
+    def _get_reduction(self, shape: Tuple[int, int]) -> Tuple[int, float]:
+        """Get the block-mean factor and fit-to-viewport scale for a slice.
+
+        Returns:
+            Tuple of (integer reduction factor, fit scale in 0-1)
+        """
+        scale_x, scale_y = self._display_scale()
+        zoomed_width = max(1, int(shape[1] * scale_x))
+        zoomed_height = max(1, int(shape[0] * scale_y))
+        left, top = self._get_scroll_origin(zoomed_width, zoomed_height)
+
+        # Reduce no further than the less-shrunk axis needs; the final
+        # resize takes care of the other one
+        viewport_width, viewport_height = self._get_viewport_pixels()
+        if viewport_width <= 0 or viewport_height <= 0:
+            return reduction_factor(max(scale_x, scale_y)), 1.0
+
+        fit = min(
+            1.0,
+            viewport_width / (zoomed_width - left),
+            viewport_height / (zoomed_height - top),
+        )
+        return reduction_factor(max(scale_x, scale_y) * fit), fit
+
+    def _window_gray(
+        self,
+        data: np.ndarray,
+        factor: int = 1,
+        strided: bool = False,
+        comparison: Optional[Comparison] = None,
+    ) -> np.ndarray:
+        """Window/level (or equalize) 2D data to gray levels, reduced by ``factor``.
+
+        Data is reduced by block averaging, or for previews by taking every
+        ``factor``-th pixel before windowing. Large slices are processed in
+        row bands on the render thread pool. Data of the compared volume is
+        windowed with its rescale, histogram and window/level.
+        """
+        loader = self.loader if comparison is None else comparison.loader
+        levels = self.display_levels
+        histogram = loader.get_histogram() if self.display_mode == "equalized" else None
+        center, width = self.window_center, self.window_width
+        if comparison is not None:
+            center, width = comparison.window(center, width)
+
+        def stage(band: np.ndarray) -> np.ndarray:
+            if strided:
+                band = band[::factor, ::factor]
+            if histogram is not None:
+                gray = histogram.apply_equalization(band, levels)
+            else:
+                gray = loader.apply_window_level(band, center, width, levels)
+            return gray if strided else block_mean(gray, factor)
+
+        return render_bands(stage, np.asarray(data), factor)
+
+    def _apply_colormap(self, gray: np.ndarray) -> np.ndarray:
+        """Map gray levels to RGB through the current colormap's table."""
+        levels = self.display_levels
+        colormap = self.colormap_manager.get_colormap(self.current_colormap)
+        return render_bands(lambda band: colormap.apply(band, levels), gray)
+
+    def _window_and_colormap(
+        self,
+        data: np.ndarray,
+        factor: int = 1,
+        strided: bool = False,
+        comparison: Optional[Comparison] = None,
+    ) -> np.ndarray:
+        """Window, optionally reduce, and colormap 2D data to RGB (see ``_window_gray``)."""
+        return self._apply_colormap(self._window_gray(data, factor, strided, comparison))
+
+    def _window_key(self, comparison: Optional[Comparison] = None) -> tuple:
+        """Inputs of the window stage besides the slice itself."""
+        window = None
+        if self.display_mode != "equalized":
+            window = (self.window_center, self.window_width)
+            if comparison is not None:
+                window = comparison.window(*window)
+        return self.display_mode, window, self.display_levels
+
+    def _labels_visible(self) -> bool:
+        return (
+            self.label_map is not None
+            and self.label_mode is not None
+            and self.label_map.shape == tuple(self.shape)
+        )
+
+    def _slice_layout(self) -> SliceLayout:
+        """Mapping of the displayed slice onto the volume axes (3D volumes)."""
+        # Rows follow display_x and columns display_y, as in _get_slice
+        return SliceLayout(
+            self.slice_axis,
+            self.current_slice,
+            self.display_x,
+            self.display_y,
+            flip_rows=self.display_y in self.dim_flipped,
+            flip_cols=self.display_x in self.dim_flipped,
+        )
+
+    def _fusion_visible(self) -> bool:
+        return (
+            self.fusion is not None
+            and self.fusion.visible
+            and self.slice_axis is not None
+            and self.fusion.compatible_with(self.loader)
+        )
 
-            # Apply window/level
-            display_array = self.loader.apply_window_level(
-                slice_2d, self.window_center, self.window_width
+    def _blend_key(self) -> tuple:
+        """Display state of the fused volume and the label overlay."""
+        fusion = labels = None
+        if self._fusion_visible():
+            fusion = (
+                self.fusion.colormap,
+                self.fusion.opacity,
+                self.fusion.window_center,
+                self.fusion.window_width,
             )
+        if self._labels_visible():
+            labels = (self.label_mode, self.label_opacity)
+        return fusion, labels
+
+    def _blend_overlays(self, rgb: np.ndarray, top: int, left: int, factor: int) -> np.ndarray:
+        """Draw the fused volume, then the label overlay, onto a rendered region."""
+        if self._fusion_visible():
+            resampled = self.fusion.resample(
+                self.loader, self._slice_layout(), factor, (self._slice_key(), factor)
+            )
+            self.fusion.blend(rgb, resampled, top // factor, left // factor, self.display_levels)
+        return self._blend_labels(rgb, top, left, factor)
+
+    def _blend_labels(self, rgb: np.ndarray, top: int, left: int, factor: int) -> np.ndarray:
+        """Draw the label overlay onto a rendered region.
+
+        The colored labels, mask and outlines of each slice are computed once
+        per reduction factor and cached, so scrolling through an overlay
+        costs only the blend.
+
+        Args:
+            rgb: Rendered region, reduced by ``factor``
+            top, left: Source pixel of the region's top-left corner
+            factor: Block-mean reduction factor of the region
+        """
+        if not self._labels_visible():
+            return rgb
+
+        key = (self._slice_key(), factor)
+        overlay = self._overlay_cache.get(key)
+        if overlay is None:
+            label_slice = self._get_slice(self.current_slice, self.label_map.labels)
+            overlay = self.label_map.slice_overlay(label_slice[::factor, ::factor])
+            self._overlay_cache.put(key, overlay)
+
+        return blend_overlay(
+            rgb, overlay, top // factor, left // factor, self.label_mode, self.label_opacity
+        )
 
-            # Apply colormap
-            rgb_array = self.colormap_manager.apply_colormap(
-                display_array, self.current_colormap
+    def _zoom_and_crop(
+        self, rgb: np.ndarray, factor: int, fit: float, scale: Tuple[float, float]
+    ):
+        """Scale a rendered slice to the screen and crop it at the scroll origin.
+
+        ``rgb`` covers the whole slice, each pixel standing for ``factor``
+        source pixels. The crop is aligned to whole rendered pixels, and the
+        region is resized once to its zoomed size (``scale``, from
+        ``_display_scale``) shrunk by ``fit``.
+
+        Returns:
+            (image, source pixel of its top-left corner, screen pixels per
+            source pixel along x and y)
+        """
+        from PIL import Image as PILImage
+
+        scale_x, scale_y = scale
+        source_height, source_width = self._slice_shape()
+        zoomed_width = max(1, int(source_width * scale_x))
+        zoomed_height = max(1, int(source_height * scale_y))
+        left, top = self._get_scroll_origin(zoomed_width, zoomed_height)
+        col = min(int(left / scale_x) // factor, rgb.shape[1] - 1)
+        row = min(int(top / scale_y) // factor, rgb.shape[0] - 1)
+        region = rgb[row:, col:]
+
+        out_width = max(1, int((zoomed_width - col * factor * scale_x) * fit))
+        out_height = max(1, int((zoomed_height - row * factor * scale_y) * fit))
+        pil_image = PILImage.fromarray(np.ascontiguousarray(region), mode="RGB")
+        if pil_image.size != (out_width, out_height):
+            pil_image = pil_image.resize(
+                (out_width, out_height), PILImage.Resampling.NEAREST
             )
 
-            # Convert to PIL Image
-            from PIL import Image as PILImage
+        scale = (
+            out_width / (region.shape[1] * factor),
+            out_height / (region.shape[0] * factor),
+        )
+        return pil_image, (col * factor, row * factor), scale
+
+    def _preview_step(self, interactive: bool) -> int:
+        """Pixel step of the frame: above 1 for coarse previews during rapid input."""
+        if not interactive:
+            return 1
+        self._interaction.note()
+        slice_shape = self._slice_shape()
+        step = self._interaction.preview_step(slice_shape[0] * slice_shape[1])
+        if step > 1:
+            self._schedule_refine()
+        return step
+
+    def _render_pane(
+        self, step: int, factor: int, fit: float, comparison: Optional[Comparison] = None
+    ):
+        """Render the current slice of the current or the compared volume.
+
+        Runs the pane's pipeline through the zoom stage: each stage reuses
+        its last output while its key, which extends the key of the stage
+        before it, is unchanged. Safe to run on a worker thread: the
+        reduction is worked out by the caller, and only the current
+        volume's pane updates the crosshair mapping.
+
+        Returns:
+            (zoom stage key, image)
+        """
+        pipeline = self.pipeline if comparison is None else comparison.pipeline
+        volume = self.session.current_index if comparison is None else comparison.index
+        array = comparison.array if comparison is not None else None
+        reduction = factor * step
+        # Read from a coarser level of multiscale volumes when one is enough
+        source, index, level = self._slice_source(reduction, array)
+
+        key = (
+            volume,
+            self.slice_axis,
+            tuple(sorted(self.extra_indices.items())),
+            index,
+            self.display_x,
+            self.display_y,
+            level,
+        )
+        raw = pipeline.run("extract", key, lambda: self._extract_slice(index, source))
+        key = (key, self.display_x in self.dim_flipped, self.display_y in self.dim_flipped)
+        oriented = pipeline.run("orient", key, lambda: self._orient_slice(raw))
+
+        key = (key, reduction, step > 1, self._window_key(comparison))
+        gray = pipeline.run(
+            "window",
+            key,
+            lambda: self._window_gray(oriented, reduction // level, step > 1, comparison),
+        )
+        key = (key, self.current_colormap)
+        rgb = pipeline.run("colormap", key, lambda: self._apply_colormap(gray))
+
+        # Overlays belong to the current volume; blending works on a copy
+        # so the colormap stage keeps its own output
+        if comparison is None and (self._fusion_visible() or self._labels_visible()):
+            key = (key, self._blend_key())
+            rgb = pipeline.run(
+                "blend", key, lambda: self._blend_overlays(rgb.copy(), 0, 0, reduction)
+            )
 
-            pil_image = PILImage.fromarray(rgb_array, mode="RGB")
+        # Full-resolution slices are zoomed as they are; reduced ones are
+        # fitted to the viewport
+        fit = fit if reduction > 1 else 1.0
+        display_scale = self._display_scale()
+        key = (key, display_scale, fit, self.scroll_x, self.scroll_y)
+        image, origin, scale = pipeline.run(
+            "zoom", key, lambda: self._zoom_and_crop(rgb, reduction, fit, display_scale)
+        )
+        if comparison is None:
+            self._render_origin, self._render_scale = origin, scale
+        return key, image
+
+    def _draw_overlay(self, pipeline: RenderPipeline, key: tuple, image):
+        """Overlay stage: the crosshair and ROI outline, in crosshair mode."""
+        if self.mode != "crosshair":
+            return key, image
+        key = (
+            key,
+            self.crosshair_x,
+            self.crosshair_y,
+            self.crosshair_opacity,
+            self.roi_shape,
+            self.roi_radius,
+        )
+        return key, pipeline.run("overlay", key, lambda: self._add_crosshair_overlay(image))
+
+    def _render_single(self, interactive: bool = False):
+        """Render the current slice with overlays and the crosshair.
+
+        Returns:
+            (frame key, image)
+        """
+        step = self._preview_step(interactive)
+        # Work at the resolution the terminal can actually show
+        factor, fit = self._get_reduction(self._slice_shape())
+        key, image = self._render_pane(step, factor, fit)
+        return self._draw_overlay(self.pipeline, key, image)
+
+    def _render_comparison(self, interactive: bool = False):
+        """Render the current and the compared volume side by side, concurrently.
+
+        Returns:
+            (frame key, image)
+        """
+        step = self._preview_step(interactive)
+        factor, fit = self._get_reduction(self._slice_shape())
+        (left_key, left), (right_key, right) = render_views(
+            [
+                partial(self._render_pane, step, factor, fit),
+                partial(self._render_pane, step, factor, fit, self.comparison),
+            ]
+        )
+        # Both panes show the same region, so the crosshair maps onto either
+        left_key, left = self._draw_overlay(self.pipeline, left_key, left)
+        right_key, right = self._draw_overlay(self.comparison.pipeline, right_key, right)
+        return ("compare", left_key, right_key), compose_panes([left, right])
+
+    def _render_plane(self, axis: int, index: int, box: Tuple[int, int]):
+        """Render the slice at ``index`` across ``axis`` to fit ``box``, in its pixel aspect."""
+        from PIL import Image as PILImage
+
+        rows, cols = plane_axes(axis)
+        selection = [slice(None)] * 3
+        selection[axis] = index
+        plane = np.asarray(self.array[tuple(selection)])
+        if rows in self.dim_flipped:
+            plane = plane[::-1]
+        if cols in self.dim_flipped:
+            plane = plane[:, ::-1]
+
+        aspect_x, aspect_y = self._pixel_aspect((rows, cols))
+        fit = min(
+            box[0] / (plane.shape[1] * aspect_x), box[1] / (plane.shape[0] * aspect_y)
+        )
+        factor = reduction_factor(fit * max(aspect_x, aspect_y))
+        pil_image = PILImage.fromarray(self._window_and_colormap(plane, factor), mode="RGB")
 
-            # Apply zoom if not 1.0
-            if self.zoom_level != 1.0:
-                width, height = pil_image.size
-                new_width = int(width * self.zoom_level)
-                new_height = int(height * self.zoom_level)
-                pil_image = pil_image.resize(
-                    (new_width, new_height), PILImage.Resampling.NEAREST
-                )
+        size = (
+            max(1, int(plane.shape[1] * aspect_x * fit)),
+            max(1, int(plane.shape[0] * aspect_y * fit)),
+        )
+        if pil_image.size != size:
+            pil_image = pil_image.resize(size, PILImage.Resampling.NEAREST)
+        return pil_image
+
+    def _render_mpr(self):
+        """Compose the three planes through the MPR point, side by side."""
+        viewport_width, viewport_height = self._get_viewport_pixels()
+        if viewport_width <= 0 or viewport_height <= 0:
+            viewport_width, viewport_height = 3 * max(self.shape), max(self.shape)
+        box = (max(1, (viewport_width - 2 * PLANE_GAP) // 3), max(1, viewport_height))
+        # Everything besides the plane's own slice that its pixels depend on
+        key = (
+            self.session.current_index,
+            id(self.array),
+            self.window_center,
+            self.window_width,
+            self.current_colormap,
+            self.display_levels,
+            self.display_mode,
+            frozenset(self.dim_flipped),
+        )
+        return self.mpr.frame(
+            self._render_plane, key, box, self.dim_flipped, self.crosshair_opacity
+        )
 
-            # Apply scroll offset by cropping the image
-            if self.scroll_x > 0 or self.scroll_y > 0:
-                width, height = pil_image.size
-                left = min(self.scroll_x, width - 1)
-                top = min(self.scroll_y, height - 1)
-                right = width
-                bottom = height
-                if left < right and top < bottom:
-                    pil_image = pil_image.crop((left, top, right, bottom))
-
-            # Add crosshair overlay if in crosshair mode
-            if self.mode == "crosshair":
-                pil_image = self._add_crosshair_overlay(pil_image)
-
-            # Update image widget
-            image_widget = self.query_one("#image_display")
-
-            # SixelImage requires file path
-            if isinstance(image_widget, SixelImage):
-                import tempfile
-                # Save to temp file
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False, dir='/tmp') as tmp:
-                    tmp_path = tmp.name
-                pil_image.save(tmp_path, format='PNG')
-                image_widget.image = tmp_path
-
-                # Clean up old temp file
-                if hasattr(self, '_last_tmp_file') and self._last_tmp_file:
-                    try:
-                        os.unlink(self._last_tmp_file)
-                    except:
-                        pass
-                self._last_tmp_file = tmp_path
+    def _update_display(self, interactive: bool = False):
+        """Update the image display.
+
+        Args:
+            interactive: The update follows a navigation or window/level
+                input; rapid inputs get coarse preview frames
+        """
+        try:
+            if self.mpr is not None:
+                # The planes are cached by the layout itself
+                key, pil_image = None, self._render_mpr()
+            elif self._comparing():
+                key, pil_image = self._render_comparison(interactive)
             else:
-                # Other widgets accept PIL Images directly
-                image_widget.image = pil_image
+                key, pil_image = self._render_single(interactive)
+
+            # Encode stage: an unchanged frame is not handed to the widget again
+            self.pipeline.run("encode", key, partial(self._show_frame, pil_image))
 
             self._update_status()
 
         except Exception as e:
             self.query_one("#status", Static).update(f"Display error: {e}")
 
+    def _show_frame(self, pil_image):
+        """Hand a frame to the image widget, which encodes it for the terminal."""
+        pil_image = self._fill_cell(pil_image)
+
+        # Update image widget
+        image_widget = self.query_one("#image_display")
+
+        # SixelImage requires file path
+        if isinstance(image_widget, SixelImage):
+            import tempfile
+            # Save to temp file
+            with tempfile.NamedTemporaryFile(suffix='.png', delete=False, dir='/tmp') as tmp:
+                tmp_path = tmp.name
+            pil_image.save(tmp_path, format='PNG')
+            image_widget.image = tmp_path
+
+            # Clean up old temp file
+            if hasattr(self, '_last_tmp_file') and self._last_tmp_file:
+                try:
+                    os.unlink(self._last_tmp_file)
+                except:
+                    pass
+            self._last_tmp_file = tmp_path
+        else:
+            # Other widgets accept PIL Images directly
+            image_widget.image = pil_image
+
+    def _schedule_refine(self):
+        """Render at full quality once input has been idle for a moment."""
+        if self._refine_timer is not None:
+            self._refine_timer.stop()
+        self._refine_timer = self.set_timer(REFINE_DELAY, self._refine_display)
+
+    def _refine_display(self):
+        self._refine_timer = None
+        self._update_display()
+
     def _update_status(self):
         """Update the status bar."""
         status_parts = []
 
         # File info
-        status_parts.append(f"File: {self.image_path.name}")
+        status_parts.append(f"File: {self.session.current.label}")
+        if len(self.session) > 1:
+            status_parts.append(
+                f"Volume: {self.session.current_index + 1}/{len(self.session)}"
+            )
 
         # Dimensions
         status_parts.append(f"Shape: {self.shape}")
 
         # Current slice info
-        if self.slice_axis is not None and len(self.shape) > 2:
+        if self.mpr is not None:
+            point = tuple(self.mpr.point)
+            intensity = self.loader.to_real(float(self.array[point]))
+            status_parts.append(
+                f"MPR: dim{self.mpr.active} | Point: {point} = {intensity:.2f} "
+                f"| Rendered: {self.mpr.rendered}/3"
+            )
+        elif self.slice_axis is not None and len(self.shape) > 2:
             status_parts.append(
                 f"Slice: {self.current_slice + 1}/{self.shape[self.slice_axis]}"
             )
+            for axis, extra_index in sorted(self.extra_indices.items()):
+                status_parts.append(f"dim{axis}: {extra_index + 1}/{self.shape[axis]}")
 
         # Display axes
         status_parts.append(f"Display: X=dim{self.display_x}, Y=dim{self.display_y}")
 
         # Window/Level
-        status_parts.append(f"W/L: {self.window_width:.1f}/{self.window_center:.1f}")
+        if self.display_mode == "equalized":
+            status_parts.append("W/L: Equalized")
+        else:
+            status_parts.append(f"W/L: {self.window_width:.1f}/{self.window_center:.1f}")
 
         # Zoom level
         status_parts.append(f"Zoom: {self.zoom_level:.1f}x")
@@ -596,8 +1666,54 @@ class ImageViewer(App):
         # Colormap
         status_parts.append(f"Colormap: {self.current_colormap}")
 
+        # Fused volume
+        if self.fusion is not None:
+            if not self.fusion.compatible_with(self.loader):
+                status_parts.append("Fusion: needs a 3D volume")
+            elif not self.fusion.visible:
+                status_parts.append("Fusion: off")
+            else:
+                target = "*" if self.window_target == "fusion" else ""
+                status_parts.append(
+                    f"Fusion{target}: {self.fusion.colormap} {self.fusion.opacity:.0%} "
+                    f"W/L {self.fusion.window_width:.1f}/{self.fusion.window_center:.1f}"
+                )
+
+        # Compared volume
+        if self.comparison is not None:
+            label = self.comparison.label
+            if not self.comparison.matches(self.shape):
+                status_parts.append(f"Compare: {label} (shape mismatch)")
+            elif self.comparison.link_window:
+                status_parts.append(f"Compare: {label} (W/L linked)")
+            else:
+                target = "*" if self.window_target == "compare" else ""
+                status_parts.append(
+                    f"Compare{target}: {label} W/L "
+                    f"{self.comparison.window_width:.1f}/{self.comparison.window_center:.1f}"
+                )
+
+        # Label overlay
+        if self.label_map is not None:
+            if self.label_map.shape != tuple(self.shape):
+                status_parts.append("Labels: shape mismatch")
+            elif self.label_mode is None:
+                status_parts.append("Labels: off")
+            else:
+                status_parts.append(
+                    f"Labels: {self.label_map.label_count} "
+                    f"({self.label_mode} {self.label_opacity:.0%}, {self.label_map.storage})"
+                )
+
+        # Watch mode: outcome of the last reload
+        if self.watch and self._reload_note:
+            status_parts.append(f"Watch: {self._reload_note}")
+
+        # Resident pixel memory across the session
+        status_parts.append(f"Mem: {format_size(self.session.resident_bytes)}")
+
         # Mode-specific info
-        if self.mode == "crosshair":
+        if self.mode == "crosshair" and self.mpr is None:
             status_parts.append(f"Crosshair: ({self.crosshair_x}, {self.crosshair_y})")
             status_parts.append(f"Opacity: {self.crosshair_opacity:.1f}")
             # Get intensity value at crosshair
@@ -606,16 +1722,61 @@ class ImageViewer(App):
                 0 <= self.crosshair_y < slice_2d.shape[0]
                 and 0 <= self.crosshair_x < slice_2d.shape[1]
             ):
-                intensity = slice_2d[self.crosshair_y, self.crosshair_x]
+                intensity = self.loader.to_real(
+                    float(slice_2d[self.crosshair_y, self.crosshair_x])
+                )
                 status_parts.append(f"Intensity: {intensity:.2f}")
+                if self._comparing():
+                    compared = self._get_slice(self.current_slice, self.comparison.array)
+                    intensity = self.comparison.loader.to_real(
+                        float(compared[self.crosshair_y, self.crosshair_x])
+                    )
+                    status_parts.append(f"Compared: {intensity:.2f}")
+
+            if self.roi_shape is not None:
+                stats = self._get_roi_stats()
+                if stats is not None:
+                    status_parts.append(
+                        f"ROI: {stats.mean:.2f}±{stats.std:.2f} "
+                        f"[{stats.min:.2f}, {stats.max:.2f}] n={stats.count}"
+                    )
+                if self.roi_volume_stats and self.roi_volume_stats[0] == self._roi_key():
+                    volume_stats = self.roi_volume_stats[1]
+                    if volume_stats is None:
+                        status_parts.append("ROI all slices: computing...")
+                    else:
+                        volume_stats = self._to_real_stats(volume_stats)
+                        status_parts.append(
+                            f"ROI all slices: {volume_stats.mean:.2f}±{volume_stats.std:.2f} "
+                            f"[{volume_stats.min:.2f}, {volume_stats.max:.2f}] n={volume_stats.count}"
+                        )
 
         # Key bindings based on mode
-        if self.mode == "normal":
-            keys = "q:Quit | ↑↓/jk:Slice | wasd:Scroll | t:Dims | c:Colormap | h:Crosshair | Shift+w:W/L | []:Zoom"
+        if self.mpr is not None and self.mode == "normal":
+            keys = "q:Quit | ↑↓/jk:Slice | ←→:Plane | m:Single view | h:Crosshair | Shift+w:W/L | c:Colormap | e:Equalize | p:Auto W/L"
+        elif self.mpr is not None and self.mode == "crosshair":
+            keys = "ESC:Exit | ↑↓←→/hjkl:Move point in plane | Shift+↑↓/jk:Opacity"
+        elif self.mode == "normal":
+            keys = "q:Quit | ↑↓/jk:Slice | wasd:Scroll | t:Dims | c:Colormap | h:Crosshair | Shift+w:W/L | e:Equalize | p:Auto W/L | []:Zoom | n/N/b:Volume"
+            if len(self.shape) == 3 and self.comparison is None:
+                keys += " | m:MPR"
+            if self.comparison is not None:
+                keys += " | v:Single view | V:Link W/L"
+            elif len(self.session) > 1:
+                keys += " | v:Compare"
+            for position, axis in enumerate(sorted(self.extra_indices)[:2]):
+                keys += f" | {'<>' if position else ',.'}:dim{axis}"
+            if self.label_map is not None:
+                keys += " | o/O:Labels"
+            if self.fusion is not None:
+                keys += " | f/F:Fusion"
         elif self.mode == "crosshair":
-            keys = "ESC:Exit | ↑↓←→/hjkl:Move crosshair | Shift+↑↓/jk:Opacity"
+            keys = "ESC:Exit | ↑↓←→/hjkl:Move crosshair | Shift+↑↓/jk:Opacity | r:ROI shape | +/-:ROI size | R:ROI all slices"
         elif self.mode == "window_level":
             keys = "ESC:Exit | ↑↓/jk:Window(1%) | ←→/hl:Level(1%) | Shift+keys:5%"
+            targets = self._window_targets()
+            if len(targets) > 1:
+                keys += " | v:" + "/".join(targets).capitalize()
         elif self.mode == "dimension_select":
             keys = "ESC:Exit | ↑↓/jk:Navigate | x/y:Assign | f:Flip | Enter:Confirm"
         else:
@@ -626,35 +1787,41 @@ class ImageViewer(App):
 
     def action_slice_up(self):
         """Move to previous slice."""
-        if self.mode == "normal" and self.slice_axis is not None:
+        if self.mpr is not None and self.mode in ("normal", "crosshair"):
+            if self.mode == "normal":
+                self.mpr.move(self.mpr.active, -1)
+            else:
+                self.mpr.move_in_plane(-1, 0)
+            self._update_display(interactive=True)
+        elif self.mode == "normal" and self.slice_axis is not None:
             self.current_slice = max(0, self.current_slice - 1)
-            self._update_display()
+            self._update_display(interactive=True)
         elif self.mode == "crosshair":
             self.crosshair_y = max(0, self.crosshair_y - 1)
-            self._update_display()
+            self._update_display(interactive=True)
         elif self.mode == "window_level":
-            min_intensity, max_intensity = self._get_intensity_range()
-            intensity_range = max_intensity - min_intensity
-            increment = max(1, intensity_range * 0.01)  # 1% of intensity range
-            self.window_width = max(1, self.window_width + increment)
-            self._update_display()
+            self._adjust_window(width_delta=self._window_step(0.01))  # 1% of intensity range
+            self._update_display(interactive=True)
 
     def action_slice_down(self):
         """Move to next slice."""
-        if self.mode == "normal" and self.slice_axis is not None:
+        if self.mpr is not None and self.mode in ("normal", "crosshair"):
+            if self.mode == "normal":
+                self.mpr.move(self.mpr.active, 1)
+            else:
+                self.mpr.move_in_plane(1, 0)
+            self._update_display(interactive=True)
+        elif self.mode == "normal" and self.slice_axis is not None:
             max_slice = self.shape[self.slice_axis] - 1
             self.current_slice = min(max_slice, self.current_slice + 1)
-            self._update_display()
+            self._update_display(interactive=True)
         elif self.mode == "crosshair":
-            slice_2d = self._get_current_slice()
-            self.crosshair_y = min(slice_2d.shape[0] - 1, self.crosshair_y + 1)
-            self._update_display()
+            slice_shape = self._slice_shape()
+            self.crosshair_y = min(slice_shape[0] - 1, self.crosshair_y + 1)
+            self._update_display(interactive=True)
         elif self.mode == "window_level":
-            min_intensity, max_intensity = self._get_intensity_range()
-            intensity_range = max_intensity - min_intensity
-            increment = max(1, intensity_range * 0.01)  # 1% of intensity range
-            self.window_width = max(1, self.window_width - increment)
-            self._update_display()
+            self._adjust_window(width_delta=-self._window_step(0.01))  # 1% of intensity range
+            self._update_display(interactive=True)
 
     def action_toggle_dimensions(self):
         """Show dimension selection modal."""
@@ -662,16 +1829,14 @@ class ImageViewer(App):
 
             def handle_dimension_result(result: dict | None):
                 if result:
+                    self.workers.cancel_group(self, "roi")
                     self.display_x = result["x"]
                     self.display_y = result["y"]
                     self.dim_flipped = result["flipped"]
 
                     # Update slice axis
                     if len(self.shape) >= 3:
-                        all_axes = set(range(len(self.shape)))
-                        display_axes = {self.display_x, self.display_y}
-                        remaining_axes = list(all_axes - display_axes)
-                        self.slice_axis = remaining_axes[0] if remaining_axes else None
+                        self._assign_slice_axes()
                         self.current_slice = 0  # Reset to first slice
 
                     # Reset scroll offsets to prevent out-of-bounds crop
@@ -697,6 +1862,61 @@ class ImageViewer(App):
             modal = ColormapSelectionScreen(self.current_colormap)
             self.push_screen(modal, handle_colormap_result)
 
+    def action_step_extra(self, position: int, step: int):
+        """Step the index on the first or second extra axis (time, echo) of 4D+ data."""
+        axes = sorted(self.extra_indices)
+        if self.mode != "normal" or position >= len(axes):
+            return
+        axis = axes[position]
+        self.extra_indices[axis] = min(
+            max(0, self.extra_indices[axis] + step), self.shape[axis] - 1
+        )
+        self._update_display(interactive=True)
+
+    def action_toggle_mpr(self):
+        """Switch between the single slice and the three-plane layout (3D volumes)."""
+        if self.mode != "normal" or len(self.shape) != 3 or self.comparison is not None:
+            return
+        if self.mpr is not None:
+            # Keep the single view's slice where the MPR point is
+            self.current_slice = self.mpr.point[self.slice_axis]
+            self.mpr = None
+        elif isinstance(self.array, LazyArray) and not isinstance(self.array, ChunkedArray):
+            # Only slices across the first axis are read lazily; the other
+            # planes would load the whole volume
+            self.query_one("#status", Static).update(
+                "Three-plane view needs the whole volume: not available for lazily read files"
+            )
+            return
+        else:
+            point = [n // 2 for n in self.shape]
+            point[self.slice_axis] = self.current_slice
+            self.mpr = MPRLayout(self.shape, point)
+            self.mpr.active = self.slice_axis
+        self._update_display()
+
+    def action_toggle_compare(self):
+        """Show the next volume beside the current one, or go back to a single pane."""
+        if self.mode != "normal" or self.mpr is not None or len(self.session) < 2:
+            return
+        if self.comparison is not None:
+            self.comparison = None
+            self.session.compare(None)
+            if self.window_target == "compare":
+                self.window_target = "primary"
+        else:
+            self._compare_with(self.session.current_index + 1)
+        self._update_display()
+
+    def action_toggle_window_link(self):
+        """Link or unlink the compared volume's window/level from the current one's."""
+        if self.mode != "normal" or self.comparison is None:
+            return
+        self.comparison.link_window = not self.comparison.link_window
+        if self.comparison.link_window and self.window_target == "compare":
+            self.window_target = "primary"
+        self._update_display()
+
     def action_crosshair_mode(self):
         """Toggle crosshair mode."""
         if self.mode == "normal":
@@ -707,6 +1927,84 @@ class ImageViewer(App):
         """Toggle window/level mode."""
         if self.mode == "normal":
             self.mode = "window_level"
+            # Window/level only applies to the linear display
+            self.display_mode = "linear"
+            self._update_display()
+
+    def action_toggle_equalization(self):
+        """Toggle histogram-equalized display."""
+        if self.mode == "normal":
+            self.display_mode = "linear" if self.display_mode == "equalized" else "equalized"
+            self._update_display()
+
+    def action_auto_window(self):
+        """Set window/level to the 1st-99th percentile of the volume."""
+        if self.mode == "normal":
+            histogram = self.loader.get_histogram()
+            self.window_center, self.window_width = histogram.percentile_window(1.0, 99.0)
+            self.display_mode = "linear"
+            self._update_display()
+
+    def _window_targets(self) -> list:
+        """Volumes with their own window/level: primary, fusion, compare."""
+        targets = ["primary"]
+        if self.fusion is not None:
+            targets.append("fusion")
+        if self.comparison is not None and not self.comparison.link_window:
+            targets.append("compare")
+        return targets
+
+    def _window_target_volume(self):
+        """The viewer, fusion layer or comparison whose window/level is adjusted."""
+        if self.window_target == "fusion" and self.fusion is not None:
+            return self.fusion
+        if self.window_target == "compare" and self.comparison is not None:
+            return self.comparison
+        return self
+
+    def _window_step(self, fraction: float) -> float:
+        """Window/level increment: ``fraction`` of the target's intensity range."""
+        target = self._window_target_volume()
+        if target is not self:
+            histogram = target.loader.get_histogram()
+            min_intensity, max_intensity = histogram.min, histogram.max
+        else:
+            min_intensity, max_intensity = self._get_intensity_range()
+        return max(1, (max_intensity - min_intensity) * fraction)
+
+    def _adjust_window(self, center_delta: float = 0.0, width_delta: float = 0.0):
+        """Shift the level and/or widen the window of the window/level target."""
+        target = self._window_target_volume()
+        target.window_center += center_delta
+        target.window_width = max(1, target.window_width + width_delta)
+
+    def action_toggle_fusion(self):
+        """Show or hide the fused volume."""
+        if self.mode == "normal" and self.fusion is not None:
+            self.fusion.visible = not self.fusion.visible
+            self._update_display()
+
+    def action_fusion_opacity(self):
+        """Cycle the opacity of the fused volume."""
+        if self.mode == "normal" and self.fusion is not None:
+            opacities = self.OVERLAY_OPACITIES
+            index = opacities.index(self.fusion.opacity) if self.fusion.opacity in opacities else -1
+            self.fusion.opacity = opacities[(index + 1) % len(opacities)]
+            self._update_display()
+
+    def action_toggle_labels(self):
+        """Cycle the label overlay between filled, outlined and hidden."""
+        if self.mode == "normal" and self.label_map is not None:
+            modes = OVERLAY_MODES + (None,)
+            self.label_mode = modes[(modes.index(self.label_mode) + 1) % len(modes)]
+            self._update_display()
+
+    def action_label_opacity(self):
+        """Cycle the opacity of the filled label overlay."""
+        if self.mode == "normal" and self.label_map is not None:
+            opacities = self.OVERLAY_OPACITIES
+            index = opacities.index(self.label_opacity) if self.label_opacity in opacities else -1
+            self.label_opacity = opacities[(index + 1) % len(opacities)]
             self._update_display()
 
     def action_zoom_in(self):
@@ -743,38 +2041,42 @@ class ImageViewer(App):
     def action_scroll_up(self):
         """Scroll image up (WASD navigation)."""
         if self.mode == "normal":
-            slice_2d = self._get_current_slice()
-            scroll_step = max(1, int(slice_2d.shape[0] * 0.05 * self.zoom_level))
+            slice_shape = self._slice_shape()
+            _, scale_y = self._display_scale()
+            scroll_step = max(1, int(slice_shape[0] * 0.05 * scale_y))
             self.scroll_y = max(0, self.scroll_y - scroll_step)
             self._constrain_scroll()
-            self._update_display()
+            self._update_display(interactive=True)
 
     def action_scroll_down(self):
         """Scroll image down (WASD navigation)."""
         if self.mode == "normal":
-            slice_2d = self._get_current_slice()
-            scroll_step = max(1, int(slice_2d.shape[0] * 0.05 * self.zoom_level))
+            slice_shape = self._slice_shape()
+            _, scale_y = self._display_scale()
+            scroll_step = max(1, int(slice_shape[0] * 0.05 * scale_y))
             self.scroll_y += scroll_step
             self._constrain_scroll()
-            self._update_display()
+            self._update_display(interactive=True)
 
     def action_scroll_left(self):
         """Scroll image left (WASD navigation)."""
         if self.mode == "normal":
-            slice_2d = self._get_current_slice()
-            scroll_step = max(1, int(slice_2d.shape[1] * 0.05 * self.zoom_level))
+            slice_shape = self._slice_shape()
+            scale_x, _ = self._display_scale()
+            scroll_step = max(1, int(slice_shape[1] * 0.05 * scale_x))
             self.scroll_x = max(0, self.scroll_x - scroll_step)
             self._constrain_scroll()
-            self._update_display()
+            self._update_display(interactive=True)
 
     def action_scroll_right(self):
         """Scroll image right (WASD navigation)."""
         if self.mode == "normal":
-            slice_2d = self._get_current_slice()
-            scroll_step = max(1, int(slice_2d.shape[1] * 0.05 * self.zoom_level))
+            slice_shape = self._slice_shape()
+            scale_x, _ = self._display_scale()
+            scroll_step = max(1, int(slice_shape[1] * 0.05 * scale_x))
             self.scroll_x += scroll_step
             self._constrain_scroll()
-            self._update_display()
+            self._update_display(interactive=True)
 
     def on_key(self, event):
         """Handle additional key events."""
@@ -818,10 +2120,7 @@ class ImageViewer(App):
 
                 # Update slice axis
                 if len(self.shape) >= 3:
-                    all_axes = set(range(len(self.shape)))
-                    display_axes = {self.display_x, self.display_y}
-                    remaining_axes = list(all_axes - display_axes)
-                    self.slice_axis = remaining_axes[0] if remaining_axes else None
+                    self._assign_slice_axes()
                     self.current_slice = 0  # Reset to first slice
 
                 # Reset scroll offsets to prevent out-of-bounds crop
@@ -830,45 +2129,69 @@ class ImageViewer(App):
 
                 self._hide_dimension_overlay()
                 self._update_display()
+        elif self.mode == "normal" and self.mpr is not None:
+            if event.key in ["left", "right"]:
+                self.mpr.cycle_active(-1 if event.key == "left" else 1)
+                self._update_display()
+        elif self.mode == "crosshair" and self.mpr is not None:
+            if event.key in ["left", "h", "right", "l"]:
+                self.mpr.move_in_plane(0, -1 if event.key in ["left", "h"] else 1)
+                self._update_display(interactive=True)
+            elif event.key in ["shift+up", "K"]:
+                self.crosshair_opacity = min(1.0, self.crosshair_opacity + 0.1)
+                self._update_display()
+            elif event.key in ["shift+down", "J"]:
+                self.crosshair_opacity = max(0.1, self.crosshair_opacity - 0.1)
+                self._update_display()
         elif self.mode == "crosshair":
             if event.key in ["left", "h"]:
                 self.crosshair_x = max(0, self.crosshair_x - 1)
-                self._update_display()
+                self._update_display(interactive=True)
             elif event.key in ["right", "l"]:
-                slice_2d = self._get_current_slice()
-                self.crosshair_x = min(slice_2d.shape[1] - 1, self.crosshair_x + 1)
-                self._update_display()
+                slice_shape = self._slice_shape()
+                self.crosshair_x = min(slice_shape[1] - 1, self.crosshair_x + 1)
+                self._update_display(interactive=True)
             elif event.key in ["shift+up", "K"]:
                 self.crosshair_opacity = min(1.0, self.crosshair_opacity + 0.1)
                 self._update_display()
             elif event.key in ["shift+down", "J"]:
                 self.crosshair_opacity = max(0.1, self.crosshair_opacity - 0.1)
                 self._update_display()
+            elif event.key == "r":
+                # Cycle off -> rectangle -> ellipse -> off
+                shapes = (None,) + ROI_SHAPES
+                self.roi_shape = shapes[(shapes.index(self.roi_shape) + 1) % len(shapes)]
+                self._update_display()
+            elif event.key in ["plus", "equals_sign"] and self.roi_shape is not None:
+                self.roi_radius += max(1, self.roi_radius // 5)
+                self._update_display()
+            elif event.key == "minus" and self.roi_shape is not None:
+                self.roi_radius = max(0, self.roi_radius - max(1, self.roi_radius // 5))
+                self._update_display()
+            elif event.key == "R":
+                self._start_volume_roi_stats()
+                self._update_status()
         elif self.mode == "window_level":
-            min_intensity, max_intensity = self._get_intensity_range()
-            intensity_range = max_intensity - min_intensity
-
             if event.key in ["left", "h"]:
-                increment = max(1, intensity_range * 0.01)  # 1% of intensity range
-                self.window_center -= increment
-                self._update_display()
+                self._adjust_window(center_delta=-self._window_step(0.01))  # 1% of intensity range
+                self._update_display(interactive=True)
             elif event.key in ["right", "l"]:
-                increment = max(1, intensity_range * 0.01)  # 1% of intensity range
-                self.window_center += increment
-                self._update_display()
+                self._adjust_window(center_delta=self._window_step(0.01))  # 1% of intensity range
+                self._update_display(interactive=True)
             elif event.key in ["shift+left", "H"]:
-                increment = max(1, intensity_range * 0.05)  # 5% of intensity range
-                self.window_center -= increment
-                self._update_display()
+                self._adjust_window(center_delta=-self._window_step(0.05))  # 5% of intensity range
+                self._update_display(interactive=True)
             elif event.key in ["shift+right", "L"]:
-                increment = max(1, intensity_range * 0.05)  # 5% of intensity range
-                self.window_center += increment
-                self._update_display()
+                self._adjust_window(center_delta=self._window_step(0.05))  # 5% of intensity range
+                self._update_display(interactive=True)
             elif event.key in ["shift+up", "K"]:
-                increment = max(1, intensity_range * 0.05)  # 5% of intensity range
-                self.window_width = max(1, self.window_width + increment)
-                self._update_display()
+                self._adjust_window(width_delta=self._window_step(0.05))  # 5% of intensity range
+                self._update_display(interactive=True)
             elif event.key in ["shift+down", "J"]:
-                increment = max(1, intensity_range * 0.05)  # 5% of intensity range
-                self.window_width = max(1, self.window_width - increment)
+                self._adjust_window(width_delta=-self._window_step(0.05))  # 5% of intensity range
+                self._update_display(interactive=True)
+            elif event.key == "v" and len(self._window_targets()) > 1:
+                targets = self._window_targets()
+                position = targets.index(self.window_target) if self.window_target in targets else -1
+                self.window_target = targets[(position + 1) % len(targets)]
                 self._update_display()
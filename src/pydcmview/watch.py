@@ -0,0 +1,49 @@
+"""Polling for rewritten image files (``--watch``)."""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+
+# Seconds between checks of the watched files
+DEFAULT_WATCH_INTERVAL = 1.0
+
+# (modification time in ns, size), or None for a missing file
+Signature = Optional[Tuple[int, int]]
+
+
+def file_signature(path: Union[str, Path]) -> Signature:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileWatcher:
+    """Detects changes to a fixed list of files by polling their stat.
+
+    A change is reported once the file has stopped changing, i.e. when two
+    consecutive polls see the same new signature, so a file is not re-read
+    while a pipeline is still writing it.
+    """
+
+    def __init__(self, files: Sequence[Union[str, Path]]):
+        self.files = [Path(f) for f in files]
+        self._known: List[Signature] = [file_signature(f) for f in self.files]
+        self._pending: Dict[int, Signature] = {}
+
+    def poll(self) -> List[int]:
+        """Positions of the files that changed and have settled since the last report."""
+        changed = []
+        for position, path in enumerate(self.files):
+            signature = file_signature(path)
+            if signature == self._known[position]:
+                self._pending.pop(position, None)
+            elif position in self._pending and self._pending[position] == signature:
+                del self._pending[position]
+                self._known[position] = signature
+                changed.append(position)
+            else:
+                self._pending[position] = signature
+        return changed
@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep seek-point indexes and the DICOM index out of the user's cache."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("PYDCMVIEW_CACHE_DIR", str(path))
+    return path
@@ -0,0 +1,76 @@
+"""Synthetic DICOM instances for the tests."""
+
+import numpy as np
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import CTImageStorage, ExplicitVRLittleEndian, generate_uid
+
+
+def make_instance(
+    pixels,
+    series_uid,
+    position=0.0,
+    instance_number=1,
+    study_uid="1.2.3",
+    series_number=1,
+    description="",
+    intercept=None,
+):
+    """A CT image dataset with the given pixels, located along z at ``position``."""
+    pixels = np.asarray(pixels, dtype=np.int16)
+    meta = FileMetaDataset()
+    meta.MediaStorageSOPClassUID = CTImageStorage
+    meta.MediaStorageSOPInstanceUID = generate_uid()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+
+    ds = Dataset()
+    ds.file_meta = meta
+    ds.SOPClassUID = CTImageStorage
+    ds.SOPInstanceUID = meta.MediaStorageSOPInstanceUID
+    ds.PatientID = "P1"
+    ds.PatientName = "Test^Patient"
+    ds.StudyInstanceUID = study_uid
+    ds.StudyDate = "20240101"
+    ds.StudyTime = "120000"
+    ds.StudyID = "1"
+    ds.SeriesInstanceUID = series_uid
+    ds.SeriesNumber = series_number
+    ds.SeriesDescription = description
+    ds.Modality = "CT"
+    ds.InstanceNumber = instance_number
+    ds.ImagePositionPatient = [0.0, 0.0, float(position)]
+    ds.ImageOrientationPatient = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+    ds.PixelSpacing = [1.0, 1.0]
+    ds.Rows, ds.Columns = pixels.shape
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated = ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 1
+    if intercept is not None:
+        ds.RescaleSlope = 1
+        ds.RescaleIntercept = intercept
+    ds.PixelData = pixels.astype("<i2").tobytes()
+    return ds
+
+
+def write_instance(path, *args, **kwargs):
+    """Write ``make_instance(*args, **kwargs)`` to ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    make_instance(*args, **kwargs).save_as(path, enforce_file_format=True)
+    return path
+
+
+def write_series(directory, volume, series_uid, positions=None, **kwargs):
+    """Write each slice of ``volume`` as an instance file; returns the paths in slice order."""
+    positions = range(len(volume)) if positions is None else positions
+    return [
+        write_instance(
+            directory / f"{series_uid}-{index}.dcm",
+            plane,
+            series_uid,
+            position=position,
+            instance_number=index + 1,
+            **kwargs,
+        )
+        for index, (plane, position) in enumerate(zip(volume, positions))
+    ]
@@ -0,0 +1,50 @@
+"""The headless latency benchmark script."""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "benchmark_latency.py"
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    spec = importlib.util.spec_from_file_location("benchmark_latency", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_summarize_percentiles(benchmark):
+    stats = benchmark.summarize(list(range(1, 101)))
+
+    assert stats["count"] == 100 and stats["max"] == 100
+    assert stats["p50"] == pytest.approx(50.5)
+    assert stats["p95"] == pytest.approx(95.05)
+
+
+def test_regressions_beyond_the_tolerance(benchmark):
+    baseline = {"scroll@128": {"p95": 10.0}, "zoom@128": {"p95": 10.0}}
+    results = {
+        "scroll@128": {"p95": 12.4},
+        "zoom@128": {"p95": 12.6},
+        "crosshair@128": {"p95": 99.0},
+    }
+
+    # Scenarios missing from the baseline never fail
+    assert benchmark.regressions(results, baseline, 0.25) == ["zoom@128"]
+    assert benchmark.regressions(results, {}, 0.25) == []
+
+
+def test_scroll_times_every_key_on_a_new_slice(benchmark, tmp_path, monkeypatch):
+    monkeypatch.setitem(benchmark.SCENARIOS, "scroll", ((), ["down"] * 40, ()))
+    # Fewer in-plane positions than the scroll steps: only the axial view
+    # the scenario sets up has enough slices
+    path = benchmark.make_volume(32, tmp_path)
+
+    latencies, stages = asyncio.run(benchmark.run_scenario(path, "scroll"))
+
+    assert len(latencies) == 40 and min(latencies) > 0
+    assert "extract 0%" in stages
@@ -0,0 +1,191 @@
+"""Lazy chunked array stores."""
+
+import itertools
+import json
+import zlib
+
+import numpy as np
+import pytest
+
+from pydcmview.chunked import (
+    ChunkedArray,
+    ChunkFetcher,
+    is_chunked_store,
+    open_chunked_store,
+)
+from pydcmview.image_loader import ImageLoader
+
+
+def write_array(path, array, chunks, order="C", fill_value=0, separator="."):
+    """Write a zlib-compressed Zarr v2 array, omitting chunks of fill value only."""
+    path.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "zarr_format": 2,
+        "shape": list(array.shape),
+        "chunks": list(chunks),
+        "dtype": array.dtype.str,
+        "compressor": {"id": "zlib", "level": 1},
+        "fill_value": "NaN" if np.isnan(fill_value) else fill_value,
+        "order": order,
+        "filters": None,
+        "dimension_separator": separator,
+    }
+    (path / ".zarray").write_text(json.dumps(manifest))
+    grid = [range(-(-n // c)) for n, c in zip(array.shape, chunks)]
+    for index in itertools.product(*grid):
+        part = array[tuple(slice(i * c, (i + 1) * c) for i, c in zip(index, chunks))]
+        if np.array_equal(part, np.full_like(part, fill_value), equal_nan=True):
+            continue
+        block = np.full(chunks, fill_value, dtype=array.dtype)
+        block[tuple(slice(0, n) for n in part.shape)] = part
+        chunk_path = path / separator.join(map(str, index))
+        chunk_path.parent.mkdir(parents=True, exist_ok=True)
+        chunk_path.write_bytes(zlib.compress(block.tobytes(order=order), 1))
+    return path
+
+
+def recording(array):
+    """Record the chunk indices ``array`` reads from disk."""
+    read = []
+    read_chunk = array.read_chunk
+
+    def record(index):
+        read.append(index)
+        return read_chunk(index)
+
+    array.read_chunk = record
+    return read
+
+
+@pytest.fixture
+def volume():
+    z, y, x = np.mgrid[:40, :100, :90]
+    volume = ((x + 2 * y + 3 * z) % 500).astype(np.uint16)
+    volume[:16, :32, :32] = 0
+    return volume
+
+
+@pytest.fixture
+def store(tmp_path, volume):
+    array = ChunkedArray(write_array(tmp_path / "v.zarr", volume, (16, 32, 32)))
+    yield array
+    array.close()
+
+
+def test_slices_along_every_axis(store, volume):
+    assert store.shape == volume.shape and store.dtype == volume.dtype
+
+    np.testing.assert_array_equal(store[17], volume[17])
+    np.testing.assert_array_equal(store[:, 40], volume[:, 40])
+    np.testing.assert_array_equal(store[:, :, -1], volume[:, :, -1])
+    np.testing.assert_array_equal(store[3:30:4, 5:70, ::3], volume[3:30:4, 5:70, ::3])
+    # Omitted chunks read as the fill value
+    np.testing.assert_array_equal(store[0, :32, :32], 0)
+    with pytest.raises(IndexError):
+        store[40]
+
+
+def test_slice_reads_only_the_chunks_it_crosses(store, volume):
+    read = recording(store)
+
+    store[:, :, 50]
+
+    # Column 50 is in chunk column 1; the layer ahead is chunk column 2
+    # (or 0), and nothing else is read
+    assert {index[2] for index in read} <= {0, 1, 2}
+    crossing = {index for index in read if index[2] == 1}
+    assert crossing == set(itertools.product(range(3), range(4), [1]))
+    assert len(read) <= 2 * len(crossing)
+
+
+def test_chunk_cache_hits(store):
+    store[20]
+    misses = store.fetcher.misses
+    store[21]
+
+    assert store.fetcher.misses == misses and store.fetcher.hits >= 12
+
+
+def test_chunk_cache_stays_within_its_bound(tmp_path, volume):
+    chunk_bytes = 16 * 32 * 32 * 2
+    fetcher = ChunkFetcher(workers=2, cache_bytes=5 * chunk_bytes)
+    store = ChunkedArray(write_array(tmp_path / "v.zarr", volume, (16, 32, 32)), fetcher)
+    try:
+        for index in range(0, 40, 5):
+            np.testing.assert_array_equal(store[index], volume[index])
+            assert fetcher.cached_bytes <= fetcher.cache_bytes
+        assert store.resident_bytes == fetcher.cached_bytes
+
+        store.release()
+        assert fetcher.cached_bytes == 0
+    finally:
+        store.close()
+
+
+def test_fortran_order_and_nan_fill(tmp_path):
+    array = np.arange(6 * 7 * 5, dtype=np.float32).reshape(6, 7, 5)
+    array[:3, :4, :4] = np.nan
+    path = write_array(tmp_path / "f.zarr", array, (3, 4, 4), order="F", fill_value=np.nan)
+    store = ChunkedArray(path)
+    try:
+        assert not (path / "0.0.0").exists()
+        np.testing.assert_array_equal(store[:, 2], array[:, 2])
+        np.testing.assert_array_equal(store.materialize(), array)
+    finally:
+        store.close()
+
+
+@pytest.fixture
+def pyramid(tmp_path, volume):
+    root = tmp_path / "pyramid.zarr"
+    datasets = []
+    for level in range(3):
+        data = np.ascontiguousarray(volume[:, :: 2**level, :: 2**level])
+        write_array(root / str(level), data, (16, 32, 32), separator="/")
+        scale = [2.0, 0.5 * 2**level, 0.5 * 2**level]
+        datasets.append(
+            {
+                "path": str(level),
+                "coordinateTransformations": [
+                    {"type": "scale", "scale": scale},
+                    {"type": "translation", "translation": [10.0, 0.0, -5.0]},
+                ],
+            }
+        )
+    (root / ".zgroup").write_text('{"zarr_format": 2}')
+    (root / ".zattrs").write_text(json.dumps({"multiscales": [{"datasets": datasets}]}))
+    return root
+
+
+def test_multiscale_levels(pyramid, volume):
+    assert is_chunked_store(pyramid) and is_chunked_store(pyramid / "1")
+    base = open_chunked_store(pyramid)
+    try:
+        assert [level.downsampling for level in base.levels] == [(1, 1, 1), (1, 2, 2), (1, 4, 4)]
+        assert all(level.fetcher is base.fetcher for level in base.levels)
+        np.testing.assert_array_equal(base.levels[2][7], volume[7, ::4, ::4])
+        np.testing.assert_array_equal(base.preview(), volume[20, ::4, ::4])
+    finally:
+        base.close()
+
+
+def test_loader_opens_a_store_lazily(pyramid, volume):
+    loader = ImageLoader(pyramid)
+    array, shape = loader.load()
+    try:
+        assert isinstance(array, ChunkedArray) and shape == volume.shape
+        assert loader.spacing == (0.5, 0.5, 2.0)
+        assert loader.origin == (-5.0, 0.0, 10.0)
+        np.testing.assert_array_equal(array[:, 60, :], volume[:, 60, :])
+        assert array.resident_bytes < volume.nbytes
+    finally:
+        array.close()
+
+
+def test_directories_that_are_not_stores(tmp_path):
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "group").mkdir()
+    (tmp_path / "group" / ".zattrs").write_text('{"multiscales": []}')
+
+    assert not is_chunked_store(tmp_path / "empty")
+    assert open_chunked_store(tmp_path / "group") is None
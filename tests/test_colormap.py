@@ -0,0 +1,95 @@
+"""Shared colormap lookup tables."""
+
+import json
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+
+from pydcmview.colormap import (
+    DEFAULT_LEVELS,
+    HIGH_PRECISION_LEVELS,
+    ColorMap,
+    ColorMapManager,
+    get_colormap_manager,
+    load_colormap_file,
+)
+from pydcmview.image_loader import ImageLoader
+
+
+def test_lookup_tables_are_built_once_and_read_only():
+    colormap = ColorMap("test", [(0, 0, 0), (255, 128, 0)])
+    lut = colormap.get_lut(HIGH_PRECISION_LEVELS)
+
+    assert colormap.get_lut(HIGH_PRECISION_LEVELS) is lut
+    assert lut.shape == (HIGH_PRECISION_LEVELS, 3) and lut.dtype == np.uint8
+    assert not lut.flags.writeable
+    np.testing.assert_array_equal(lut[[0, -1]], [[0, 0, 0], [255, 128, 0]])
+
+
+def test_high_precision_gray_ramp_is_monotonic():
+    lut = ColorMap("gray", [(0, 0, 0), (255, 255, 255)]).get_lut(HIGH_PRECISION_LEVELS)
+
+    assert np.all(np.diff(lut[:, 0].astype(int)) >= 0)
+    assert len(np.unique(lut[:, 0])) == 256
+
+
+@pytest.mark.parametrize(
+    "gray,levels",
+    [
+        (np.arange(256, dtype=np.uint8).reshape(16, 16), DEFAULT_LEVELS),
+        (np.arange(0, 4096, 16, dtype=np.uint16).reshape(16, 16), HIGH_PRECISION_LEVELS),
+    ],
+)
+def test_apply_indexes_the_table(gray, levels):
+    colormap = get_colormap_manager().get_colormap("Hot")
+
+    rgb = colormap.apply(gray, levels)
+    np.testing.assert_array_equal(rgb, colormap.get_lut(levels)[gray])
+
+
+def test_apply_clips_foreign_input():
+    colormap = ColorMap("gray", [(0, 0, 0), (255, 255, 255)])
+
+    rgb = colormap.apply(np.array([[-5, 300]]))
+    np.testing.assert_array_equal(rgb[0, :, 0], [0, 255])
+
+
+def test_manager_is_shared_process_wide():
+    assert get_colormap_manager() is get_colormap_manager()
+
+
+def test_user_colormaps_are_listed_and_parsed_on_first_use(tmp_path):
+    (tmp_path / "ramp.json").write_text(json.dumps({"colors": [[0, 0, 0], [1, 0.5, 0]]}))
+    (tmp_path / "broken.txt").write_text("not a colormap\n")
+    manager = ColorMapManager(user_dir=tmp_path)
+
+    assert {"ramp", "broken"} <= set(manager.get_names())
+    assert "ramp" not in manager.colormaps
+    np.testing.assert_array_equal(manager.get_colormap("ramp").get_lut()[-1], [255, 128, 0])
+    with pytest.raises(ValueError):
+        manager.get_colormap("broken")
+    with pytest.raises(ValueError):
+        manager.get_colormap("missing")
+
+
+def test_text_colormap_with_comments(tmp_path):
+    path = tmp_path / "two.csv"
+    path.write_text("# start\n0, 0, 255\n255,0,0  # end\n")
+
+    colormap = load_colormap_file(path)
+    assert (colormap.name, colormap.colors) == ("two", [(0, 0, 255), (255, 0, 0)])
+
+
+def test_window_level_output_depth(tmp_path):
+    path = tmp_path / "ramp.nrrd"
+    sitk.WriteImage(sitk.GetImageFromArray(np.arange(8, dtype=np.int16).reshape(1, 2, 4)), str(path))
+    loader = ImageLoader(path)
+    loader.load()
+    data = np.array([[0, 100, 200]], dtype=np.int16)
+
+    low = loader.apply_window_level(data, 100, 200)
+    high = loader.apply_window_level(data, 100, 200, HIGH_PRECISION_LEVELS)
+    assert low.dtype == np.uint8 and high.dtype == np.uint16
+    np.testing.assert_array_equal(low, [[0, 127, 255]])
+    np.testing.assert_array_equal(high, [[0, 2047, 4095]])
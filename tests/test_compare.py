@@ -0,0 +1,108 @@
+"""Side-by-side comparison of two volumes."""
+
+import asyncio
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+from PIL import Image as PILImage
+
+from pydcmview.compare import PANE_GAP, Comparison, compose_panes
+from pydcmview.session import VolumeSession
+from pydcmview.viewer import ImageViewer
+
+
+@pytest.fixture
+def volumes(tmp_path):
+    """Three volumes on one grid: a ramp along z, its inverse, and a constant."""
+    ramp = np.broadcast_to(np.arange(6, dtype=np.int16)[:, None, None] * 100, (6, 32, 48))
+    paths = []
+    for name, data in (("pre", ramp), ("post", 500 - ramp), ("flat", np.full_like(ramp, 250))):
+        path = tmp_path / f"{name}.nrrd"
+        sitk.WriteImage(sitk.GetImageFromArray(np.ascontiguousarray(data)), str(path))
+        paths.append(path)
+    return paths
+
+
+def test_window_follows_the_current_volume_while_linked(volumes):
+    session = VolumeSession(volumes)
+    session.activate(0)
+    comparison = Comparison(1, session.compare(1))
+
+    assert comparison.matches((6, 32, 48)) and not comparison.matches((6, 48, 32))
+    assert comparison.window(40.0, 400.0) == (40.0, 400.0)
+
+    comparison.link_window = False
+    comparison.window_center, comparison.window_width = 100.0, 50.0
+    assert comparison.window(40.0, 400.0) == (100.0, 50.0)
+
+
+def test_compared_volume_is_never_evicted(volumes):
+    session = VolumeSession(volumes, memory_budget=1)
+    session.activate(0)
+    compared = session.compare(1)
+
+    session.activate(2)
+
+    assert compared.is_loaded and session.current.is_loaded
+    assert not session.entries[0].is_loaded
+    session.compare(None)
+    session.activate(0)
+    assert not compared.is_loaded
+
+
+def test_compose_panes_centers_panes_side_by_side():
+    left = PILImage.new("RGB", (10, 20), (255, 0, 0))
+    right = PILImage.new("RGBA", (6, 10), (0, 255, 0, 255))
+
+    frame = np.asarray(compose_panes([left, right]))
+
+    assert frame.shape == (20, 10 + PANE_GAP + 6, 3)
+    assert (frame[:, :10] == (255, 0, 0)).all()
+    assert (frame[:, 10 : 10 + PANE_GAP] == 0).all()
+    assert (frame[5:15, -6:] == (0, 255, 0)).all()
+    assert (frame[:5, -6:] == 0).all() and (frame[15:, -6:] == 0).all()
+
+
+def test_viewer_links_navigation_of_both_panes(volumes):
+    def pane_gray(image, pane):
+        """Mean gray level of the left (0) or right (1) pane."""
+        gray = np.asarray(image.convert("L"), dtype=float)
+        width = (gray.shape[1] - PANE_GAP) // 2
+        return gray[:, :width].mean() if pane == 0 else gray[:, -width:].mean()
+
+    async def run():
+        app = ImageViewer([str(p) for p in volumes])
+        async with app.run_test(size=(160, 50)) as pilot:
+            await pilot.pause()
+            app.display_x, app.display_y = 1, 2
+            app._assign_slice_axes()
+            app.current_slice = 1
+            app.window_center, app.window_width = 250.0, 500.0
+
+            await pilot.press("v")
+            assert app._comparing() and app.comparison.label == "post.nrrd"
+            _, frame = app._render_comparison()
+            # Slice 1 of each volume: 100 on the left, 400 on the right
+            assert pane_gray(frame, 0) == pytest.approx(0.2 * 255, abs=3)
+            assert pane_gray(frame, 1) == pytest.approx(0.8 * 255, abs=3)
+
+            await pilot.press("down", "down")
+            _, frame = app._render_comparison()
+            assert pane_gray(frame, 0) == pytest.approx(0.6 * 255, abs=3)
+            assert pane_gray(frame, 1) == pytest.approx(0.4 * 255, abs=3)
+
+            # Unlinked, the compared pane keeps its own window
+            await pilot.press("V")
+            app.comparison.window_center, app.comparison.window_width = 100.0, 2.0
+            _, frame = app._render_comparison()
+            assert pane_gray(frame, 1) == pytest.approx(255, abs=1)
+
+            # n/N step through the other volumes as the compared one
+            await pilot.press("n")
+            assert app.comparison.label == "flat.nrrd" and app.session.current_index == 0
+
+            await pilot.press("v")
+            assert app.comparison is None and app.session.compared is None
+
+    asyncio.run(run())
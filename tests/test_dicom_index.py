@@ -0,0 +1,138 @@
+"""Persistent index of DICOM series in directory trees."""
+
+import numpy as np
+import pytest
+
+from pydicom.fileset import FileSet
+
+from dicom_files import make_instance, write_instance, write_series
+from pydcmview import dicom_index
+from pydcmview.dicom_index import (
+    DicomIndex,
+    find_dicomdir,
+    is_dicom_file,
+    read_dicomdir,
+)
+from pydcmview.image_loader import ImageLoader
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "tree"
+    volume = np.arange(4 * 8 * 8, dtype=np.int16).reshape(4, 8, 8)
+    # Files named against slice order, so ordering must come from the headers
+    ct = write_series(root / "a" / "b", volume, "1.1", positions=[30.0, 10.0, 20.0, 0.0], description="CT")
+    write_series(root / "c", volume[:2], "1.2", series_number=2, description="Scout")
+    (root / "notes.txt").write_text("not DICOM")
+    return root, ct, volume
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = DicomIndex(tmp_path / "index.sqlite")
+    yield index
+    index.close()
+
+
+def test_series_are_grouped_and_ordered_by_position(tree, index):
+    root, ct, _ = tree
+    series = index.scan(root)
+
+    assert [(s.series_uid, len(s)) for s in series] == [("1.1", 4), ("1.2", 2)]
+    assert series[0].files == [ct[3], ct[1], ct[2], ct[0]]
+    assert series[0].label == "CT #1 CT"
+    assert (series[0].rows, series[0].columns) == (8, 8)
+
+
+def test_rescan_reads_only_new_and_changed_files(tree, index, monkeypatch):
+    root, ct, volume = tree
+    index.scan(root)
+
+    read = []
+    original = dicom_index._read_instance
+    monkeypatch.setattr(
+        dicom_index, "_read_instance", lambda path, stat: read.append(path) or original(path, stat)
+    )
+    assert len(index.scan(root)) == 2
+    assert read == []
+
+    ct[0].unlink()
+    added = write_instance(root / "a" / "new.dcm", volume[0], "1.1", position=40.0)
+    series = index.scan(root)
+    assert read == [str(added)]
+    assert len(series[0]) == 4 and series[0].files[-1] == added
+
+
+def test_index_persists_between_sessions(tree, tmp_path):
+    root, _, _ = tree
+    first = DicomIndex(tmp_path / "index.sqlite")
+    first.scan(root)
+    first.close()
+
+    second = DicomIndex(tmp_path / "index.sqlite")
+    try:
+        assert [s.series_uid for s in second.get_series(root)] == ["1.1", "1.2"]
+        assert second.get_series(root / "c")[0].series_uid == "1.2"
+    finally:
+        second.close()
+
+
+def test_indexed_series_loads_in_slice_order(tree, index):
+    root, _, volume = tree
+    series = index.scan(root)[0]
+    loader = ImageLoader(series.files[0], series_files=series.files)
+    loader.load()
+
+    # Positions 30, 10, 20, 0 held slices 0..3
+    np.testing.assert_array_equal(loader.array, volume[[3, 1, 2, 0]])
+
+
+def test_dicom_files_are_recognized_by_preamble(tree, tmp_path):
+    root, ct, _ = tree
+    renamed = ct[0].rename(tmp_path / "no_extension")
+
+    assert is_dicom_file(renamed)
+    assert not is_dicom_file(root / "notes.txt")
+    assert not is_dicom_file(tmp_path / "missing")
+
+
+
+def write_media(directory, instances):
+    """Write a DICOMDIR file-set of ``instances`` to ``directory``; returns the DICOMDIR."""
+    file_set = FileSet()
+    for instance in instances:
+        file_set.add(instance)
+    file_set.write(directory)
+    return directory / "DICOMDIR"
+
+
+def test_dicomdir_lists_series_without_scanning(tmp_path):
+    volume = np.arange(3 * 4 * 4, dtype=np.int16).reshape(3, 4, 4)
+    # Directory records carry the instance number, not the position
+    instances = [
+        make_instance(volume[index], "2.1", position=number, instance_number=number)
+        for index, number in enumerate([3, 1, 2])
+    ]
+    instances.append(make_instance(volume[0], "2.2", series_number=5, description="Other"))
+    media = tmp_path / "media"
+    dicomdir = write_media(media, instances)
+
+    assert find_dicomdir(media) == dicomdir
+    assert find_dicomdir(tmp_path) is None
+    series = read_dicomdir(dicomdir)
+
+    assert [(s.series_uid, len(s)) for s in series] == [("2.1", 3), ("2.2", 1)]
+    assert series[1].series_number == 5 and series[1].modality == "CT"
+    loader = ImageLoader(series[0].files[0], series_files=series[0].files)
+    loader.load()
+    np.testing.assert_array_equal(loader.array, volume[[1, 2, 0]])
+
+
+def test_dicomdir_skips_instances_missing_from_the_media(tmp_path):
+    instances = [make_instance(np.zeros((4, 4)), "3.1", position=p) for p in range(3)]
+    dicomdir = write_media(tmp_path / "media", instances)
+    read_dicomdir(dicomdir)[0].files[1].unlink()
+
+    with pytest.warns(UserWarning):
+        series = read_dicomdir(dicomdir)
+    assert len(series[0]) == 2
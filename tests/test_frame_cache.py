@@ -0,0 +1,70 @@
+"""Encoded frame cache and resident Kitty images."""
+
+import asyncio
+
+from PIL import Image as PILImage
+from textual.app import App
+
+from pydcmview import frame_cache
+from pydcmview.frame_cache import CachedTGPImage, CachedTGPRenderable, EncodedFrameCache, frame_digest
+
+
+def test_textual_image_internals_are_available():
+    # Without them the viewer silently falls back to the uncached widget
+    # and cannot size frames to the viewport
+    assert frame_cache._send_tgp_message is not None
+    assert frame_cache._ImageSixelImpl is not None
+    assert frame_cache._NoopRenderable is not None
+
+    from textual_image._terminal import get_cell_size
+
+    assert callable(get_cell_size)
+
+
+def test_cache_evicts_least_recently_used_by_size():
+    cache = EncodedFrameCache(max_bytes=10)
+    cache.put("a", "1234")
+    cache.put("b", "1234")
+    assert cache.get("a") == "1234"
+    cache.put("c", "1234")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1234" and cache.get("c") == "1234"
+    assert cache.current_bytes == 8
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_oversized_payload_is_not_cached():
+    cache = EncodedFrameCache(max_bytes=3)
+    cache.put("a", "1234")
+
+    assert cache.get("a") is None and cache.current_bytes == 0
+
+
+def test_digest_depends_on_content_mode_and_size():
+    image = PILImage.new("RGB", (4, 2), (10, 20, 30))
+
+    assert frame_digest(image) == frame_digest(image.copy())
+    assert frame_digest(image) != frame_digest(image.convert("L"))
+    assert frame_digest(image) != frame_digest(image.resize((2, 4)))
+    assert frame_digest(image) != frame_digest(PILImage.new("RGB", (4, 2)))
+
+
+def test_resident_images_are_freed_when_the_widget_unmounts(monkeypatch):
+    sent = []
+    monkeypatch.setattr(frame_cache, "_send_tgp_message", lambda **kwargs: sent.append(kwargs))
+    monkeypatch.setattr(CachedTGPRenderable, "_resident", {("a", 1, 1): 7, ("b", 1, 1): 9})
+
+    class ViewerApp(App):
+        def compose(self):
+            yield CachedTGPImage(None)
+
+    async def run():
+        async with ViewerApp().run_test():
+            assert not sent
+
+    asyncio.run(run())
+
+    assert sorted(message["i"] for message in sent) == [7, 9]
+    assert all(message["a"] == "d" for message in sent)
+    assert not CachedTGPRenderable._resident
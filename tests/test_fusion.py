@@ -0,0 +1,89 @@
+"""Resampling a fused volume onto displayed slices."""
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+
+from pydcmview.fusion import FusionLayer, SliceLayout
+from pydcmview.image_loader import ImageLoader
+
+
+def write(path, array, spacing=(1.0, 1.0, 1.0), origin=(0.0, 0.0, 0.0)):
+    image = sitk.GetImageFromArray(array)
+    image.SetSpacing(spacing)
+    image.SetOrigin(origin)
+    sitk.WriteImage(image, str(path))
+    return path
+
+
+def load(path):
+    loader = ImageLoader(path)
+    loader.load()
+    return loader
+
+
+@pytest.fixture
+def volume():
+    return np.random.default_rng(0).integers(0, 1000, size=(8, 12, 16)).astype(np.int16)
+
+
+def test_same_grid_resamples_to_the_slice(tmp_path, volume):
+    fixed = load(write(tmp_path / "fixed.nii", volume))
+    layer = FusionLayer.load(write(tmp_path / "moving.nii", volume))
+
+    values, inside = layer.resample(fixed, SliceLayout(0, 3, 1, 2), 1, "axial")
+    assert inside.all()
+    np.testing.assert_allclose(values, volume[3])
+
+    values, inside = layer.resample(fixed, SliceLayout(2, 5, 0, 1, flip_rows=True), 2, "sag")
+    assert values.shape == (4, 6)
+    np.testing.assert_allclose(values, volume[::-1, :, 5][::2, ::2])
+
+
+def test_physical_offset_and_spacing(tmp_path, volume):
+    fixed = load(write(tmp_path / "fixed.nii", volume, spacing=(1.0, 1.0, 2.0)))
+    # Half the in-plane spacing and starting four slices further along z
+    z, y, x = np.meshgrid(np.arange(4), np.arange(24), np.arange(32), indexing="ij")
+    ramp = (x + 100 * z).astype(np.float32)
+    layer = FusionLayer.load(
+        write(tmp_path / "moving.nii", ramp, spacing=(0.5, 0.5, 2.0), origin=(0.0, 0.0, 8.0))
+    )
+
+    values, inside = layer.resample(fixed, SliceLayout(0, 5, 1, 2), 1, "axial")
+
+    # Fixed slice 5 is moving slice 1; fixed column c is moving column 2c
+    columns = np.arange(16)
+    assert inside[:, :16].all()
+    expected = np.broadcast_to(2.0 * columns + 100, (12, 16))
+    np.testing.assert_allclose(values[inside], expected[inside])
+    # Beyond the moving volume's extent nothing is sampled
+    assert not layer.resample(fixed, SliceLayout(0, 1, 1, 2), 1, "outside")[1].any()
+
+
+def test_resampled_slices_are_cached(tmp_path, volume):
+    fixed = load(write(tmp_path / "fixed.nii", volume))
+    layer = FusionLayer.load(write(tmp_path / "moving.nii", volume))
+    layer.max_slices = 2
+
+    first = layer.resample(fixed, SliceLayout(0, 0, 1, 2), 1, 0)
+    layer.resample(fixed, SliceLayout(0, 1, 1, 2), 1, 1)
+    assert layer.resample(fixed, SliceLayout(0, 0, 1, 2), 1, 0) is first
+
+    layer.resample(fixed, SliceLayout(0, 2, 1, 2), 1, 2)
+
+    assert list(layer._slices) == [0, 2]
+    layer.clear_cache()
+    assert not layer._slices
+
+
+def test_blend_only_inside_the_moving_volume(tmp_path, volume):
+    layer = FusionLayer.load(write(tmp_path / "moving.nii", volume))
+    layer.opacity = 0.5
+    values = np.full((2, 3), layer.window_center, dtype=np.float32)
+    inside = np.array([[True, False, True], [False, True, False]])
+    rgb = np.full((2, 3, 3), 200, dtype=np.uint8)
+
+    layer.blend(rgb, (values, inside), 0, 0)
+
+    assert (rgb[~inside] == 200).all()
+    assert not np.array_equal(rgb[inside], np.full((3, 3), 200))
@@ -0,0 +1,94 @@
+"""Random access into gzip streams."""
+
+import gzip
+
+import numpy as np
+import pytest
+
+from pydcmview.cache import cache_path_for, file_cache_key
+from pydcmview.gzip_index import IndexedGzipReader, _CheckpointIndex
+
+
+@pytest.fixture
+def payload():
+    return np.random.default_rng(0).integers(0, 16, size=300_000, dtype=np.uint8).tobytes()
+
+
+@pytest.fixture
+def gz_file(tmp_path, payload):
+    path = tmp_path / "data.gz"
+    path.write_bytes(gzip.compress(payload))
+    return path
+
+
+SPANS = [(0, 10), (123_456, 5000), (65_530, 20), (299_990, 10), (1000, 0), (0, 300_000)]
+
+
+@pytest.mark.parametrize("offset,size", SPANS)
+def test_checkpoint_index_reads_any_span(gz_file, payload, offset, size):
+    index = _CheckpointIndex(gz_file, spacing=16 * 1024)
+    try:
+        # Read far ahead first, so the span is served from a seek point
+        index.read(250_000, 1)
+        assert index.read(offset, size) == payload[offset : offset + size]
+    finally:
+        index.close()
+
+
+def test_checkpoint_index_records_seek_points(tmp_path):
+    payload = np.random.default_rng(1).integers(0, 16, size=4_000_000, dtype=np.uint8).tobytes()
+    path = tmp_path / "large.gz"
+    path.write_bytes(gzip.compress(payload))
+    index = _CheckpointIndex(path, spacing=16 * 1024)
+    try:
+        index.read(3_900_000, 1)
+        offsets = [point[0] for point in index._points]
+        assert len(offsets) > 3 and offsets == sorted(offsets)
+        # Served from the nearest seek point rather than from the start
+        assert index._nearest_point(3_000_000)[0] > 0
+        assert index.read(3_000_000, 100) == payload[3_000_000:3_000_100]
+    finally:
+        index.close()
+
+
+def test_checkpoint_index_spans_concatenated_members(tmp_path):
+    path = tmp_path / "members.gz"
+    path.write_bytes(gzip.compress(b"a" * 1000) + gzip.compress(b"b" * 1000))
+    index = _CheckpointIndex(path, spacing=256)
+    try:
+        assert index.read(990, 20) == b"a" * 10 + b"b" * 10
+    finally:
+        index.close()
+
+
+def test_read_past_the_end_is_truncated(gz_file, payload):
+    reader = IndexedGzipReader(gz_file)
+    try:
+        assert reader.read(len(payload) - 4, 100) == payload[-4:]
+    finally:
+        reader.close()
+
+
+def test_persistent_index_is_stored_in_the_cache(gz_file, payload, cache_dir):
+    reader = IndexedGzipReader(gz_file, spacing=64 * 1024)
+    if not reader.persistent:
+        reader.close()
+        pytest.skip("indexed_gzip is not installed")
+    reader.close()
+    assert cache_path_for(gz_file, ".gzidx").exists()
+
+    reopened = IndexedGzipReader(gz_file, spacing=64 * 1024)
+    try:
+        assert reopened.read(200_000, 64) == payload[200_000:200_064]
+    finally:
+        reopened.close()
+
+
+def test_cache_key_changes_when_file_is_rewritten(tmp_path):
+    path = tmp_path / "volume.nii.gz"
+    path.write_bytes(b"one")
+    key = file_cache_key(path)
+    path.write_bytes(b"three")
+
+    assert file_cache_key(path) != key
+    assert cache_path_for(path, ".gzidx").name == file_cache_key(path) + ".gzidx"
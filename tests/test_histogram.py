@@ -0,0 +1,84 @@
+"""Volume histograms for equalized display and percentile windows."""
+
+import numpy as np
+import pytest
+
+from pydcmview.histogram import VolumeHistogram, strided_sample
+from pydcmview.lazy_array import LazyArray
+
+
+class ReadTrackingArray(LazyArray):
+    def __init__(self, data):
+        super().__init__(data.shape, data.dtype)
+        self.data = data
+        self.reads = []
+
+    def _read_leading(self, start, stop):
+        self.reads.append((start, stop))
+        return self.data[start:stop]
+
+
+def test_percentile_window_of_uniform_data():
+    data = np.arange(10_000, dtype=np.int32).reshape(10, 1000)
+    histogram = VolumeHistogram(data)
+
+    assert histogram.percentile(50) == pytest.approx(5000, abs=5)
+    center, width = histogram.percentile_window(1.0, 99.0)
+    assert center == pytest.approx(5000, abs=5)
+    assert width == pytest.approx(9800, abs=10)
+
+
+def test_percentiles_are_in_real_world_units():
+    stored = np.arange(1000, dtype=np.int16)
+    histogram = VolumeHistogram(stored, slope=2.0, intercept=-1000.0)
+
+    assert (histogram.min, histogram.max) == (-1000.0, 998.0)
+    assert histogram.percentile(50) == pytest.approx(0, abs=3)
+
+
+def test_equalization_spreads_skewed_data_over_all_levels():
+    rng = np.random.default_rng(0)
+    data = rng.exponential(50, size=(100, 1000)).astype(np.float32)
+    histogram = VolumeHistogram(data)
+
+    gray = histogram.apply_equalization(data)
+    assert gray.dtype == np.uint8
+    counts = np.bincount(gray.ravel(), minlength=256)
+    # Roughly flat: every quarter of the levels holds about a quarter of the voxels
+    quarters = counts.reshape(4, 64).sum(axis=1) / gray.size
+    np.testing.assert_allclose(quarters, 0.25, atol=0.02)
+
+
+def test_equalization_is_monotonic_and_folds_rescale():
+    stored = np.arange(0, 4000, dtype=np.uint16)
+    histogram = VolumeHistogram(stored, slope=0.5, intercept=-100.0)
+
+    gray = histogram.apply_equalization(stored, levels=4096)
+    assert gray.dtype == np.uint16
+    assert np.all(np.diff(gray.astype(int)) >= 0)
+    assert gray[0] <= 1 and gray[-1] == 4095
+
+
+def test_non_finite_values_are_ignored():
+    data = np.array([np.nan, 1.0, 2.0, np.inf, 3.0])
+    histogram = VolumeHistogram(data)
+
+    assert (histogram.min, histogram.max) == (1.0, 3.0)
+
+
+def test_lazy_volumes_are_sampled_without_loading_everything():
+    data = np.arange(20 * 50 * 50, dtype=np.int32).reshape(20, 50, 50)
+    lazy = ReadTrackingArray(data)
+
+    sample = strided_sample(lazy, max_samples=800)
+    assert sample.size <= 800 + 8
+    assert len(lazy.reads) == 8 and all(stop - start == 1 for start, stop in lazy.reads)
+    assert lazy.resident_bytes == 0
+
+
+def test_sample_is_bounded_and_spread():
+    data = np.arange(1_000_000)
+    sample = strided_sample(data, max_samples=1000)
+
+    assert sample.size == 1000
+    assert sample[0] == 0 and sample[-1] > 990_000
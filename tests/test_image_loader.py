@@ -0,0 +1,132 @@
+"""Lossless compaction of loaded pixel data."""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+
+from pydcmview import image_loader
+from pydcmview.image_loader import ImageLoader, _exact_stored
+
+
+def write_nrrd(path, array):
+    sitk.WriteImage(sitk.GetImageFromArray(array), str(path))
+    return path
+
+
+def load(path):
+    loader = ImageLoader(path)
+    loader.load()
+    return loader
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """A loader whose array the tests replace before compacting."""
+    return load(write_nrrd(tmp_path / "seed.nrrd", np.zeros((2, 2, 2), np.uint8)))
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.full((2, 3, 4), 0.0004),
+        np.linspace(0, 0.0009, 24).reshape(2, 3, 4),
+        np.arange(24).reshape(2, 3, 4) + 0.5,
+    ],
+)
+def test_fractional_floats_are_kept(tmp_path, values):
+    loader = load(write_nrrd(tmp_path / "float.nrrd", values.astype(np.float32)))
+
+    assert loader.array.dtype == np.float32
+    np.testing.assert_array_equal(loader.array, values.astype(np.float32))
+
+
+def test_integral_floats_become_smallest_integer(tmp_path):
+    values = np.arange(-100, 100, dtype=np.float32).reshape(2, 10, 10)
+    loader = load(write_nrrd(tmp_path / "integral.nrrd", values))
+
+    assert loader.array.dtype == np.int8
+    np.testing.assert_array_equal(loader.to_real(loader.array), values)
+
+
+def test_wide_integers_are_narrowed(tmp_path):
+    # What SimpleITK returns for an int16 CT series with intercept -1024
+    values = np.arange(-1024, 3072, dtype=np.int32).reshape(4, 32, 32)
+    loader = load(write_nrrd(tmp_path / "ct.nrrd", values))
+
+    assert loader.array.dtype == np.int16
+    assert (loader.rescale_slope, loader.rescale_intercept) == (1.0, 0.0)
+    np.testing.assert_array_equal(loader.array, values)
+
+
+def test_integers_outside_compact_range_are_kept(tmp_path):
+    values = np.array([0, 2**40], dtype=np.int64).reshape(1, 1, 2)
+    loader = load(write_nrrd(tmp_path / "wide.nrrd", values))
+
+    assert loader.array.dtype == np.int64
+
+
+def test_header_rescale_is_recovered(loader):
+    stored = np.arange(0, 4096, dtype=np.int16).reshape(4, 32, 32)
+    loader.array = (stored * 0.1 - 5.0).astype(np.float32)
+    loader._compact_array((0.1, -5.0))
+
+    assert loader.array.dtype == np.uint16
+    assert (loader.rescale_slope, loader.rescale_intercept) == (0.1, -5.0)
+    np.testing.assert_array_equal(loader.array, stored)
+
+
+def test_rescale_that_does_not_reproduce_values_is_rejected(loader):
+    values = np.linspace(0, 0.0009, 24, dtype=np.float32).reshape(2, 3, 4)
+    loader.array = values
+    loader._compact_array((0.5, 0.0))
+
+    assert loader.array is values
+    assert (loader.rescale_slope, loader.rescale_intercept) == (1.0, 0.0)
+
+
+def test_compaction_works_slab_by_slab(loader, monkeypatch):
+    stored = np.arange(0, 64 * 64 * 64, dtype=np.int32).reshape(64, 64, 64) % 4000
+    real = (stored * 0.25 + 7.0).astype(np.float32)
+    monkeypatch.setattr(image_loader, "COMPACT_SLAB_BYTES", real[:4].nbytes)
+
+    loader.array = real
+    tracemalloc.start()
+    try:
+        loader._compact_array((0.25, 7.0))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert loader.array.dtype == np.uint16
+    np.testing.assert_array_equal(loader.array, stored)
+    # The result plus a few slab-sized temporaries, not whole-volume copies
+    assert peak < loader.array.nbytes + 8 * real[:4].nbytes
+
+    # A mismatch in the last slab still rejects the rescale
+    real[-1, -1, -1] += 0.01
+    loader.array = real
+    loader.rescale_slope, loader.rescale_intercept = 1.0, 0.0
+    loader._compact_array((0.25, 7.0))
+    assert loader.array is real
+
+
+def test_exact_stored():
+    assert _exact_stored(np.array([0.0, 0.0004]), 1.0, 0.0) is None
+    np.testing.assert_array_equal(_exact_stored(np.array([-3.0, 7.0]), 1.0, 0.0), [-3, 7])
+    np.testing.assert_array_equal(_exact_stored(np.array([1, 3]), 2.0, 1.0), [0, 1])
+    assert _exact_stored(np.array([1, 4]), 2.0, 1.0) is None
+
+
+@pytest.mark.parametrize("slope,intercept", [(1.0, -1024.0), (0.5, 10.0), (-2.0, 100.0)])
+def test_window_level_folds_rescale(loader, slope, intercept):
+    stored = np.arange(0, 4000, 7, dtype=np.int16).reshape(-1, 1)
+    real = stored * slope + intercept
+    loader.rescale_slope, loader.rescale_intercept = slope, intercept
+    center, width = float(np.median(real)), float(np.ptp(real)) / 2
+
+    gray = loader.apply_window_level(stored, center, width)
+    expected = np.clip((real - (center - width / 2)) / width * 255, 0, 255)
+    assert np.abs(gray.astype(int) - expected).max() <= 1
+    np.testing.assert_array_equal(loader.to_real(stored), real)
@@ -0,0 +1,115 @@
+"""Header-only file summaries (``pydcmview info``)."""
+
+import json
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+
+from dicom_files import make_instance, write_instance
+from pydcmview.info import NOT_AN_IMAGE, main, orientation_code, read_info
+
+
+def truncate(path, keep):
+    """Drop the end of a file, where the pixel data is."""
+    data = path.read_bytes()
+    path.write_bytes(data[: len(data) - keep])
+
+
+@pytest.fixture
+def nifti(tmp_path):
+    image = sitk.GetImageFromArray(np.zeros((4, 6, 8), dtype=np.int16))
+    image.SetSpacing((0.5, 0.75, 2.0))
+    # x along patient right, y along anterior: an RAS volume
+    image.SetDirection((-1, 0, 0, 0, -1, 0, 0, 0, 1))
+    path = tmp_path / "volume.nii"
+    sitk.WriteImage(image, str(path))
+    truncate(path, 8 * 6 * 4 * 2)
+    return path
+
+
+@pytest.fixture
+def dicom(tmp_path):
+    ds = make_instance(np.zeros((6, 8)), "1.2.3.4", intercept=-1024)
+    ds.WindowCenter, ds.WindowWidth = [40, 400], [400, 1500]
+    path = tmp_path / "slice.dcm"
+    ds.save_as(path, enforce_file_format=True)
+    truncate(path, 40)
+    return path
+
+
+def test_orientation_codes():
+    assert orientation_code(np.eye(3)) == "LPS"
+    assert orientation_code(np.diag([-1, -1, 1])) == "RAS"
+    # Sagittal slices: columns run anterior to posterior, rows head to feet
+    assert orientation_code(np.array([[0, 0, 1], [1, 0, 0], [0, -1, 0]])) == "PIL"
+
+
+def test_image_header_without_voxels(nifti):
+    record = read_info(nifti)
+
+    assert "error" not in record
+    assert record["format"] == "nifti"
+    assert record["shape"] == [8, 6, 4]
+    assert record["dtype"] == "int16"
+    assert record["spacing"] == [0.5, 0.75, 2.0]
+    assert record["orientation"] == "RAS"
+
+
+def test_dicom_header_without_pixel_data(dicom):
+    record = read_info(dicom)
+
+    assert "error" not in record
+    assert record["format"] == "dicom"
+    assert record["shape"] == [8, 6]
+    assert record["dtype"] == "int16"
+    assert record["spacing"] == [1.0, 1.0]
+    assert record["orientation"] == "LPS"
+    assert record["modality"] == "CT"
+    assert record["windows"] == [[40.0, 400.0], [400.0, 1500.0]]
+
+
+def test_unreadable_and_unknown_files(tmp_path):
+    broken = tmp_path / "broken.nii"
+    broken.write_bytes(b"not a header")
+    notes = tmp_path / "notes.txt"
+    notes.write_text("hello")
+
+    assert "error" in read_info(broken)
+    assert read_info(notes)["error"] == NOT_AN_IMAGE
+
+
+def test_json_lines_over_a_directory(tmp_path, nifti, capsys):
+    series = tmp_path / "series"
+    for index in range(3):
+        write_instance(series / f"{index}.dcm", np.zeros((4, 4)), "1.2.9", position=index)
+    (series / "README").write_text("not an image")
+
+    assert main([str(tmp_path), "--json", "--workers", "2"]) == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    # Directory order, other files skipped
+    assert [r["path"] for r in records] == [str(nifti)] + [
+        str(series / f"{index}.dcm") for index in range(3)
+    ]
+
+
+def test_table_reports_failures(tmp_path, dicom, capsys):
+    broken = tmp_path / "broken.nrrd"
+    broken.write_bytes(b"NRRD garbage")
+
+    assert main([str(dicom), str(broken)]) == 1
+
+    header, good, bad = capsys.readouterr().out.split("\n", 2)
+    assert header.split() == [
+        "FORMAT", "SHAPE", "DTYPE", "SPACING", "ORIENT", "MOD", "WINDOW", "PATH"
+    ]
+    assert good.split() == [
+        "dicom", "8x6", "int16", "1x1", "LPS", "CT", "40/400;400/1500", str(dicom)
+    ]
+    assert bad.startswith("-") and str(broken) in bad
+
+
+def test_missing_path_is_an_error(tmp_path, capsys):
+    assert main([str(tmp_path / "missing.nrrd")]) == 1
+    assert "does not exist" in capsys.readouterr().err
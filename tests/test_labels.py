@@ -0,0 +1,113 @@
+"""Compact label storage and overlays."""
+
+import numpy as np
+import pytest
+
+from pydcmview.labels import (
+    LabelMap,
+    OverlayCache,
+    RunLengthLabels,
+    blend_overlay,
+    compact_labels,
+)
+
+
+@pytest.fixture
+def sparse_labels():
+    """Mostly empty segmentation with runs touching slice boundaries."""
+    labels = np.zeros((6, 20, 30), dtype=np.int32)
+    labels[1, 5:9, 10:20] = 3
+    labels[2, 19, 25:] = 7
+    labels[3, 0, :4] = 7
+    labels[4, 8:12, 0:30] = 300
+    labels[5, 19, 29] = 1
+    return labels
+
+
+def test_run_length_round_trip(sparse_labels):
+    encoded = RunLengthLabels(sparse_labels.astype(np.uint16))
+
+    np.testing.assert_array_equal(encoded.materialize(), sparse_labels)
+    for index in range(len(sparse_labels)):
+        np.testing.assert_array_equal(encoded[index], sparse_labels[index])
+    np.testing.assert_array_equal(encoded[:, 8, :], sparse_labels[:, 8, :])
+    np.testing.assert_array_equal(encoded[2:5], sparse_labels[2:5])
+
+
+def test_sparse_labels_are_run_length_encoded(sparse_labels):
+    labels = compact_labels(sparse_labels)
+
+    assert isinstance(labels, RunLengthLabels)
+    assert labels.dtype == np.uint16
+    assert labels.encoded_bytes * 4 <= labels.nbytes
+    np.testing.assert_array_equal(labels.materialize(), sparse_labels)
+
+
+def test_dense_labels_use_the_smallest_dtype():
+    rng = np.random.default_rng(0)
+    dense = rng.integers(0, 5, size=(4, 16, 16)).astype(np.float64)
+
+    labels = compact_labels(dense)
+
+    assert isinstance(labels, np.ndarray)
+    assert labels.dtype == np.uint8
+    np.testing.assert_array_equal(labels, dense)
+
+
+@pytest.mark.parametrize("array", [np.array([[0.5, 1.0]]), np.array([[-1, 2]])])
+def test_invalid_labels_are_rejected(array):
+    with pytest.raises(ValueError):
+        compact_labels(array)
+
+
+def test_label_map_counts_labels_on_encoded_storage(sparse_labels):
+    label_map = LabelMap(compact_labels(sparse_labels))
+
+    assert label_map.storage == "RLE"
+    assert label_map.max_label == 300
+    assert label_map.label_count == 4
+    assert label_map.nbytes < sparse_labels.astype(np.uint16).nbytes
+
+
+def test_overlay_outlines_label_borders():
+    label_slice = np.zeros((5, 5), dtype=np.uint8)
+    label_slice[1:4, 1:4] = 2
+    label_map = LabelMap(label_slice[None])
+
+    colors, mask, contour = label_map.slice_overlay(label_slice)
+
+    assert colors.shape == (5, 5, 3)
+    np.testing.assert_array_equal(mask, label_slice != 0)
+    expected = mask.copy()
+    expected[2, 2] = False
+    np.testing.assert_array_equal(contour, expected)
+
+
+def test_blend_overlay_modes():
+    label_slice = np.zeros((4, 4), dtype=np.uint8)
+    label_slice[1:3, 1:3] = 1
+    label_map = LabelMap(label_slice[None])
+    overlay = label_map.slice_overlay(label_slice)
+    color = label_map.colors[1].astype(np.float64)
+
+    filled = blend_overlay(np.zeros((4, 4, 3), np.uint8), overlay, 0, 0, "fill", 0.5)
+    np.testing.assert_array_equal(filled[1, 1], (color * 0.5).astype(np.uint8))
+    assert not filled[0].any()
+
+    # Offsets shift the overlay relative to the image
+    shifted = blend_overlay(np.zeros((4, 4, 3), np.uint8), overlay, 1, 1, "outline", 1.0)
+    np.testing.assert_array_equal(shifted[0, 0], label_map.colors[1])
+    assert not shifted[2:].any()
+
+
+def test_overlay_cache_evicts_least_recently_used():
+    cache = OverlayCache(max_entries=2)
+    cache.put(("a", 1), "first")
+    cache.put(("b", 1), "second")
+    assert cache.get(("a", 1)) == "first"
+
+    cache.put(("c", 1), "third")
+
+    assert cache.get(("b", 1)) is None
+    assert cache.get(("a", 1)) == "first"
+    assert cache.get(("c", 1)) == "third"
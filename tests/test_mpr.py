@@ -0,0 +1,93 @@
+"""Three-plane (MPR) layout."""
+
+import threading
+
+import numpy as np
+from PIL import Image as PILImage
+
+from pydcmview.mpr import ACTIVE_OUTLINE, PLANE_GAP, MPRLayout, plane_axes
+
+
+class PlaneRenderer:
+    """Solid gray planes one pixel per voxel, recording what is rendered.
+
+    With a barrier, each render waits until the others have started.
+    """
+
+    def __init__(self, shape, barrier=None):
+        self.shape = shape
+        self.calls = []
+        self.barrier = barrier
+        self._lock = threading.Lock()
+
+    def __call__(self, axis, index, box):
+        with self._lock:
+            self.calls.append((axis, index))
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        rows, cols = plane_axes(axis)
+        return PILImage.new("RGB", (self.shape[cols], self.shape[rows]), (60, 60, 60))
+
+
+def test_point_moves_are_clamped_to_the_volume():
+    layout = MPRLayout((4, 5, 6), (10, -3, 2))
+    assert layout.point == [3, 0, 2]
+
+    layout.move(2, 10)
+    assert layout.point == [3, 0, 5]
+
+    # In the plane across axis 1, rows run along axis 0 and columns along 2
+    layout.active = 1
+    layout.move_in_plane(-1, -2)
+    assert layout.point == [2, 0, 3]
+
+    layout.cycle_active(-2)
+    assert layout.active == 2
+
+
+def test_only_planes_whose_slice_changed_are_rendered():
+    shape = (10, 12, 14)
+    layout = MPRLayout(shape, (5, 6, 7))
+    # The three planes render concurrently, or the barrier times out
+    renderer = PlaneRenderer(shape, threading.Barrier(3))
+
+    layout.frame(renderer, "state", (40, 40), set(), 1.0)
+    assert layout.rendered == 3
+
+    renderer.barrier = None
+    renderer.calls.clear()
+    layout.frame(renderer, "state", (40, 40), set(), 1.0)
+    assert layout.rendered == 0 and renderer.calls == []
+
+    # Moving within the axial plane changes the other two planes' slices
+    layout.move_in_plane(1, 1)
+    layout.frame(renderer, "state", (40, 40), set(), 1.0)
+    assert sorted(renderer.calls) == [(1, 7), (2, 8)]
+
+    renderer.calls.clear()
+    layout.frame(renderer, "new window", (40, 40), set(), 1.0)
+    assert layout.rendered == 3
+
+    layout.clear_cache()
+    layout.frame(renderer, "new window", (40, 40), set(), 1.0)
+    assert layout.rendered == 3
+
+
+def test_frame_draws_the_linked_crosshair():
+    shape = (10, 12, 14)
+    layout = MPRLayout(shape, (2, 3, 4))
+    frame = np.asarray(layout.frame(PlaneRenderer(shape), None, (40, 40), {1}, 1.0))
+
+    assert frame.shape == (12, 14 + 14 + 12 + 2 * PLANE_GAP, 3)
+    red = (frame == (255, 0, 0)).all(axis=-1)
+    # Axial plane (rows along axis 1, which is flipped): column 4, row 12 - 1 - 3
+    assert red[1:11, 4].all() and red[8, 1:13].all()
+    # Coronal plane, centered vertically: row 2, column 4
+    left, top = 14 + PLANE_GAP, (12 - 10) // 2
+    assert red[top + 2, left : left + 14].all() and red[top : top + 10, left + 4].all()
+    # Sagittal plane: row 2, and column 3 flipped
+    left = 2 * (14 + PLANE_GAP)
+    assert red[top + 2, left : left + 12].all() and red[top : top + 10, left + 8].all()
+    assert red.sum() == (10 + 12 - 1) + (14 + 10 - 1) + (12 + 10 - 1)
+    # The active (axial) plane is outlined
+    assert (frame[0, :14] == ACTIVE_OUTLINE).all() and (frame[:, 0] == ACTIVE_OUTLINE).all()
@@ -0,0 +1,66 @@
+"""Lazy multi-frame DICOM decoding."""
+
+import numpy as np
+import pytest
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, SecondaryCaptureImageStorage, generate_uid
+
+from pydcmview.image_loader import ImageLoader
+from pydcmview.multiframe import MultiFrameDicomVolume, open_multiframe_dicom
+
+
+def write_multiframe(path, frames):
+    meta = FileMetaDataset()
+    meta.MediaStorageSOPClassUID = SecondaryCaptureImageStorage
+    meta.MediaStorageSOPInstanceUID = generate_uid()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+
+    ds = Dataset()
+    ds.file_meta = meta
+    ds.SOPClassUID = meta.MediaStorageSOPClassUID
+    ds.SOPInstanceUID = meta.MediaStorageSOPInstanceUID
+    ds.NumberOfFrames = frames.shape[0]
+    ds.Rows, ds.Columns = frames.shape[1:]
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated = ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 0
+    ds.PixelData = frames.astype("<u2").tobytes()
+    ds.save_as(path, enforce_file_format=True)
+    return path
+
+
+@pytest.fixture
+def frames():
+    return np.arange(6 * 16 * 16, dtype=np.uint16).reshape(6, 16, 16)
+
+
+def test_frames_decode_lazily(tmp_path, frames):
+    volume = open_multiframe_dicom(write_multiframe(tmp_path / "mf.dcm", frames))
+    try:
+        assert isinstance(volume, MultiFrameDicomVolume)
+        assert volume.shape == frames.shape
+        np.testing.assert_array_equal(volume[3], frames[3])
+        np.testing.assert_array_equal(volume[:, 5, :], frames[:, 5, :])
+    finally:
+        volume.close()
+
+
+def test_unload_closes_volume_and_load_reopens_it(tmp_path, frames):
+    loader = ImageLoader(write_multiframe(tmp_path / "mf.dcm", frames))
+    loader.load()
+    volume = loader.array
+    assert isinstance(volume, MultiFrameDicomVolume)
+    window = loader.window_center, loader.window_width
+
+    loader.unload()
+    assert loader.array is None
+    assert volume._file.closed
+    assert volume._pool._shutdown
+
+    loader.load()
+    assert loader.array is not volume
+    assert (loader.window_center, loader.window_width) == window
+    np.testing.assert_array_equal(loader.array[2], frames[2])
+    loader.unload()
@@ -0,0 +1,122 @@
+"""Lazy NIfTI volumes."""
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+
+from pydcmview.image_loader import ImageLoader
+from pydcmview.lazy_array import LazyArray
+from pydcmview.nifti import NiftiHeader, NiftiVolume, open_nifti, open_nifti_gz
+
+
+def write(path, array):
+    sitk.WriteImage(sitk.GetImageFromArray(array, isVector=False), str(path))
+    return path
+
+
+@pytest.fixture
+def volume():
+    return np.random.default_rng(0).integers(-1000, 3000, size=(7, 20, 30), dtype=np.int16)
+
+
+def test_gzip_volume_matches_simpleitk(tmp_path, volume):
+    lazy = open_nifti_gz(write(tmp_path / "v.nii.gz", volume))
+    try:
+        assert isinstance(lazy, NiftiVolume)
+        assert lazy.shape == volume.shape and lazy.dtype == volume.dtype
+        np.testing.assert_array_equal(lazy[3], volume[3])
+        np.testing.assert_array_equal(lazy[-1], volume[-1])
+        np.testing.assert_array_equal(lazy[2:5, 4], volume[2:5, 4])
+        np.testing.assert_array_equal(lazy[:, :, 7], volume[:, :, 7])
+    finally:
+        lazy.reader.close()
+
+
+def test_slice_access_does_not_materialize(tmp_path, volume):
+    lazy = open_nifti_gz(write(tmp_path / "v.nii.gz", volume))
+    try:
+        lazy[4]
+        assert lazy.resident_bytes == 0
+        np.asarray(lazy)
+        assert lazy.resident_bytes == volume.nbytes
+        lazy.release()
+        assert lazy.resident_bytes == 0
+    finally:
+        lazy.reader.close()
+
+
+def test_uncompressed_3d_is_left_to_simpleitk(tmp_path, volume):
+    assert open_nifti(write(tmp_path / "v.nii", volume)) is None
+
+
+def test_loader_opens_compressed_volume_lazily(tmp_path, volume):
+    path = write(tmp_path / "v.nii.gz", volume)
+    lazy = open_nifti_gz(path)
+    lazy.reader.close()
+    header = lazy.header
+    assert header.dims == volume.shape[::-1]
+    assert header.version == 1
+
+    loader = ImageLoader(path)
+    loader.load()
+    assert isinstance(loader.array, LazyArray)
+    np.testing.assert_array_equal(loader.array[0], volume[0])
+
+
+def test_header_rejects_other_files():
+    with pytest.raises(ValueError):
+        NiftiHeader(b"\0" * 348)
+    with pytest.raises(ValueError):
+        NiftiHeader(b"\0" * 10)
+
+
+class CountingArray(LazyArray):
+    def __init__(self, data, **kwargs):
+        super().__init__(data.shape, data.dtype, **kwargs)
+        self.data = data
+        self.reads = []
+
+    def _read_leading(self, start, stop):
+        self.reads.append((start, stop))
+        return self.data[start:stop].copy()
+
+
+def test_lazy_array_reads_only_indexed_blocks():
+    data = np.arange(60).reshape(5, 3, 4)
+    lazy = CountingArray(data)
+
+    np.testing.assert_array_equal(lazy[2, 1], data[2, 1])
+    np.testing.assert_array_equal(lazy[1:3], data[1:3])
+    assert lazy.reads == [(2, 3), (1, 3)]
+    with pytest.raises(IndexError):
+        lazy[5]
+
+    # Any other access reads the volume once and keeps it
+    np.testing.assert_array_equal(lazy[::2], data[::2])
+    np.testing.assert_array_equal(lazy[:, 0], data[:, 0])
+    assert lazy.reads[2:] == [(0, 5)]
+
+
+def test_uncompressed_4d_reads_one_timepoint_at_a_time(tmp_path):
+    series = np.arange(3 * 4 * 5 * 6, dtype=np.float32).reshape(3, 4, 5, 6)
+    lazy = open_nifti(write(tmp_path / "t.nii", series))
+    try:
+        assert lazy.shape == series.shape
+        np.testing.assert_array_equal(lazy[1], series[1])
+        np.testing.assert_array_equal(lazy[2][3], series[2, 3])
+        # Timepoints stay in the block cache
+        assert lazy.resident_bytes == 2 * series[0].nbytes
+        assert lazy[1] is lazy[1]
+    finally:
+        lazy.reader.close()
+
+
+def test_block_cache_keeps_recent_blocks_within_budget():
+    data = np.zeros((6, 10, 10), dtype=np.float64)
+    lazy = CountingArray(data, block_cache_bytes=2 * data[0].nbytes)
+
+    lazy[0], lazy[1], lazy[0], lazy[2], lazy[0]
+    assert lazy.reads == [(0, 1), (1, 2), (2, 3)]
+    assert lazy.resident_bytes == 2 * data[0].nbytes
+    lazy[1]
+    assert lazy.reads[-1] == (1, 2)
@@ -0,0 +1,65 @@
+"""Memoized render pipeline stages."""
+
+from pydcmview.pipeline import STAGES, RenderPipeline, Stage
+
+
+def test_stage_keeps_its_last_output():
+    stage = Stage("window")
+    calls = []
+
+    def compute(value):
+        return lambda: calls.append(value) or value
+
+    assert stage.run("a", compute(1)) == 1
+    assert stage.run("a", compute(2)) == 1
+    assert stage.run("b", compute(3)) == 3
+    # Only the last key is kept
+    assert stage.run("a", compute(4)) == 4
+    assert calls == [1, 3, 4]
+    assert (stage.hits, stage.misses) == (1, 3) and stage.hit_rate == 0.25
+
+    stage.clear()
+    assert stage.run("a", compute(5)) == 5
+
+
+def test_unkeyed_inputs_always_rerun():
+    stage = Stage("blend")
+    stage.run(None, lambda: 1)
+
+    assert stage.run(None, lambda: 2) == 2
+    assert stage.hits == 0
+
+
+def render(pipeline, slice_index, colormap, calls):
+    """Three chained stages: each key extends the previous stage's key."""
+    key = ("volume", slice_index)
+    data = pipeline.run("extract", key, lambda: calls.append("extract") or slice_index)
+    key = (key, "window")
+    gray = pipeline.run("window", key, lambda: calls.append("window") or data * 2)
+    key = (key, colormap)
+    return pipeline.run("colormap", key, lambda: calls.append("colormap") or (gray, colormap))
+
+
+def test_a_change_reruns_its_stage_and_the_ones_after_it():
+    pipeline = RenderPipeline()
+    calls = []
+
+    render(pipeline, 1, "Gray", calls)
+    calls.clear()
+    assert render(pipeline, 1, "Hot", calls) == (2, "Hot")
+    assert calls == ["colormap"]
+
+    calls.clear()
+    assert render(pipeline, 2, "Hot", calls) == (4, "Hot")
+    assert calls == ["extract", "window", "colormap"]
+
+    assert list(pipeline.stats()) == list(STAGES)
+    assert pipeline.stats()["extract"] == (1, 2)
+    assert pipeline.summary() == "extract 33% window 33% colormap 0%"
+
+    pipeline.reset_stats()
+    assert pipeline.summary() == ""
+    pipeline.clear()
+    calls.clear()
+    render(pipeline, 2, "Hot", calls)
+    assert calls == ["extract", "window", "colormap"]
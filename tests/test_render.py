@@ -0,0 +1,108 @@
+"""Rendering helpers."""
+
+import numpy as np
+import pytest
+
+from pydcmview.render import (
+    PARALLEL_MIN_PIXELS,
+    PREVIEW_MIN_PIXELS,
+    InteractionTracker,
+    block_mean,
+    reduction_factor,
+    render_bands,
+)
+
+
+def reference_block_mean(array, factor):
+    height, width = array.shape
+    rows = [
+        [array[y : y + factor, x : x + factor].mean() for x in range(0, width, factor)]
+        for y in range(0, height, factor)
+    ]
+    return np.array(rows)
+
+
+@pytest.mark.parametrize("shape", [(8, 8), (9, 7), (1, 10), (5, 1)])
+@pytest.mark.parametrize("factor", [2, 3, 4])
+def test_block_mean_averages_partial_edge_blocks(shape, factor):
+    array = np.random.default_rng(0).random(shape).astype(np.float32)
+
+    reduced = block_mean(array, factor)
+    assert reduced.dtype == np.float32
+    np.testing.assert_allclose(reduced, reference_block_mean(array, factor), rtol=1e-5)
+
+
+def test_block_mean_rounds_integer_data():
+    array = np.array([[0, 1], [1, 1]], dtype=np.uint8)
+
+    reduced = block_mean(array, 2)
+    assert reduced.dtype == np.uint8
+    assert reduced[0, 0] == 1
+
+
+def test_block_mean_with_factor_one_returns_input():
+    array = np.zeros((3, 3))
+    assert block_mean(array, 1) is array
+
+
+@pytest.mark.parametrize(
+    "scale,factor", [(1.0, 1), (2.0, 1), (0.0, 1), (0.5, 2), (0.3, 3), (0.26, 3), (0.01, 100)]
+)
+def test_reduction_factor(scale, factor):
+    assert reduction_factor(scale) == factor
+
+
+def gray_to_rgb(band, factor):
+    """A window + colormap stage: reduce, scale to gray levels, look up colors."""
+    gray = np.clip(block_mean(band, factor) / 4, 0, 255).astype(np.uint8)
+    return np.stack([gray, 255 - gray, gray // 2], axis=-1)
+
+
+@pytest.mark.parametrize("factor", [1, 3])
+def test_render_bands_match_a_single_call(factor):
+    array = np.random.default_rng(0).integers(0, 1024, size=(1100, 1030), dtype=np.int16)
+    bands = []
+
+    def stage(band):
+        bands.append(band.shape[0])
+        return gray_to_rgb(band, factor)
+
+    rendered = render_bands(stage, array, factor, workers=4)
+
+    assert len(bands) == 4
+    # Reduction blocks never straddle two bands
+    assert all(rows % factor == 0 for rows in bands[:-1])
+    np.testing.assert_array_equal(rendered, gray_to_rgb(array, factor))
+
+
+def test_small_slices_render_in_one_call():
+    array = np.zeros((64, 64), dtype=np.int16)
+    assert array.size < PARALLEL_MIN_PIXELS
+    calls = []
+
+    render_bands(lambda band: calls.append(band.shape) or band, array, workers=4)
+
+    assert calls == [(64, 64)]
+
+
+def test_preview_step_follows_the_input_rate():
+    tracker = InteractionTracker(window=0.5)
+    large = PREVIEW_MIN_PIXELS
+
+    # 30 events per second: every 4th pixel
+    for i in range(15):
+        tracker.note(now=i / 30)
+    assert tracker.preview_step(large, now=0.5) == 4
+    # Small slices are always rendered in full
+    assert tracker.preview_step(large - 1, now=0.5) == 1
+
+    # 10 events per second over the window: every 2nd pixel
+    tracker = InteractionTracker(window=0.5)
+    for i in range(5):
+        tracker.note(now=i / 10)
+    assert tracker.preview_step(large, now=0.45) == 2
+
+    # Old events drop out of the window
+    assert tracker.preview_step(large, now=2.0) == 1
+    tracker.note(now=2.0)
+    assert tracker.rate(now=2.0) == 2.0
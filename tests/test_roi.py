@@ -0,0 +1,104 @@
+"""ROI statistics from summed-area and sparse tables."""
+
+import numpy as np
+import pytest
+
+from pydcmview.roi import (
+    ROI_SHAPES,
+    SliceIntegralCache,
+    SliceIntegrals,
+    combine_stats,
+    region_stats,
+    roi_spans,
+)
+
+
+def brute_force(data, kind, cx, cy, rx, ry):
+    """Statistics of the voxels inside the ROI, gathered one by one."""
+    rows, x0, x1 = roi_spans(data.shape, kind, cx, cy, rx, ry)
+    values = np.array(
+        [data[r, x] for r, a, b in zip(rows, x0, x1) for x in range(a, b)], dtype=np.float64
+    )
+    if values.size == 0:
+        return None
+    return values.size, values.mean(), values.std(), values.min(), values.max()
+
+
+def assert_matches(stats, expected):
+    if expected is None:
+        assert stats is None
+        return
+    count, mean, std, low, high = expected
+    assert stats.count == count
+    assert stats.mean == pytest.approx(mean, rel=1e-9, abs=1e-9)
+    assert stats.std == pytest.approx(std, rel=1e-6, abs=1e-6)
+    assert (stats.min, stats.max) == (low, high)
+
+
+@pytest.mark.parametrize("dtype", [np.int16, np.uint8, np.float32])
+@pytest.mark.parametrize("kind", ROI_SHAPES)
+def test_table_stats_match_brute_force(dtype, kind):
+    rng = np.random.default_rng(0)
+    data = (rng.normal(100, 40, size=(37, 53))).astype(dtype)
+    tables = SliceIntegrals(data)
+
+    for _ in range(200):
+        cx, cy = rng.integers(-5, 60), rng.integers(-5, 42)
+        rx, ry = rng.integers(0, 30, size=2)
+        expected = brute_force(data, kind, cx, cy, rx, ry)
+        assert_matches(tables.stats(kind, cx, cy, rx, ry), expected)
+        assert_matches(region_stats(data, kind, cx, cy, rx, ry), expected)
+
+
+def test_rectangle_spans_cover_the_clipped_box():
+    rows, x0, x1 = roi_spans((10, 20), "rectangle", 18, 1, 3, 2)
+
+    np.testing.assert_array_equal(rows, [0, 1, 2, 3])
+    assert set(x0) == {15} and set(x1) == {20}
+
+
+def test_single_column_slice():
+    data = np.arange(8, dtype=np.int32).reshape(8, 1)
+    stats = SliceIntegrals(data).stats("rectangle", 0, 4, 3, 2)
+
+    assert (stats.count, stats.min, stats.max, stats.mean) == (5, 2, 6, 4)
+
+
+def test_rescaled_stats_swap_range_for_negative_slope():
+    data = np.array([[1, 2], [3, 4]], dtype=np.int16)
+    stats = SliceIntegrals(data).stats("rectangle", 0, 0, 1, 1).rescaled(-2.0, 10.0)
+
+    assert (stats.min, stats.max) == (2.0, 8.0)
+    assert stats.mean == pytest.approx(5.0)
+    assert stats.std == pytest.approx(2 * np.std([1, 2, 3, 4]))
+
+
+def test_combine_stats_matches_pooled_voxels():
+    rng = np.random.default_rng(1)
+    volume = rng.normal(size=(4, 16, 16))
+    parts = [region_stats(plane, "ellipse", 8, 8, 5, 3) for plane in volume]
+    combined = combine_stats(parts + [None])
+
+    rows, x0, x1 = roi_spans((16, 16), "ellipse", 8, 8, 5, 3)
+    pooled = np.concatenate(
+        [plane[r, a:b] for plane in volume for r, a, b in zip(rows, x0, x1)]
+    )
+    assert combined.count == pooled.size
+    assert combined.mean == pytest.approx(pooled.mean())
+    assert combined.std == pytest.approx(pooled.std())
+    assert (combined.min, combined.max) == (pooled.min(), pooled.max())
+
+
+def test_cache_evicts_by_count_and_bytes():
+    slices = {key: np.full((64, 64), key, dtype=np.float64) for key in range(4)}
+    per_slice = SliceIntegrals(slices[0]).nbytes
+
+    cache = SliceIntegralCache(max_slices=3, max_bytes=2 * per_slice)
+    for key in range(4):
+        cache.get(key, lambda key=key: slices[key])
+    assert list(cache._tables) == [2, 3]
+
+    built = []
+    cache.get(3, lambda: built.append(3) or slices[3])
+    cache.get(0, lambda: built.append(0) or slices[0])
+    assert built == [0]
@@ -0,0 +1,88 @@
+"""Multi-volume sessions under a memory budget."""
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+
+from pydcmview.session import VolumeSession, format_size, parse_size
+
+
+@pytest.mark.parametrize(
+    "text,size",
+    [("512", 512), ("4K", 4096), ("512M", 512 * 1024**2), ("2.5G", int(2.5 * 1024**3)), ("1GiB", 1024**3), (" 3 kb ", 3072)],
+)
+def test_parse_size(text, size):
+    assert parse_size(text) == size
+
+
+@pytest.mark.parametrize("text", ["", "G", "12X", "-1M"])
+def test_parse_size_rejects_garbage(text):
+    with pytest.raises(ValueError):
+        parse_size(text)
+
+
+def test_format_size():
+    assert format_size(100) == "100 B"
+    assert format_size(1536) == "1.5 KB"
+    assert format_size(3 * 1024**4) == "3072.0 GB"
+
+
+@pytest.fixture
+def volumes(tmp_path):
+    """Three 32 KB int16 volumes."""
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"v{index}.nrrd"
+        data = (np.arange(4 * 64 * 64) % 3000 - 1000 + index).astype(np.int16)
+        sitk.WriteImage(sitk.GetImageFromArray(data.reshape(4, 64, 64)), str(path))
+        paths.append(path)
+    return paths
+
+
+def test_least_recently_viewed_volumes_are_evicted(volumes):
+    session = VolumeSession(volumes, memory_budget=80 * 1024)
+    session.activate(0)
+    session.activate(1)
+    assert [e.is_loaded for e in session.entries] == [True, True, False]
+
+    session.activate(2)
+    assert [e.is_loaded for e in session.entries] == [False, True, True]
+    assert session.resident_bytes <= session.memory_budget
+
+    session.activate(1)
+    session.activate(0)
+    assert [e.is_loaded for e in session.entries] == [True, True, False]
+
+
+def test_current_volume_is_kept_over_budget(volumes):
+    session = VolumeSession(volumes, memory_budget=1)
+    entry = session.activate(1)
+
+    assert entry.is_loaded and session.current is entry
+    assert not any(e.is_loaded for e in session.entries if e is not entry)
+
+
+def test_evicted_volume_keeps_its_statistics(volumes):
+    session = VolumeSession(volumes, memory_budget=1)
+    first = session.activate(0)
+    window = first.loader.window_center, first.loader.window_width
+    histogram = first.loader.get_histogram()
+
+    session.activate(1)
+    assert first.loader.array is None
+    assert (first.loader.window_center, first.loader.window_width) == window
+
+    session.activate(0)
+    assert first.loader.get_histogram() is histogram
+    assert first.loader.array.min() == -1000
+
+
+def test_activate_wraps_around(volumes):
+    session = VolumeSession(volumes)
+    assert session.activate(-1) is session.entries[2]
+    assert session.current_index == 2
+
+
+def test_empty_session_is_rejected():
+    with pytest.raises(ValueError):
+        VolumeSession([])
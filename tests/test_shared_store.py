@@ -0,0 +1,133 @@
+"""Volumes shared between viewer processes."""
+
+import os
+import subprocess
+import sys
+import textwrap
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+
+from pydcmview.image_loader import ImageLoader
+from pydcmview.shared_store import SharedVolume, encode_metadata, volume_key
+
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def run_attached(code, *args):
+    """Run ``code`` in another viewer process and return its output."""
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code), *map(str, args)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+@pytest.fixture
+def name():
+    return "pdv_test_" + uuid.uuid4().hex[:12]
+
+
+@pytest.fixture
+def volume():
+    return np.random.default_rng(0).integers(-1000, 3000, size=(5, 16, 24), dtype=np.int16)
+
+
+def test_attach_sees_the_published_volume(name, volume):
+    published = SharedVolume.publish(name, volume, {"window_center": 40.0})
+    try:
+        output = run_attached(
+            """
+            import sys
+            from pydcmview.shared_store import SharedVolume
+
+            attached = SharedVolume.attach(sys.argv[1])
+            print(attached.owner, attached.array.flags.writeable)
+            print(attached.metadata["window_center"], int(attached.array.sum()))
+            view = attached.array[2]
+            print(view._segment is attached.segment, (view + 1)._segment, view.copy()._segment)
+            attached.close()
+            """,
+            name,
+        )
+    finally:
+        published.close()
+
+    assert output == ["False", "False", "40.0", str(int(volume.sum())), "True", "None", "None"]
+
+
+def test_publish_once_per_name(name, volume):
+    published = SharedVolume.publish(name, volume, {})
+    try:
+        assert SharedVolume.publish(name, volume, {}) is None
+    finally:
+        published.close()
+
+    # The publisher unlinks the segment for future viewers
+    assert SharedVolume.attach(name) is None
+
+
+def test_oversized_header_is_not_published(name, volume):
+    assert SharedVolume.publish(name, volume, {"notes": "x" * 5000}) is None
+    assert SharedVolume.attach(name) is None
+
+
+def test_volume_key_follows_file_changes(tmp_path):
+    path = tmp_path / "a.nii"
+    path.write_bytes(b"first")
+    key = volume_key([path])
+    assert key == volume_key([path]) and len(key) <= 31
+
+    path.write_bytes(b"second version")
+
+    assert volume_key([path]) != key
+
+
+def test_encode_metadata_is_json_friendly():
+    encoded = encode_metadata((np.float32(1.5), np.eye(2), [np.int16(3)]))
+
+    assert encoded == [1.5, [[1.0, 0.0], [0.0, 1.0]], [3]]
+
+
+def test_second_loader_attaches(tmp_path, volume):
+    path = tmp_path / "v.nii"
+    image = sitk.GetImageFromArray(volume)
+    image.SetSpacing((0.5, 0.7, 2.0))
+    sitk.WriteImage(image, str(path))
+
+    first = ImageLoader(path, share=True)
+    first.load()
+    try:
+        assert first._shared is not None and first._shared.owner
+        output = run_attached(
+            """
+            import sys
+            from pydcmview.image_loader import ImageLoader
+
+            loader = ImageLoader(sys.argv[1], share=True)
+            loader.load()
+            print(loader._shared is not None and not loader._shared.owner)
+            print(int(loader.array.sum()), *loader.spacing)
+            print(loader.window_center, loader.window_width)
+            loader.unload()
+            """,
+            path,
+        )
+    finally:
+        first.unload()
+
+    assert output == [
+        "True",
+        str(int(volume.sum())),
+        *map(str, first.spacing),
+        str(first.window_center),
+        str(first.window_width),
+    ]
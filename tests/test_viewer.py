@@ -0,0 +1,271 @@
+"""Headless viewer rendering."""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+
+from pydcmview import viewer
+from pydcmview.render import REFINE_DELAY
+from pydcmview.roi import region_stats
+from pydcmview.viewer import ImageViewer
+
+# Terminal size the viewer runs in (columns, rows)
+TERMINAL_SIZE = (160, 50)
+
+
+def write(path, array, spacing=None):
+    image = sitk.GetImageFromArray(array)
+    if spacing is not None:
+        image.SetSpacing(spacing)
+    sitk.WriteImage(image, str(path))
+    return path
+
+
+def run_viewer(paths, check, **kwargs):
+    """Run ``check(app)`` inside a headless viewer once it has drawn its first frame."""
+
+    async def run():
+        app = ImageViewer(list(paths), **kwargs)
+        async with app.run_test(size=TERMINAL_SIZE) as pilot:
+            await pilot.pause()
+            await check(app, pilot)
+
+    asyncio.run(run())
+
+
+@pytest.fixture
+def large_slice(tmp_path):
+    rng = np.random.default_rng(0)
+    return write(tmp_path / "large.nrrd", rng.integers(0, 1000, (1, 2048, 2048), dtype=np.int16))
+
+
+def test_large_slice_is_rendered_at_viewport_resolution(large_slice):
+    async def check(app, pilot):
+        viewport_width, viewport_height = app._get_viewport_pixels()
+        _, image = app._render_single()
+
+        assert max(app._render_scale) < 1
+        assert image.width <= viewport_width and image.height <= viewport_height
+        # Fits the viewport along its tighter axis
+        assert max(image.width / viewport_width, image.height / viewport_height) > 0.9
+
+    run_viewer([large_slice], check)
+
+
+def test_rapid_input_previews_then_refines(large_slice):
+    async def check(app, pilot):
+        full = app._render_single()[1]
+        for _ in range(30):
+            app._interaction.note()
+
+        _, preview = app._render_single(interactive=True)
+
+        assert app._refine_timer is not None
+        # The preview is shown at the same size, from fewer pixels
+        assert preview.size == full.size
+        assert not np.array_equal(np.asarray(preview), np.asarray(full))
+
+        await pilot.pause(REFINE_DELAY * 3)
+        assert app._refine_timer is None
+
+    run_viewer([large_slice], check)
+
+
+def test_image_smaller_than_a_cell_is_enlarged(tmp_path):
+    path = write(tmp_path / "tiny.nrrd", np.arange(12, dtype=np.int16).reshape(3, 2, 2))
+
+    async def check(app, pilot):
+        _, rendered = app._render_single()
+        shown = app.query_one("#image_display").image
+        repeat = shown.width // rendered.width
+        assert repeat > 1
+        assert shown.size == (rendered.width * repeat, rendered.height * repeat)
+
+    run_viewer([path], check)
+
+
+@pytest.fixture
+def ct_volume(tmp_path):
+    rng = np.random.default_rng(1)
+    volume = rng.normal(0, 300, size=(12, 96, 128)).astype(np.int16)
+    return write(tmp_path / "ct.nrrd", volume, spacing=(0.8, 0.8, 2.0))
+
+
+def test_equalization_and_percentile_window_keys(ct_volume):
+    async def check(app, pilot):
+        linear = np.asarray(app._render_single()[1])
+
+        await pilot.press("e")
+        assert app.display_mode == "equalized"
+        equalized = np.asarray(app._render_single()[1])
+        assert not np.array_equal(linear, equalized)
+        # Equalized levels use the whole gray range
+        assert equalized.min() == 0 and equalized.max() == 255
+
+        await pilot.press("p")
+        histogram = app.loader.get_histogram()
+        assert app.display_mode == "linear"
+        assert (app.window_center, app.window_width) == histogram.percentile_window(1.0, 99.0)
+
+    run_viewer([ct_volume], check)
+
+
+def test_switching_volumes_restores_each_view(tmp_path, ct_volume):
+    other = write(tmp_path / "other.nrrd", np.zeros((5, 32, 32), dtype=np.int16))
+
+    async def check(app, pilot):
+        await pilot.press("down", "down", "down")
+        app.window_center, app.window_width = 40.0, 400.0
+
+        await pilot.press("n")
+        assert app.image_path == other and app.shape == (5, 32, 32)
+        assert app.current_slice == 0
+        await pilot.press("down")
+
+        await pilot.press("n")
+        assert app.image_path == ct_volume
+        assert app.current_slice == 3
+        assert (app.window_center, app.window_width) == (40.0, 400.0)
+
+        await pilot.press("N")
+        assert app.image_path == other and app.current_slice == 1
+
+    run_viewer([ct_volume, other], check)
+
+
+def test_anisotropic_planes_keep_physical_proportions(ct_volume):
+    async def check(app, pilot):
+        # The default (y, x) plane has square pixels
+        assert {app.display_x, app.display_y} == {1, 2}
+        assert app._pixel_aspect() == (1.0, 1.0)
+
+        # A (z, y) plane: 2 mm rows against 0.8 mm columns
+        app.display_x, app.display_y = 0, 1
+        app._assign_slice_axes()
+        app._update_display()
+        assert app._pixel_aspect() == pytest.approx((1.0, 2.5))
+
+        _, image = app._render_single()
+        scale_x, scale_y = app._render_scale
+        assert scale_y / scale_x == pytest.approx(2.5, rel=0.05)
+        assert image.height / image.width == pytest.approx(12 * 2.5 / 96, rel=0.05)
+        # The volume itself is never resampled
+        assert app.loader.array.shape == (12, 96, 128)
+
+    run_viewer([ct_volume], check)
+
+
+def test_mpr_layout_renders_only_changed_planes(ct_volume):
+    async def check(app, pilot):
+        await pilot.press("m")
+        assert app.mpr is not None and app.mpr.rendered == 3
+        assert app.mpr.active == app.slice_axis
+
+        await pilot.press("down")
+        assert app.mpr.rendered == 1
+        assert "Rendered: 1/3" in str(app.query_one("#status").render())
+
+        await pilot.press("m")
+        assert app.mpr is None and app.current_slice == 1
+
+    run_viewer([ct_volume], check)
+
+
+def test_mpr_is_refused_for_lazily_read_volumes(tmp_path):
+    path = write(tmp_path / "v.nii.gz", np.zeros((12, 48, 64), dtype=np.int16))
+
+    async def check(app, pilot):
+        lazy = app.loader.array
+        await pilot.press("m")
+
+        assert app.mpr is None and lazy._full is None
+        assert "not available" in str(app.query_one("#status").render())
+
+    run_viewer([path], check)
+
+
+def test_extra_axes_step_through_timepoints_lazily(tmp_path):
+    series = np.zeros((5, 4, 32, 40), dtype=np.int16)
+    series += np.arange(5, dtype=np.int16)[:, None, None, None] * 100
+    path = tmp_path / "fmri.nii"
+    sitk.WriteImage(sitk.GetImageFromArray(series, isVector=False), str(path))
+
+    async def check(app, pilot):
+        assert {app.display_x, app.display_y} == {2, 3} and app.slice_axis == 1
+        assert app.extra_indices == {0: 0}
+        # Only the timepoint shown and the middle one (for the window) are read
+        lazy = app.loader.array
+        assert set(lazy._blocks) == {0, 2} and lazy._full is None
+
+        await pilot.press("full_stop", "full_stop", "full_stop")
+        assert app.extra_indices == {0: 3}
+        assert app._get_slice(app.current_slice).max() == 300
+        assert set(lazy._blocks) == {0, 1, 2, 3} and lazy._full is None
+
+        await pilot.press("comma", "comma", "comma")
+        assert app.extra_indices == {0: 0}
+        await pilot.press("down")
+        assert app.current_slice == 1 and app.extra_indices == {0: 0}
+
+    run_viewer([path], check)
+
+
+def test_state_changes_rerun_only_the_stages_that_read_them(ct_volume):
+    async def check(app, pilot):
+        def rerun(change):
+            app.pipeline.reset_stats()
+            change()
+            app._update_display()
+            return [name for name, (_, misses) in app.pipeline.stats().items() if misses]
+
+        assert rerun(lambda: None) == []
+        assert rerun(lambda: setattr(app, "current_colormap", "Hot")) == [
+            "colormap", "zoom", "encode"
+        ]
+        assert rerun(lambda: setattr(app, "zoom_level", 4.0)) == ["zoom", "encode"]
+        assert rerun(lambda: setattr(app, "scroll_x", 40)) == ["zoom", "encode"]
+        app.mode = "crosshair"
+        assert rerun(lambda: setattr(app, "crosshair_x", 30)) == ["overlay", "encode"]
+        app.mode = "normal"
+        assert rerun(lambda: setattr(app, "window_width", 500.0)) == [
+            "window", "colormap", "zoom", "encode"
+        ]
+        assert rerun(lambda: app.dim_flipped.add(app.display_x)) == [
+            "orient", "window", "colormap", "zoom", "encode"
+        ]
+        assert rerun(lambda: setattr(app, "current_slice", 5))[0] == "extract"
+
+    run_viewer([ct_volume], check)
+
+
+def test_switching_volume_during_the_all_slice_roi_run(tmp_path, monkeypatch):
+    tall = write(tmp_path / "tall.nrrd", np.ones((60, 32, 32), dtype=np.int16))
+    short = write(tmp_path / "short.nrrd", np.zeros((4, 32, 32), dtype=np.int16))
+    started = threading.Event()
+    planes = []
+
+    def slow_region_stats(plane, *geometry):
+        planes.append(plane.shape)
+        started.set()
+        time.sleep(0.05)
+        return region_stats(plane, *geometry)
+
+    monkeypatch.setattr(viewer, "region_stats", slow_region_stats)
+
+    async def check(app, pilot):
+        await pilot.press("h", "r", "R")
+        assert await asyncio.to_thread(started.wait, 5)
+
+        # Would fail with an IndexError if the worker sliced the new volume
+        await pilot.press("escape", "n")
+        assert app.shape == (4, 32, 32)
+        await app.workers.wait_for_complete()
+        # Cancelled part way, and nothing stored for either volume
+        assert len(planes) < 60
+        assert app.roi_volume_stats[0][0] == 0 and app.roi_volume_stats[1] is None
+
+    run_viewer([tall, short], check)
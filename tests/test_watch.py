@@ -0,0 +1,163 @@
+"""Watch mode: detecting rewritten files and reloading what changed."""
+
+import asyncio
+import os
+
+import numpy as np
+import pytest
+import SimpleITK as sitk
+
+from dicom_files import write_instance, write_series
+from pydcmview.dicom_index import DicomIndex
+from pydcmview.session import VolumeSession
+from pydcmview.viewer import ImageViewer
+from pydcmview.watch import FileWatcher
+
+
+def rewrite(path, content, mtime):
+    """Write ``content`` with a distinct modification time (coarse filesystem clocks)."""
+    path.write_bytes(content)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def write_volume(path, array, mtime=None):
+    sitk.WriteImage(sitk.GetImageFromArray(array), str(path))
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+    return path
+
+
+def test_changes_are_reported_once_settled(tmp_path):
+    first, second = tmp_path / "a", tmp_path / "b"
+    rewrite(first, b"one", 10**9)
+    rewrite(second, b"two", 10**9)
+    watcher = FileWatcher([first, second])
+    assert watcher.poll() == []
+
+    rewrite(second, b"two, partly written", 2 * 10**9)
+    assert watcher.poll() == []
+    # Still being written: the signature moved on again
+    rewrite(second, b"two, fully written", 3 * 10**9)
+    assert watcher.poll() == []
+    assert watcher.poll() == [1]
+    assert watcher.poll() == []
+
+
+def test_change_reverted_before_settling_is_ignored(tmp_path):
+    path = tmp_path / "a"
+    rewrite(path, b"one", 10**9)
+    watcher = FileWatcher([path])
+
+    rewrite(path, b"temp", 2 * 10**9)
+    assert watcher.poll() == []
+    rewrite(path, b"one", 10**9)
+    assert watcher.poll() == []
+    assert watcher.poll() == []
+
+
+def test_deleted_and_recreated_files(tmp_path):
+    path = tmp_path / "a"
+    rewrite(path, b"one", 10**9)
+    watcher = FileWatcher([path])
+
+    path.unlink()
+    watcher.poll()
+    assert watcher.poll() == [0]
+
+    rewrite(path, b"back", 2 * 10**9)
+    watcher.poll()
+    assert watcher.poll() == [0]
+
+
+@pytest.fixture
+def series(tmp_path):
+    volume = np.arange(4 * 8 * 8, dtype=np.int16).reshape(4, 8, 8) - 100
+    write_series(tmp_path / "series", volume, "1.5", intercept=-1024)
+    index = DicomIndex(tmp_path / "index.sqlite")
+    try:
+        (found,) = index.scan(tmp_path / "series")
+    finally:
+        index.close()
+    return found, volume
+
+
+def settle(session):
+    """Poll until the rewritten files have settled."""
+    assert session.changed_entries() == []
+    return session.changed_entries()
+
+
+def test_changed_instances_are_reloaded_in_place(series):
+    found, volume = series
+    session = VolumeSession([found], watch=True)
+    entry = session.activate(0)
+    array = entry.loader.array
+    np.testing.assert_array_equal(array, volume - 1024)
+
+    changed = np.full((8, 8), 500, dtype=np.int16)
+    path = found.files[2]
+    write_instance(path, changed, "1.5", position=2, instance_number=3, intercept=-1024)
+    os.utime(path, ns=(10**9, 10**9))
+
+    ((reloaded, positions),) = settle(session)
+    assert reloaded is entry and positions == [2]
+    slices = session.reload(entry, positions)
+    # Read only: the volume changes when the slices are applied
+    assert list(slices) == [2]
+    np.testing.assert_array_equal(array, volume - 1024)
+
+    session.apply_reload(entry, slices)
+    assert entry.loader.array is array
+    np.testing.assert_array_equal(array[2], changed - 1024)
+    np.testing.assert_array_equal(array[[0, 1, 3]], volume[[0, 1, 3]] - 1024)
+
+
+def test_instance_that_no_longer_fits_needs_a_full_reload(series):
+    found, _ = series
+    session = VolumeSession([found], watch=True)
+    entry = session.activate(0)
+
+    # Real values beyond what the volume's stored dtype holds
+    path = found.files[1]
+    write_instance(
+        path, np.full((8, 8), 32000), "1.5", position=1, instance_number=2, intercept=2000
+    )
+    os.utime(path, ns=(10**9, 10**9))
+    ((_, positions),) = settle(session)
+
+    loader = session.reload(entry, positions)
+
+    assert loader is not None and loader.array.max() == 34000
+    previous = entry.loader
+    session.apply_reload(entry, loader)
+    assert entry.loader is loader and previous.array is None
+
+
+def test_viewer_keeps_its_view_across_reloads(tmp_path):
+    path = write_volume(tmp_path / "v.nrrd", np.zeros((6, 32, 40), dtype=np.int16))
+
+    async def run():
+        app = ImageViewer([path], watch=True)
+        async with app.run_test(size=(160, 50)) as pilot:
+            await pilot.pause()
+            await pilot.press("down", "down", "down", "down")
+            app.window_center, app.window_width = 10.0, 300.0
+            app.zoom_level = 2.0
+            session = app.session
+
+            # Same shape: everything kept
+            write_volume(path, np.ones((6, 32, 40), dtype=np.int16), mtime=10**9)
+            ((entry, positions),) = settle(session)
+            app._show_reload(entry, session.reload(entry, positions), len(positions), None)
+            assert app.current_slice == 4 and app.zoom_level == 2.0
+            assert (app.window_center, app.window_width) == (10.0, 300.0)
+            assert app.array[0, 0, 0] == 1 and app._reload_note == "reloaded 1 file"
+
+            # Fewer slices: the slice is clamped, the window kept
+            write_volume(path, np.ones((3, 32, 40), dtype=np.int16), mtime=2 * 10**9)
+            ((entry, positions),) = settle(session)
+            app._show_reload(entry, session.reload(entry, positions), len(positions), None)
+            assert app.shape == (3, 32, 40) and app.current_slice == 2
+            assert (app.window_center, app.window_width) == (10.0, 300.0)
+
+    asyncio.run(run())